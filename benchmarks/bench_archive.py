@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark do arquivamento comprimido: espaço em disco e latência de leitura de blocos
+antigos (fora dos caches) com MappedBlockStore x ArchivedBlockStore (zlib e lzma).
+
+A leitura "fria" reabre o store e lê um bloco de cada segmento, então cada leitura
+descomprime um segmento. O cache de páginas do sistema operacional não é descartado.
+
+Uso:
+    python benchmarks/bench_archive.py [número de blocos]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.archive_storage import ArchivedBlockStore
+from src.block import Block
+from src.mmap_storage import MappedBlockStore
+from src.transaction import Transaction
+
+TRANSACTIONS_PER_BLOCK = 50
+SEGMENT_SIZE = 1000
+READS = 50
+
+
+def build_blocks(total):
+    """Gera `total` blocos (sem minerar) com transações entre 1000 endereços."""
+    start = datetime(2024, 1, 1)
+    previous_hash = "0" * 64
+    for index in range(total):
+        timestamp = start + timedelta(seconds=10 * index)
+        transactions = [
+            Transaction(f"Usuario{(index * 7 + i) % 1000}", f"Usuario{(index + i) % 1000}",
+                        round(random.uniform(0.01, 100), 2), timestamp)
+            for i in range(TRANSACTIONS_PER_BLOCK)
+        ]
+        block = Block(index, transactions, previous_hash, timestamp)
+        previous_hash = block.hash
+        yield block
+
+
+def disk_size(path):
+    """Soma o tamanho do arquivo principal e do arquivo de segmentos."""
+    return sum(os.path.getsize(name) for name in (path, path + '.archive') if os.path.exists(name))
+
+
+def cold_reads(open_store, total):
+    """Retorna a latência média (ms) de ler blocos antigos logo após abrir o store."""
+    heights = random.sample(range(0, total - 2 * SEGMENT_SIZE), READS)
+    elapsed = 0.0
+    for height in heights:
+        store = open_store()
+        start = time.perf_counter()
+        store[height]
+        elapsed += time.perf_counter() - start
+        store.close()
+    return elapsed / READS * 1000
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    random.seed(42)
+    blocks = list(build_blocks(total))
+    print(f"{total:,} blocos com {TRANSACTIONS_PER_BLOCK} transações, segmentos de {SEGMENT_SIZE}")
+    print(f"{'armazenamento':>14} {'MiB':>8} {'redução':>8} {'leitura fria (ms)':>18}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        configurations = [
+            ('mmap', lambda path: MappedBlockStore(path, fsync_policy='never')),
+            ('zlib', lambda path: ArchivedBlockStore(path, fsync_policy='never', compression='zlib',
+                                                     segment_size=SEGMENT_SIZE, hot_blocks=SEGMENT_SIZE)),
+            ('lzma', lambda path: ArchivedBlockStore(path, fsync_policy='never', compression='lzma',
+                                                     segment_size=SEGMENT_SIZE, hot_blocks=SEGMENT_SIZE)),
+        ]
+        baseline = None
+        for name, open_store in configurations:
+            path = os.path.join(directory, f"{name}.dat")
+            store = open_store(path)
+            for block in blocks:
+                store.append(block)
+            store.close()
+            
+            size = disk_size(path)
+            baseline = baseline or size
+            latency = cold_reads(lambda: open_store(path), total)
+            print(f"{name:>14} {size / 2**20:>8.1f} {1 - size / baseline:>8.0%} {latency:>18.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memória: transações compactas (__slots__, timestamp em µs e endereços
+internados) x a representação anterior (objeto com __dict__ e datetime).
+
+Uso:
+    python benchmarks/bench_memory.py [número de transações]
+"""
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.block import Block
+from src.transaction import Transaction
+
+TRANSACTIONS_PER_BLOCK = 1000
+ADDRESSES = 1000
+
+
+class DictTransaction:
+    """Representação anterior: atributos em __dict__, datetime completo e endereços não internados."""
+    
+    def __init__(self, sender, recipient, amount, timestamp):
+        self.sender = sender
+        self.recipient = recipient
+        self.amount = amount
+        self.timestamp = timestamp
+
+
+def address(i):
+    """Gera o endereço como uma string nova (como se viesse de um JSON)."""
+    return ''.join(['Usuario', str(i % ADDRESSES)])
+
+
+def build_chain(transaction_class, total):
+    """Monta blocos com `total` transações e retorna a lista de listas de transações."""
+    start = datetime(2024, 1, 1)
+    blocks = []
+    for first in range(0, total, TRANSACTIONS_PER_BLOCK):
+        blocks.append([
+            transaction_class(address(i), address(i * 7), i + 0.5, start + timedelta(microseconds=i))
+            for i in range(first, min(first + TRANSACTIONS_PER_BLOCK, total))
+        ])
+    return blocks
+
+
+def measure(transaction_class, total):
+    """Retorna os bytes alocados para manter a chain em memória."""
+    tracemalloc.start()
+    chain = build_chain(transaction_class, total)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del chain
+    return current
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{total:,} transações em blocos de {TRANSACTIONS_PER_BLOCK}")
+    before = measure(DictTransaction, total)
+    after = measure(Transaction, total)
+    print(f"{'representação':>14} {'MiB':>10} {'bytes/tx':>10}")
+    print(f"{'anterior':>14} {before / 2**20:>10.1f} {before / total:>10.0f}")
+    print(f"{'compacta':>14} {after / 2**20:>10.1f} {after / total:>10.0f}")
+    print(f"Redução: {1 - after / before:.0%}")
+    
+    block = Block(1, [Transaction("Alice", "Bob", 1.0)], "0" * 64)
+    print(f"Block usa __slots__: {not hasattr(block, '__dict__')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark do log durável do mempool: transações por segundo e por fsync
+com vários clientes enviando transações ao mesmo tempo (group commit).
+
+Uso:
+    python benchmarks/bench_mempool.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.blockchain import Blockchain
+from src.mempool_log import MempoolLog
+from src.transaction import Transaction
+
+CLIENTS = [1, 4, 16, 64]
+TRANSACTIONS = 2000
+
+
+def run(clients, directory):
+    """Envia TRANSACTIONS transações divididas entre `clients` threads; retorna (segundos, fsyncs)."""
+    log = MempoolLog(os.path.join(directory, f"mempool-{clients}.log"))
+    blockchain = Blockchain(mempool_log=log)
+    per_client = TRANSACTIONS // clients
+    
+    def submit(client):
+        for i in range(per_client):
+            blockchain.add_transaction(Transaction(f"Usuario{client}", "Bob", float(i)))
+    
+    threads = [threading.Thread(target=submit, args=(client,)) for client in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    log.close()
+    return elapsed, log.sync_count
+
+
+def main():
+    print(f"{'clientes':>8} {'tx/s':>10} {'fsyncs':>8} {'tx/fsync':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for clients in CLIENTS:
+            elapsed, syncs = run(clients, directory)
+            total = TRANSACTIONS // clients * clients
+            print(f"{clients:>8} {total / elapsed:>10,.0f} {syncs:>8} {total / syncs:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
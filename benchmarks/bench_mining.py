@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos motores de mineração: hashlib (escalar) x NumPy (lotes vetorizados).
+
+Uso:
+    python benchmarks/bench_mining.py
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.batch_sha256 import NUMPY_AVAILABLE, search_nonce_batched
+from src.block import Block
+from src.transaction import Transaction
+
+BLOCK_SIZES = [1, 100, 2000]
+DIFFICULTIES = [12, 16, 18]
+ENGINES = ['hashlib', 'numpy']
+
+
+def build_block(size):
+    """Cria um bloco com `size` transações e timestamp fixo."""
+    timestamp = datetime(2024, 1, 1, 12, 0, 0)
+    transactions = [Transaction(f"Usuario{i}", "Bob", float(i), timestamp) for i in range(size)]
+    return Block(1, transactions, "0" * 64, timestamp)
+
+
+def run(engine, block, difficulty):
+    """Minera o bloco e retorna (segundos, tentativas)."""
+    prefix = block._hash_prefix()
+    start = time.perf_counter()
+    if engine == 'numpy':
+        _, _, attempts = search_nonce_batched(prefix, difficulty)
+    else:
+        _, _, attempts = block._search_nonce(difficulty)
+    return time.perf_counter() - start, attempts
+
+
+def main():
+    print(f"NumPy disponível: {NUMPY_AVAILABLE}")
+    print(f"{'transações':>10} {'dificuldade':>11} {'motor':>8} {'tentativas':>10} {'tempo (s)':>10} {'H/s':>12}")
+    for size in BLOCK_SIZES:
+        block = build_block(size)
+        for difficulty in DIFFICULTIES:
+            for engine in ENGINES:
+                elapsed, attempts = run(engine, block, difficulty)
+                print(f"{size:>10} {difficulty:>11} {engine:>8} {attempts:>10} "
+                      f"{elapsed:>10.3f} {attempts / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
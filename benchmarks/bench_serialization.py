@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark da serialização de blocos: JSON (to_dict/from_dict) x binário (to_bytes/from_bytes).
+
+Uso:
+    python benchmarks/bench_serialization.py
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.block import Block
+from src.transaction import Transaction
+
+BLOCK_SIZES = [1, 100, 2000]
+ROUNDS = 20
+
+
+def build_block(size):
+    """Cria um bloco com `size` transações e timestamp fixo."""
+    timestamp = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    transactions = [Transaction(f"Usuario{i}", "Bob", i + 0.25, timestamp) for i in range(size)]
+    return Block(1, transactions, "0" * 64, timestamp)
+
+
+def encode_json(block):
+    return json.dumps(block.to_dict(), separators=(',', ':')).encode('utf-8')
+
+
+def decode_json(data):
+    return Block.from_dict(json.loads(data))
+
+
+def measure(function, argument):
+    """Retorna o tempo médio (s) de `function(argument)` em ROUNDS execuções."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(argument)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main():
+    formats = [('json', encode_json, decode_json), ('binary', Block.to_bytes, Block.from_bytes)]
+    print(f"{'transações':>10} {'formato':>8} {'bytes':>10} {'encode (ms)':>12} {'decode (ms)':>12} "
+          f"{'tx/s encode':>12} {'tx/s decode':>12}")
+    for size in BLOCK_SIZES:
+        block = build_block(size)
+        for name, encode, decode in formats:
+            data = encode(block)
+            encode_time = measure(encode, block)
+            decode_time = measure(decode, data)
+            print(f"{size:>10} {name:>8} {len(data):>10,} {encode_time * 1000:>12.3f} "
+                  f"{decode_time * 1000:>12.3f} {size / encode_time:>12,.0f} {size / decode_time:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark das transações assinadas: entrada no mempool e validação de um bloco,
+com e sem o cache de assinaturas verificadas, e com vários processos.
+
+Uso:
+    python benchmarks/bench_signatures.py [transações]
+"""
+import os
+import sys
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.blockchain import Blockchain
+from src.signatures import KeyPair
+from src.transaction import Transaction
+
+WORKERS = [1, 2, 4, os.cpu_count() or 1]
+
+
+def signed_transactions(count):
+    """Gera `count` transações assinadas por algumas carteiras."""
+    wallets = [KeyPair.generate() for _ in range(8)]
+    transactions = []
+    for i in range(count):
+        wallet = wallets[i % len(wallets)]
+        transaction = Transaction(wallet.address, f"Usuario{i}", 1)
+        transaction.sign(wallet)
+        transactions.append(transaction)
+    return transactions
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{count:,} transações assinadas (Ed25519, {os.cpu_count()} CPUs)")
+    
+    transactions = signed_transactions(count)
+    blockchain = Blockchain(difficulty=1, retarget_interval=0, require_signatures=True)
+    elapsed = timed(lambda: [blockchain.add_transaction(tx) for tx in transactions])
+    print(f"{'entrada no mempool':<32} {elapsed:>8.2f} s {count / elapsed:>10,.0f} tx/s")
+    
+    block = blockchain.prepare_block("Minerador")
+    block.mine_block(blockchain.get_difficulty_for_height(block.index))
+    elapsed = timed(lambda: blockchain._signature_error(block))
+    print(f"{'bloco, com cache':<32} {elapsed:>8.2f} s {count / elapsed:>10,.0f} tx/s")
+    
+    cache = blockchain._verified_transactions
+    for workers in sorted(set(WORKERS)):
+        # A verificação guarda os ids no cache; cada rodada começa sem ele
+        blockchain._verified_transactions = OrderedDict()
+        blockchain.signature_workers = workers
+        elapsed = timed(lambda: blockchain._signature_error(block))
+        label = f"bloco, sem cache ({workers} workers)"
+        print(f"{label:<32} {elapsed:>8.2f} s {count / elapsed:>10,.0f} tx/s")
+    blockchain._verified_transactions = cache
+
+
+if __name__ == '__main__':
+    main()
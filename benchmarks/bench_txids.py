@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark do índice de ids de transações: memória do dicionário id -> (altura, posição)
+x filtro de Bloom, e tempo para rejeitar um replay e localizar uma transação.
+
+Uso:
+    python benchmarks/bench_txids.py [número de transações]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bloom import BloomFilter
+from src.blockchain import Blockchain
+from src.transaction import Transaction
+
+TRANSACTIONS_PER_BLOCK = 1000
+LOOKUPS = 2000
+SCAN_LOOKUPS = 20  # Com o filtro de Bloom, localizar percorre a chain
+
+
+def build_chain(total, **options):
+    """Minera blocos com `total` transações (dificuldade mínima)."""
+    blockchain = Blockchain(difficulty=1, retarget_interval=0, **options)
+    start = datetime(2024, 1, 1)
+    for first in range(0, total, TRANSACTIONS_PER_BLOCK):
+        blockchain.pending_transactions = [
+            Transaction(f"Usuario{i % 1000}", f"Usuario{i * 7 % 1000}", 1, start + timedelta(microseconds=i))
+            for i in range(first, min(first + TRANSACTIONS_PER_BLOCK, total))
+        ]
+        blockchain.mine_pending_transactions("Minerador")
+    return blockchain
+
+
+def index_memory(total, bloom):
+    """Mede a memória do índice de ids, montado com os mesmos ids da chain."""
+    ids = [f"{i:064x}" for i in range(total)]
+    tracemalloc.start()
+    if bloom:
+        index = BloomFilter(total)
+        for txid in ids:
+            index.add(txid)
+    else:
+        index = {}
+        for position, txid in enumerate(ids):
+            index[txid] = (position // TRANSACTIONS_PER_BLOCK, position % TRANSACTIONS_PER_BLOCK)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def microseconds(function, items):
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{total:,} transações na chain")
+    print(f"{'índice':<10} {'memória (MiB)':>14} {'replay (µs)':>12} {'localizar (µs)':>15}")
+    
+    for name, options in (('dict', {}), ('bloom', {'txid_bloom_capacity': total})):
+        blockchain = build_chain(total, **options)
+        mined = [tx for block in blockchain.chain[1:] for tx in block.transactions][::total // LOOKUPS or 1]
+        replays = [Transaction.from_dict(tx.to_dict()) for tx in mined]
+        
+        def reject(transaction):
+            try:
+                blockchain.add_transaction(transaction)
+            except ValueError:
+                return
+            raise AssertionError("replay aceito")
+        
+        replay_time = microseconds(reject, replays)
+        txids = [tx.txid for tx in mined]
+        if name == 'bloom':
+            txids = txids[::len(txids) // SCAN_LOOKUPS or 1]
+        locate_time = microseconds(blockchain.get_transaction, txids)
+        memory = index_memory(total, bloom=name == 'bloom') / 2 ** 20
+        print(f"{name:<10} {memory:>14.2f} {replay_time:>12.1f} {locate_time:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark da validação completa da chain: sequencial x paralela (vários processos).
+
+Uso:
+    python benchmarks/bench_validation.py [número de blocos] [transações por bloco]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.blockchain import Blockchain
+from src.transaction import Transaction
+
+WORKERS = [1, 2, 4, os.cpu_count() or 1]
+
+
+def build_chain(blocks, transactions_per_block):
+    """Minera `blocks` blocos com dificuldade baixa e dificuldade fixa."""
+    blockchain = Blockchain(difficulty=1, retarget_interval=0)
+    for i in range(blocks):
+        blockchain.pending_transactions = [
+            Transaction(f"Usuario{j}", f"Usuario{i}", j + 0.5) for j in range(transactions_per_block)
+        ]
+        blockchain.mine_pending_transactions("Minerador")
+    return blockchain
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    transactions_per_block = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    blockchain = build_chain(blocks, transactions_per_block)
+    print(f"{blocks:,} blocos com {transactions_per_block} transações ({os.cpu_count()} CPUs)")
+    print(f"{'workers':>8} {'tempo (s)':>10} {'blocos/s':>10}")
+    
+    for workers in sorted(set(WORKERS)):
+        start = time.perf_counter()
+        assert blockchain.is_chain_valid(full=True, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>8} {elapsed:>10.2f} {blocks / elapsed:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main()
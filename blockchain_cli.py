@@ -6,6 +6,7 @@ Facilita o uso da blockchain sem precisar usar curl.
 import requests
 import json
 import sys
+import time
 from datetime import datetime
 
 BASE_URL = "http://localhost:5000"
@@ -86,7 +87,8 @@ def add_transaction():
         data = {
             "sender": sender,
             "recipient": recipient,
-            "amount": amount
+            "amount": amount,
+            "timestamp": datetime.now().isoformat()
         }
         
         response = requests.post(f"{BASE_URL}/transactions", json=data)
@@ -102,6 +104,15 @@ def add_transaction():
     except Exception as e:
         print(f"❌ Erro: {e}")
 
+def wait_for_mining(job_id):
+    """Acompanha um job de mineração até ele terminar e retorna o resultado."""
+    while True:
+        result = requests.get(f"{BASE_URL}/mine/{job_id}").json()
+        if result['status'] not in ('pending', 'running'):
+            return result
+        print(f"   ⏳ {result['nonces_tried']} tentativas ({result['hashrate']:.0f} H/s)...")
+        time.sleep(0.5)
+
 def mine_block():
     """Minera um novo bloco."""
     try:
@@ -111,8 +122,11 @@ def mine_block():
         
         print("🚀 Iniciando mineração...")
         response = requests.post(f"{BASE_URL}/mine", json=data)
-        if response.status_code == 200:
-            result = response.json()
+        if response.status_code == 202:
+            result = wait_for_mining(response.json()['job_id'])
+            if result['status'] != 'completed':
+                print(f"❌ Mineração não concluída ({result['status']})")
+                return
             print(f"✅ Bloco minerado com sucesso!")
             print(f"   Minerador: {miner}")
             print(f"   Novo saldo: {result['miner_balance']}")
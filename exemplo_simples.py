@@ -6,6 +6,7 @@ Execute este arquivo para ver a blockchain funcionando!
 import requests
 import json
 import time
+from datetime import datetime
 
 BASE_URL = "http://localhost:5000"
 
@@ -54,6 +55,8 @@ def main():
     ]
     
     for tx in transactions:
+        # O timestamp é obrigatório e entra no txid (reenviar o mesmo JSON é rejeitado)
+        tx["timestamp"] = datetime.now().isoformat()
         response = requests.post(f"{BASE_URL}/transactions", json=tx)
         if response.status_code == 201:
             print(f"✅ {tx['sender']} → {tx['recipient']}: {tx['amount']}")
@@ -73,11 +76,21 @@ def main():
     mine_data = {"miner_address": "Minerador1"}
     response = requests.post(f"{BASE_URL}/mine", json=mine_data)
     
-    if response.status_code == 200:
-        result = response.json()
+    # A mineração roda em segundo plano: acompanha o job até terminar
+    result = None
+    if response.status_code == 202:
+        job_url = f"{BASE_URL}/mine/{response.json()['job_id']}"
+        result = requests.get(job_url).json()
+        while result['status'] in ('pending', 'running'):
+            time.sleep(0.5)
+            result = requests.get(job_url).json()
+    
+    if result and result['status'] == 'completed':
         print(f"✅ Bloco minerado com sucesso!")
         print(f"   Hash: {result['block']['hash'][:32]}...")
         print(f"   Nonce: {result['block']['nonce']}")
+        print(f"   Tentativas: {result['mining_stats']['attempts']}")
+        print(f"   Tempo: {result['mining_stats']['elapsed']:.2f}s ({result['mining_stats']['hashrate']:,.0f} H/s)")
         print(f"   Saldo do minerador: {result['miner_balance']}")
     else:
         print("❌ Erro na mineração")
@@ -1,15 +1,63 @@
 """
 API Flask para interagir com a blockchain.
 """
-from flask import Flask, jsonify, request
+import os
+from flask import Flask, Response, jsonify, request
 from datetime import datetime
+from .archive_storage import ArchivedBlockStore
+from .binary import amount_to_fixed
 from .blockchain import Blockchain
+from .chain_io import iter_export_lines
+from .jobs import MiningJobManager
+from .mempool_log import MempoolLog
+from .mining import ConsoleMiningReporter
+from .mmap_storage import MappedBlockStore
+from .sqlite_storage import SQLiteBlockStore
+from .storage import BlockStore
 from .transaction import Transaction
 
 app = Flask(__name__)
 
-# Instância global da blockchain
-blockchain = Blockchain()
+# Arquivo de blocos (opcional): com BLOCKCHAIN_STORE definido, a chain sobrevive a reinícios.
+# BLOCKCHAIN_BACKEND escolhe o formato: 'file' (append-only, padrão), 'mmap' (mesmo arquivo,
+# blocos lidos sob demanda), 'archive' (mmap com os blocos antigos comprimidos) ou 'sqlite'
+# (consultas indexadas)
+store_path = os.environ.get('BLOCKCHAIN_STORE')
+store_backend = os.environ.get('BLOCKCHAIN_BACKEND', 'file')
+if not store_path:
+    store = None
+elif store_backend == 'sqlite':
+    store = SQLiteBlockStore(store_path)
+elif store_backend == 'mmap':
+    store = MappedBlockStore(store_path)
+elif store_backend == 'archive':
+    store = ArchivedBlockStore(store_path)
+elif store_backend == 'file':
+    store = BlockStore(store_path)
+else:
+    raise ValueError(f"BLOCKCHAIN_BACKEND desconhecido: {store_backend}")
+
+# Instância global da blockchain (a API mostra a mineração no console).
+# Com BLOCKCHAIN_PRUNE_DEPTH, só os últimos N blocos mantêm as transações em memória.
+# Com BLOCKCHAIN_MEMPOOL_LOG, as transações pendentes sobrevivem a reinícios.
+# Com BLOCKCHAIN_REQUIRE_SIGNATURES=1, só transações assinadas pelo remetente são aceitas.
+# BLOCKCHAIN_MAX_CLOCK_SKEW é a diferença máxima, em segundos, entre o timestamp do cliente
+# e o relógio do nó (padrão: 2 horas)
+mempool_log_path = os.environ.get('BLOCKCHAIN_MEMPOOL_LOG')
+blockchain = Blockchain(reporter=ConsoleMiningReporter(), store=store,
+                        prune_depth=int(os.environ.get('BLOCKCHAIN_PRUNE_DEPTH', 0)),
+                        mempool_log=MempoolLog(mempool_log_path) if mempool_log_path else None,
+                        require_signatures=os.environ.get('BLOCKCHAIN_REQUIRE_SIGNATURES', '0').lower()
+                        in ('1', 'true'),
+                        signature_workers=int(os.environ.get('BLOCKCHAIN_SIGNATURE_WORKERS', 1)),
+                        max_clock_skew=float(os.environ.get('BLOCKCHAIN_MAX_CLOCK_SKEW', 7200)))
+print("✅ Blockchain inicializada com sucesso!")
+print(f"📦 {len(blockchain.chain)} bloco(s) (Gênesis: {blockchain.chain[0].hash[:16]}...)")
+
+# Jobs de mineração em segundo plano. Cada worker de POST /mine é um processo, então o
+# número por requisição é limitado (BLOCKCHAIN_MAX_MINING_WORKERS, padrão: número de CPUs)
+mining_jobs = MiningJobManager(blockchain)
+max_mining_workers = int(os.environ.get('BLOCKCHAIN_MAX_MINING_WORKERS', os.cpu_count() or 1))
 
 
 @app.route('/', methods=['GET'])
@@ -23,12 +71,18 @@ def home():
         'endpoints': {
             'GET /': 'Esta página',
             'GET /blockchain': 'Ver blockchain completa',
+            'GET /blockchain/export': 'Exportar blockchain (um bloco por linha)',
             'GET /blocks/<index>': 'Ver bloco específico',
             'GET /transactions': 'Ver todas as transações',
             'POST /transactions': 'Adicionar nova transação',
-            'POST /mine': 'Minerar novo bloco',
+            'GET /transactions/<txid>': 'Ver transação pelo id (pendente ou minerada)',
+            'POST /mine': 'Iniciar mineração de novo bloco (em segundo plano)',
+            'GET /mine/<job_id>': 'Ver progresso e resultado da mineração',
+            'DELETE /mine/<job_id>': 'Cancelar mineração',
             'GET /balance/<address>': 'Ver saldo de endereço',
-            'GET /validate': 'Validar blockchain',
+            'GET /addresses/<address>/transactions': 'Ver histórico de um endereço (paginado)',
+            'GET /validate': 'Validar blockchain (?full=true revalida todos os blocos)',
+            'GET /audit': 'Validar recompensas e saldos (primeira violação)',
             'GET /stats': 'Ver estatísticas'
         },
         'example_transaction': {
@@ -37,7 +91,8 @@ def home():
             'amount': 50.0
         },
         'example_mine': {
-            'miner_address': 'Minerador1'
+            'miner_address': 'Minerador1',
+            'workers': 1
         }
     }), 200
 
@@ -54,11 +109,30 @@ def get_blockchain():
     return jsonify(blockchain.to_dict()), 200
 
 
+@app.route('/blockchain/export', methods=['GET'])
+def export_blockchain():
+    """
+    Exporta a blockchain em streaming (JSON Lines: cabeçalho e um bloco por linha).
+    
+    O arquivo pode ser importado com chain_io.import_chain para iniciar um novo nó.
+    
+    Returns:
+        Response: Exportação enviada bloco a bloco
+    """
+    print("📤 Exportando blockchain...")
+    return Response(iter_export_lines(blockchain), mimetype='application/x-ndjson'), 200
+
+
 @app.route('/blocks/<int:index>', methods=['GET'])
 def get_block(index):
     """
     Retorna um bloco específico pelo índice.
     
+    Com o cabeçalho `Accept: application/octet-stream`, o bloco é enviado no
+    formato binário de Block.to_bytes (para transferência entre nós). Blocos que não
+    cabem nele (ex.: podados) são enviados em JSON se o cliente também aceitar JSON;
+    caso contrário, a resposta é 406.
+    
     Args:
         index (int): Índice do bloco
         
@@ -69,6 +143,14 @@ def get_block(index):
     block = blockchain.get_block_by_index(index)
     if block:
         print(f"✅ Bloco {index} encontrado!")
+        if request.accept_mimetypes.best_match(['application/json', 'application/octet-stream']) == \
+                'application/octet-stream':
+            try:
+                return Response(block.to_bytes(), mimetype='application/octet-stream'), 200
+            except ValueError as e:
+                print(f"⚠️  Bloco {index} sem formato binário: {e}")
+                if not request.accept_mimetypes['application/json']:
+                    return jsonify({'error': str(e)}), 406
         return jsonify(block.to_dict()), 200
     else:
         print(f"❌ Bloco {index} não encontrado!")
@@ -88,42 +170,109 @@ def get_transactions():
     return jsonify([tx.to_dict() for tx in transactions]), 200
 
 
+@app.route('/transactions/<txid>', methods=['GET'])
+def get_transaction(txid):
+    """
+    Localiza uma transação pelo id (Transaction.txid), sem percorrer a chain.
+    
+    Args:
+        txid (str): Id da transação
+        
+    Returns:
+        JSON: Estado ('pending' ou 'confirmed'), posição e transação, ou erro
+    """
+    found = blockchain.get_transaction(txid)
+    if found is None:
+        print(f"❌ Transação {txid[:16]}... não encontrada!")
+        return jsonify({'error': 'Transação não encontrada'}), 404
+    
+    block_index, position, transaction = found
+    print(f"✅ Transação {txid[:16]}... encontrada!")
+    return jsonify({
+        'txid': txid,
+        'status': 'pending' if block_index is None else 'confirmed',
+        'block_index': block_index,
+        'position': position,
+        'confirmations': 0 if block_index is None else len(blockchain.chain) - block_index,
+        'transaction': transaction.to_dict()
+    }), 200
+
+
 @app.route('/transactions', methods=['POST'])
 def add_transaction():
     """
     Adiciona uma nova transação à blockchain.
     
+    O 'timestamp' (ISO 8601) do cliente é obrigatório e entra no txid: reenviar o mesmo
+    JSON gera o mesmo txid e é rejeitado como repetido. Transações assinadas (ver
+    Transaction.sign) enviam também 'signature', como em Transaction.to_dict, e o valor
+    é mantido exatamente como foi assinado.
+    
     Returns:
         JSON: Confirmação da transação adicionada
     """
     data = request.get_json()
     
     # Valida os dados da requisição
-    if not data or 'sender' not in data or 'recipient' not in data or 'amount' not in data:
+    if not data or any(field not in data for field in ('sender', 'recipient', 'amount', 'timestamp')):
         print("❌ Dados de transação inválidos!")
-        return jsonify({'error': 'Dados inválidos. Campos obrigatórios: sender, recipient, amount'}), 400
+        return jsonify({'error': 'Dados inválidos. Campos obrigatórios: sender, recipient, amount, '
+                                 'timestamp'}), 400
+    
+    if 'signature' in data:
+        # O hash assinado cobre o valor e o timestamp originais: nada é convertido
+        amount = data['amount']
+        if not isinstance(amount, (int, float)) or isinstance(amount, bool) or amount <= 0:
+            print("❌ Valor da transação inválido!")
+            return jsonify({'error': 'O valor deve ser um número positivo'}), 400
+        try:
+            transaction = Transaction.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            print("❌ Transação assinada inválida!")
+            return jsonify({'error': 'Transações assinadas exigem sender, recipient, amount, '
+                                     'timestamp (ISO 8601) e signature'}), 400
+    else:
+        try:
+            amount = float(data['amount'])
+            if amount <= 0:
+                print("❌ Valor da transação deve ser positivo!")
+                return jsonify({'error': 'O valor deve ser positivo'}), 400
+        except ValueError:
+            print("❌ Valor da transação inválido!")
+            return jsonify({'error': 'Valor inválido'}), 400
+        
+        try:
+            timestamp = datetime.fromisoformat(data['timestamp'])
+        except (TypeError, ValueError):
+            print("❌ Timestamp da transação inválido!")
+            return jsonify({'error': 'Timestamp inválido (use ISO 8601)'}), 400
+        
+        # Cria a transação
+        transaction = Transaction(
+            sender=data['sender'],
+            recipient=data['recipient'],
+            amount=amount,
+            timestamp=timestamp
+        )
     
+    # O valor precisa caber no formato binário dos blocos (ver binary.amount_to_fixed)
     try:
-        amount = float(data['amount'])
-        if amount <= 0:
-            print("❌ Valor da transação deve ser positivo!")
-            return jsonify({'error': 'O valor deve ser positivo'}), 400
+        amount_to_fixed(amount)
     except ValueError:
-        print("❌ Valor da transação inválido!")
-        return jsonify({'error': 'Valor inválido'}), 400
-    
-    # Cria e adiciona a transação
-    transaction = Transaction(
-        sender=data['sender'],
-        recipient=data['recipient'],
-        amount=amount
-    )
+        print("❌ Valor da transação fora do formato!")
+        return jsonify({'error': 'O valor deve ter no máximo 8 casas decimais e ser menor '
+                                 'que 92 bilhões'}), 400
     
-    blockchain.add_transaction(transaction)
+    try:
+        blockchain.add_transaction(transaction)
+    except ValueError as e:
+        print(f"❌ Transação rejeitada: {e}")
+        return jsonify({'error': str(e)}), 400
     print(f"✅ Nova transação adicionada: {transaction.sender} → {transaction.recipient}: {transaction.amount}")
     
     return jsonify({
         'message': 'Transação adicionada com sucesso',
+        'txid': transaction.txid,
         'transaction': transaction.to_dict(),
         'pending_transactions': len(blockchain.pending_transactions)
     }), 201
@@ -132,10 +281,12 @@ def add_transaction():
 @app.route('/mine', methods=['POST'])
 def mine_block():
     """
-    Minera um novo bloco com as transações pendentes.
+    Inicia a mineração de um novo bloco com as transações pendentes.
+    
+    A mineração roda em segundo plano; use GET /mine/<job_id> para acompanhar.
     
     Returns:
-        JSON: Informações do bloco minerado
+        JSON: Id e estado do job de mineração
     """
     data = request.get_json()
     
@@ -145,6 +296,18 @@ def mine_block():
     
     miner_address = data['miner_address']
     
+    try:
+        workers = int(data.get('workers', 1))
+        if workers < 1:
+            print("❌ Número de workers deve ser positivo!")
+            return jsonify({'error': 'O número de workers deve ser pelo menos 1'}), 400
+        if workers > max_mining_workers:
+            print(f"❌ Número de workers acima do limite ({max_mining_workers})!")
+            return jsonify({'error': f'O número de workers deve ser no máximo {max_mining_workers}'}), 400
+    except (TypeError, ValueError):
+        print("❌ Número de workers inválido!")
+        return jsonify({'error': 'Número de workers inválido'}), 400
+    
     if not blockchain.pending_transactions:
         print("❌ Não há transações pendentes para minerar!")
         return jsonify({'error': 'Não há transações pendentes para minerar'}), 400
@@ -152,16 +315,63 @@ def mine_block():
     print(f"🚀 Iniciando mineração para {miner_address}...")
     print(f"📋 Transações pendentes: {len(blockchain.pending_transactions)}")
     
-    # Minera o bloco
-    new_block = blockchain.mine_pending_transactions(miner_address)
-    
-    print(f"🎉 Mineração concluída! Novo saldo do minerador: {blockchain.get_balance(miner_address)}")
+    try:
+        job = mining_jobs.submit(miner_address, workers=workers)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return jsonify({'error': str(e)}), 409
     
     return jsonify({
-        'message': 'Bloco minerado com sucesso',
-        'block': new_block.to_dict(),
-        'miner_balance': blockchain.get_balance(miner_address)
-    }), 200
+        'message': 'Mineração iniciada',
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': f'/mine/{job.id}'
+    }), 202
+
+
+@app.route('/mine/<job_id>', methods=['GET'])
+def get_mining_job(job_id):
+    """
+    Retorna o progresso de um job de mineração.
+    
+    Args:
+        job_id (str): Id do job
+        
+    Returns:
+        JSON: Estado, tentativas, hashrate, tempo decorrido e bloco minerado (se concluído)
+    """
+    job = mining_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job de mineração não encontrado'}), 404
+    
+    return jsonify(job.to_dict()), 200
+
+
+@app.route('/mine/<job_id>', methods=['DELETE'])
+def cancel_mining_job(job_id):
+    """
+    Cancela um job de mineração em andamento.
+    
+    Args:
+        job_id (str): Id do job
+        
+    Returns:
+        JSON: Estado do job após o pedido de cancelamento
+    """
+    job = mining_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job de mineração não encontrado'}), 404
+    
+    if not job.cancel():
+        return jsonify({'error': 'O job de mineração já terminou', 'job': job.to_dict()}), 409
+    
+    print(f"🛑 Cancelando mineração {job_id}...")
+    job.wait()
+    
+    # A mineração pode ter terminado antes de perceber o pedido de cancelamento
+    if job.status != job.CANCELLED:
+        return jsonify({'error': 'O job de mineração já terminou', 'job': job.to_dict()}), 409
+    return jsonify({'message': 'Mineração cancelada', 'job': job.to_dict()}), 200
 
 
 @app.route('/balance/<address>', methods=['GET'])
@@ -169,30 +379,95 @@ def get_balance(address):
     """
     Retorna o saldo de um endereço.
     
+    Query string opcional: height (saldo logo após o bloco dessa altura).
+    
     Args:
         address (str): Endereço para consultar o saldo
         
     Returns:
         JSON: Saldo do endereço
     """
-    balance = blockchain.get_balance(address)
-    print(f"💰 Saldo de {address}: {balance}")
+    height = request.args.get('height')
+    if height is None:
+        balance = blockchain.get_balance(address)
+        print(f"💰 Saldo de {address}: {balance}")
+        return jsonify({
+            'address': address,
+            'balance': balance
+        }), 200
+    
+    try:
+        height = int(height)
+    except ValueError:
+        return jsonify({'error': 'Parâmetro inválido. height deve ser um inteiro'}), 400
+    
+    try:
+        balance = blockchain.get_balance(address, at_height=height)
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 404
+    
+    print(f"💰 Saldo de {address} na altura {height}: {balance}")
     return jsonify({
         'address': address,
+        'height': height,
         'balance': balance
     }), 200
 
 
+@app.route('/addresses/<address>/transactions', methods=['GET'])
+def get_address_transactions(address):
+    """
+    Retorna o histórico de transações de um endereço, com paginação por cursor.
+    
+    Parâmetros de consulta: cursor ("bloco:posição", vindo do next_cursor da página
+    anterior; padrão: início) e limit (padrão 50, máximo 500).
+    
+    Args:
+        address (str): Endereço consultado
+        
+    Returns:
+        JSON: Transações da página e o cursor da próxima página (ou null)
+    """
+    try:
+        cursor = request.args.get('cursor')
+        if cursor is not None:
+            height, position = cursor.split(':')
+            cursor = (int(height), int(position))
+            if min(cursor) < 0:
+                raise ValueError
+        limit = int(request.args.get('limit', 50))
+        if not 1 <= limit <= 500:
+            raise ValueError
+    except ValueError:
+        return jsonify({'error': 'Parâmetros inválidos. cursor = bloco:posição e 1 <= limit <= 500'}), 400
+    
+    entries, next_cursor = blockchain.get_address_transactions(address, cursor, limit)
+    print(f"📜 Histórico de {address}: {len(entries)} transações")
+    
+    return jsonify({
+        'address': address,
+        'transactions': [
+            {'block_index': block_index, 'position': position, 'transaction': tx.to_dict()}
+            for block_index, position, tx in entries
+        ],
+        'next_cursor': f"{next_cursor[0]}:{next_cursor[1]}" if next_cursor is not None else None
+    }), 200
+
+
 @app.route('/validate', methods=['GET'])
 def validate_blockchain():
     """
     Valida a integridade da blockchain.
     
+    Só os blocos novos desde a última validação são verificados; com
+    ?full=true, a chain inteira é revalidada.
+    
     Returns:
         JSON: Resultado da validação
     """
+    full = request.args.get('full', 'false').lower() in ('1', 'true', 'yes')
     print("🔍 Validando integridade da blockchain...")
-    is_valid = blockchain.is_chain_valid()
+    is_valid = blockchain.is_chain_valid(full=full)
     status = "✅ Blockchain válida!" if is_valid else "❌ Blockchain inválida!"
     print(status)
     return jsonify({
@@ -201,6 +476,20 @@ def validate_blockchain():
     }), 200
 
 
+@app.route('/audit', methods=['GET'])
+def audit_blockchain():
+    """
+    Valida as regras da blockchain (blocos, recompensas e saldos) em uma única passagem.
+    
+    Returns:
+        JSON: Relatório com a primeira violação encontrada (se houver)
+    """
+    print("🔎 Auditando a blockchain...")
+    report = blockchain.validate_semantics()
+    print("✅ Nenhuma violação encontrada!" if report.is_valid else f"❌ {report.message}")
+    return jsonify(report.to_dict()), 200
+
+
 @app.route('/stats', methods=['GET'])
 def get_stats():
     """
@@ -210,7 +499,7 @@ def get_stats():
         JSON: Estatísticas da blockchain
     """
     total_blocks = len(blockchain.chain)
-    total_transactions = sum(len(block.transactions) for block in blockchain.chain)
+    total_transactions = blockchain.count_transactions()
     pending_transactions = len(blockchain.pending_transactions)
     
     print("📊 Consultando estatísticas da blockchain...")
@@ -220,6 +509,9 @@ def get_stats():
         'total_transactions': total_transactions,
         'pending_transactions': pending_transactions,
         'difficulty': blockchain.difficulty,
+        'target': f"{blockchain.target:064x}",
+        'retarget_interval': blockchain.retarget_interval,
+        'target_block_time': blockchain.target_block_time,
         'mining_reward': blockchain.mining_reward
     }), 200
 
@@ -0,0 +1,288 @@
+"""
+Módulo com o armazenamento de blocos que arquiva os blocos antigos comprimidos.
+
+Os blocos recentes ficam no arquivo append-only de MappedBlockStore. Quando ele
+passa de hot_blocks + segment_size blocos, os segment_size mais antigos são
+comprimidos (zlib ou lzma) em um segmento no arquivo `<path>.archive` e removidos
+do arquivo principal. A leitura continua transparente: chain[i] descomprime o
+segmento do bloco e mantém os últimos segmentos descomprimidos em um cache.
+
+Cada segmento é um registro de storage (tamanho + CRC32) com:
+- 1 byte com o compressor (0 = zlib, 1 = lzma)
+- altura do primeiro bloco (uint64) e número de blocos (uint32)
+- dados comprimidos: índice do segmento (fim de cada bloco, uint32) seguido dos blocos
+  serializados como nos registros de storage (JSON ou binário), sem os ids das
+  transações: eles são aleatórios, não se comprimem e são recalculados na leitura
+"""
+import lzma
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Tuple
+from .block import Block
+from .mmap_storage import DEFAULT_CACHE_SIZE, MappedBlockStore
+from .storage import (FSYNC_ALWAYS, RECORD_HEADER, SERIALIZATION_JSON, CorruptStoreError, decode_block,
+                      encode_record, read_records, strip_txids)
+
+# Compressores suportados e o código gravado em cada segmento
+COMPRESSION_ZLIB = 'zlib'
+COMPRESSION_LZMA = 'lzma'
+COMPRESSIONS = {COMPRESSION_ZLIB: 0, COMPRESSION_LZMA: 1}
+
+# Cabeçalho não comprimido do segmento: altura do primeiro bloco e número de blocos
+_SEGMENT_HEADER = struct.Struct('>QI')
+
+DEFAULT_SEGMENT_SIZE = 1000  # Blocos por segmento
+DEFAULT_HOT_BLOCKS = 1000  # Blocos recentes mantidos sem compressão
+DEFAULT_SEGMENT_CACHE_SIZE = 4  # Segmentos descomprimidos mantidos em memória
+
+
+def _compress(compression: str, data: bytes) -> bytes:
+    """
+    Comprime os dados de um segmento.
+    """
+    if compression == COMPRESSION_LZMA:
+        return lzma.compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(code: int, data: bytes) -> bytes:
+    """
+    Descomprime os dados de um segmento a partir do código do compressor.
+    """
+    if code == COMPRESSIONS[COMPRESSION_LZMA]:
+        return lzma.decompress(data)
+    if code == COMPRESSIONS[COMPRESSION_ZLIB]:
+        return zlib.decompress(data)
+    raise CorruptStoreError(f"Compressor de segmento desconhecido: {code}")
+
+
+class ArchivedBlockStore(MappedBlockStore):
+    """
+    Armazenamento mapeado em memória que comprime os blocos antigos em segmentos.
+    """
+    
+    def __init__(self, path: str, fsync_policy: str = FSYNC_ALWAYS, fsync_interval: int = 100,
+                 cache_size: int = DEFAULT_CACHE_SIZE, serialization: str = SERIALIZATION_JSON,
+                 compression: str = COMPRESSION_ZLIB, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 hot_blocks: int = DEFAULT_HOT_BLOCKS, segment_cache_size: int = DEFAULT_SEGMENT_CACHE_SIZE):
+        """
+        Abre (ou cria) o arquivo de blocos recentes e o arquivo de segmentos.
+        
+        Args:
+            path (str): Caminho do arquivo de blocos recentes (os segmentos ficam em path + '.archive')
+            fsync_policy (str): 'always', 'interval' ou 'never'
+            fsync_interval (int): Blocos entre fsyncs quando a política é 'interval'
+            cache_size (int): Número máximo de blocos reconstruídos mantidos em memória
+            serialization (str): Formato dos novos registros ('json' ou 'binary')
+            compression (str): Compressor dos novos segmentos: 'zlib' (rápido) ou 'lzma' (menor)
+            segment_size (int): Número de blocos por segmento
+            hot_blocks (int): Número mínimo de blocos recentes mantidos sem compressão
+            segment_cache_size (int): Número de segmentos descomprimidos mantidos em memória
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Compressor desconhecido: {compression}")
+        if segment_size < 1 or hot_blocks < 0 or segment_cache_size < 1:
+            raise ValueError("segment_size e segment_cache_size devem ser >= 1 e hot_blocks >= 0")
+        
+        self.compression = compression
+        self.segment_size = segment_size
+        self.hot_blocks = hot_blocks
+        self.segment_cache_size = segment_cache_size
+        self.archive_path = path + '.archive'
+        self._segment_starts = array('Q')  # Altura do primeiro bloco de cada segmento
+        self._segment_offsets = array('Q')  # Offset do registro de cada segmento
+        self._archived = 0  # Número de blocos arquivados
+        self._segments: "OrderedDict[int, Tuple[bytes, Tuple[int, ...]]]" = OrderedDict()
+        self._archive = open(self.archive_path, 'ab')
+        self._archive_reader = open(self.archive_path, 'rb')
+        self._build_archive_index()
+        
+        super().__init__(path, fsync_policy, fsync_interval, cache_size, serialization)
+        self._skip_archived_blocks()
+    
+    def _build_archive_index(self) -> None:
+        """
+        Percorre os segmentos guardando a altura inicial e o offset de cada um.
+        
+        Um segmento incompleto no final (gravação interrompida) é removido do arquivo.
+        """
+        valid_end = 0
+        for offset, payload in read_records(self._archive_reader):
+            first, count = _SEGMENT_HEADER.unpack_from(payload, 1)
+            if first != self._archived:
+                raise CorruptStoreError(f"Segmento no offset {offset} começa no bloco {first}, "
+                                        f"esperado {self._archived}")
+            self._segment_starts.append(first)
+            self._segment_offsets.append(offset)
+            self._archived += count
+            valid_end = offset + RECORD_HEADER.size + len(payload)
+        
+        if valid_end < os.fstat(self._archive_reader.fileno()).st_size:
+            self._archive.truncate(valid_end)
+            # O offset do próximo segmento vem de tell(), que ainda apontaria para o fim antigo
+            self._archive.seek(0, os.SEEK_END)
+    
+    def _skip_archived_blocks(self) -> None:
+        """
+        Ignora os blocos do arquivo principal que já estão arquivados.
+        
+        Acontece se o processo parou depois de gravar um segmento e antes de
+        reescrever o arquivo principal; a próxima rotação os remove do arquivo.
+        """
+        skip = 0
+        while skip < len(self._offsets):
+            index = decode_block(self._read_payload(self._offsets[skip])).index
+            if index >= self._archived:
+                if index != self._archived:
+                    raise CorruptStoreError(f"Faltam os blocos {self._archived} a {index - 1}")
+                break
+            skip += 1
+        del self._offsets[:skip]
+    
+    def __len__(self) -> int:
+        return self._archived + len(self._offsets)
+    
+    def _read_block(self, index: int) -> Block:
+        """
+        Reconstrói um bloco do arquivo principal ou do segmento em que foi arquivado.
+        
+        Args:
+            index (int): Altura do bloco
+        
+        Returns:
+            Block: Bloco reconstruído
+        """
+        if index >= self._archived:
+            return super()._read_block(index - self._archived)
+        
+        segment = bisect_right(self._segment_starts, index) - 1
+        data, ends = self._load_segment(segment)
+        position = index - self._segment_starts[segment]
+        start = ends[position - 1] if position else 0
+        return decode_block(data[start:ends[position]])
+    
+    def _load_segment(self, segment: int) -> Tuple[bytes, Tuple[int, ...]]:
+        """
+        Retorna os blocos descomprimidos de um segmento, usando o cache de segmentos.
+        
+        Args:
+            segment (int): Número do segmento
+        
+        Returns:
+            Tuple[bytes, Tuple[int, ...]]: Blocos serializados e o fim de cada um
+        """
+        cached = self._segments.get(segment)
+        if cached is not None:
+            self._segments.move_to_end(segment)
+            return cached
+        
+        offset = self._segment_offsets[segment]
+        self._archive_reader.seek(offset)
+        length, checksum = RECORD_HEADER.unpack(self._archive_reader.read(RECORD_HEADER.size))
+        payload = self._archive_reader.read(length)
+        if zlib.crc32(payload) != checksum:
+            raise CorruptStoreError(f"Segmento corrompido no offset {offset}")
+        
+        _, count = _SEGMENT_HEADER.unpack_from(payload, 1)
+        body = _decompress(payload[0], payload[1 + _SEGMENT_HEADER.size:])
+        index_size = 4 * count
+        cached = (body[index_size:], struct.unpack_from(f'>{count}I', body))
+        
+        self._segments[segment] = cached
+        while len(self._segments) > self.segment_cache_size:
+            self._segments.popitem(last=False)
+        return cached
+    
+    def append(self, block: Block) -> None:
+        """
+        Grava um bloco e, se houver blocos recentes demais, arquiva os mais antigos.
+        
+        Args:
+            block (Block): Bloco a ser gravado (deve ser o próximo da chain)
+        """
+        with self._lock:
+            super().append(block)
+            if len(self._offsets) >= self.hot_blocks + self.segment_size:
+                self.archive_segment()
+    
+    def archive_segment(self) -> None:
+        """
+        Comprime os segment_size blocos mais antigos do arquivo principal em um segmento.
+        
+        O segmento é gravado (com fsync) antes de o arquivo principal ser reescrito
+        sem esses blocos, então uma queda no meio não perde blocos.
+        """
+        with self._lock:
+            count = min(self.segment_size, len(self._offsets))
+            if count == 0:
+                return
+            
+            payloads = [strip_txids(self._read_payload(offset)) for offset in self._offsets[:count]]
+            ends = []
+            end = 0
+            for payload in payloads:
+                end += len(payload)
+                ends.append(end)
+            body = struct.pack(f'>{count}I', *ends) + b''.join(payloads)
+            
+            header = bytes([COMPRESSIONS[self.compression]]) + _SEGMENT_HEADER.pack(self._archived, count)
+            segment_offset = self._archive.tell()
+            self._archive.write(encode_record(header + _compress(self.compression, body)))
+            self._archive.flush()
+            os.fsync(self._archive.fileno())
+            self._segment_starts.append(self._archived)
+            self._segment_offsets.append(segment_offset)
+            self._archived += count
+            
+            self._rewrite_hot_file(count)
+    
+    def _rewrite_hot_file(self, count: int) -> None:
+        """
+        Reescreve o arquivo principal sem os `count` primeiros blocos (arquivo temporário + rename).
+        
+        Args:
+            count (int): Número de blocos recém-arquivados
+        """
+        self._handle.flush()
+        file_size = os.fstat(self._handle.fileno()).st_size
+        cut = self._offsets[count] if count < len(self._offsets) else file_size
+        
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as handle:
+            if cut < file_size:
+                handle.write(self._mapped(file_size)[cut:file_size])
+            handle.flush()
+            os.fsync(handle.fileno())
+        
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._reader.close()
+        self._handle.close()
+        os.replace(temporary, self.path)
+        
+        directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+        
+        self._handle = open(self.path, 'ab')
+        self._reader = open(self.path, 'rb')
+        self._offsets = array('Q', (offset - cut for offset in self._offsets[count:]))
+        self._unsynced = 0
+    
+    def close(self) -> None:
+        """
+        Fecha o arquivo principal e o arquivo de segmentos.
+        """
+        with self._lock:
+            super().close()
+            self._segments.clear()
+            self._archive_reader.close()
+            if not self._archive.closed:
+                self._archive.close()
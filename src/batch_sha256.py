@@ -0,0 +1,223 @@
+"""
+Módulo com o motor de mineração vetorizado: SHA-256 de vários nonces de uma vez com NumPy.
+
+Cada nonce ocupa uma "lane" de inteiros uint32 e as 64 rodadas do SHA-256 são
+aplicadas a todas as lanes ao mesmo tempo. Os blocos de 64 bytes do prefixo que não
+dependem do nonce são comprimidos uma única vez (midstate). Quando o NumPy não está
+instalado, a busca usa o hashlib nonce a nonce.
+"""
+import hashlib
+from typing import Callable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .mining import MiningCancelled, max_digest_for
+
+# Indica se o motor vetorizado pode ser usado
+NUMPY_AVAILABLE = np is not None
+
+# Número padrão de nonces avaliados por lote
+DEFAULT_BATCH_SIZE = 16384
+
+_K = [
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+]
+
+_INITIAL_STATE = [
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+]
+
+
+def _rotr(x, n: int):
+    """
+    Rotação à direita de n bits em arrays uint32.
+    """
+    return (x >> np.uint32(n)) | (x << np.uint32(32 - n))
+
+
+def _compress(state, words):
+    """
+    Aplica a função de compressão do SHA-256 a todas as lanes.
+    
+    Args:
+        state: Array uint32 (8, lanes) com o estado atual
+        words: Array uint32 (16, lanes) com o bloco de 64 bytes de cada lane
+    
+    Returns:
+        Array uint32 (8, lanes) com o novo estado
+    """
+    w = list(words)
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> np.uint32(3))
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> np.uint32(10))
+        w.append(w[t - 16] + s0 + w[t - 7] + s1)
+    
+    a, b, c, d, e, f, g, h = state
+    for t in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g)
+        temp1 = h + s1 + ch + np.uint32(_K[t]) + w[t]
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = s0 + maj
+        h, g, f, e, d, c, b, a = g, f, e, d + temp1, c, b, a, temp1 + temp2
+    
+    return state + np.stack([a, b, c, d, e, f, g, h])
+
+
+def _prefix_midstate(prefix: bytes):
+    """
+    Comprime os blocos completos de 64 bytes do prefixo.
+    
+    Args:
+        prefix (bytes): Parte invariante do bloco
+    
+    Returns:
+        Tuple: Estado (8, 1) após os blocos completos e os bytes restantes do prefixo
+    """
+    state = np.array(_INITIAL_STATE, dtype=np.uint32).reshape(8, 1)
+    full = len(prefix) - len(prefix) % 64
+    for offset in range(0, full, 64):
+        words = np.frombuffer(prefix[offset:offset + 64], dtype='>u4').astype(np.uint32).reshape(16, 1)
+        state = _compress(state, words)
+    return state, prefix[full:]
+
+
+def _hash_lanes(midstate, remainder: bytes, total_prefix_len: int, nonces, digits: int):
+    """
+    Calcula o SHA-256 de prefixo + str(nonce) para um lote de nonces com o mesmo número de dígitos.
+    
+    Args:
+        midstate: Estado (8, 1) após os blocos completos do prefixo
+        remainder (bytes): Bytes do prefixo que não completaram um bloco
+        total_prefix_len (int): Tamanho total do prefixo em bytes
+        nonces: Array int64 com os nonces do lote
+        digits (int): Número de dígitos decimais de todos os nonces do lote
+    
+    Returns:
+        Array uint32 (8, lanes) com o digest de cada nonce
+    """
+    lanes = len(nonces)
+    message_len = total_prefix_len + digits
+    tail_len = len(remainder) + digits
+    tail_blocks = (tail_len + 9 + 63) // 64
+    
+    tail = np.zeros((lanes, tail_blocks * 64), dtype=np.uint8)
+    tail[:, :len(remainder)] = np.frombuffer(remainder, dtype=np.uint8)
+    for position in range(digits):
+        power = 10 ** (digits - 1 - position)
+        tail[:, len(remainder) + position] = (nonces // power) % 10 + ord('0')
+    tail[:, tail_len] = 0x80
+    tail[:, -8:] = np.frombuffer((message_len * 8).to_bytes(8, 'big'), dtype=np.uint8)
+    
+    words = tail.view('>u4').astype(np.uint32).T
+    state = np.repeat(midstate, lanes, axis=1)
+    for block in range(tail_blocks):
+        state = _compress(state, words[block * 16:(block + 1) * 16])
+    return state
+
+
+def _meets_difficulty_lanes(state, difficulty: int):
+    """
+    Verifica, para cada lane, se os primeiros `difficulty` bits do digest são zero.
+    
+    Args:
+        state: Array uint32 (8, lanes) com os digests
+        difficulty (int): Dificuldade em bits
+    
+    Returns:
+        Array bool com uma posição por lane
+    """
+    valid = np.ones(state.shape[1], dtype=bool)
+    full_words, remaining_bits = divmod(difficulty, 32)
+    for word in range(full_words):
+        valid &= state[word] == 0
+    if remaining_bits:
+        valid &= (state[full_words] >> np.uint32(32 - remaining_bits)) == 0
+    return valid
+
+
+def _search_hashlib(prefix: bytes, difficulty: int, start_nonce: int, batch_size: int,
+                    progress_callback, stop_event) -> Tuple[int, str, int]:
+    """
+    Busca nonce a nonce com hashlib (usada quando o NumPy não está disponível).
+    """
+    max_digest = max_digest_for(difficulty)
+    midstate = hashlib.sha256(prefix)
+    nonce = start_nonce
+    
+    while True:
+        for _ in range(batch_size):
+            sha = midstate.copy()
+            sha.update(str(nonce).encode('utf-8'))
+            digest = sha.digest()
+            if digest <= max_digest:
+                return nonce, digest.hex(), nonce - start_nonce + 1
+            nonce += 1
+        
+        if stop_event is not None and stop_event.is_set():
+            raise MiningCancelled("Mineração cancelada")
+        if progress_callback is not None:
+            progress_callback(nonce - start_nonce)
+
+
+def search_nonce_batched(prefix: bytes, difficulty: int, start_nonce: int = 0,
+                         batch_size: int = DEFAULT_BATCH_SIZE,
+                         progress_callback: Optional[Callable[[int], None]] = None,
+                         stop_event=None) -> Tuple[int, str, int]:
+    """
+    Procura o menor nonce >= start_nonce cujo hash atende à dificuldade, em lotes vetorizados.
+    
+    Args:
+        prefix (bytes): Parte invariante do bloco (ver Block._hash_prefix)
+        difficulty (int): Dificuldade em bits
+        start_nonce (int): Primeiro nonce testado
+        batch_size (int): Número de nonces avaliados por lote
+        progress_callback (Callable[[int], None], optional): Recebe o número de tentativas após cada lote
+        stop_event (optional): Evento que cancela a mineração quando sinalizado
+    
+    Returns:
+        Tuple[int, str, int]: Nonce encontrado, hash correspondente e número de tentativas
+    
+    Raises:
+        MiningCancelled: Se stop_event for sinalizado antes de encontrar o nonce
+    """
+    if batch_size < 1:
+        raise ValueError("O tamanho do lote deve ser pelo menos 1")
+    if not NUMPY_AVAILABLE:
+        return _search_hashlib(prefix, difficulty, start_nonce, batch_size, progress_callback, stop_event)
+    
+    max_digest_for(difficulty)  # Valida a dificuldade
+    midstate, remainder = _prefix_midstate(prefix)
+    nonce = start_nonce
+    
+    while True:
+        # Todos os nonces de um lote precisam ter a mesma quantidade de dígitos
+        digits = len(str(nonce))
+        end = min(nonce + batch_size, 10 ** digits)
+        nonces = np.arange(nonce, end, dtype=np.int64)
+        
+        with np.errstate(over='ignore'):
+            state = _hash_lanes(midstate, remainder, len(prefix), nonces, digits)
+        hits = np.flatnonzero(_meets_difficulty_lanes(state, difficulty))
+        
+        if hits.size:
+            found = nonce + int(hits[0])
+            block_hash = hashlib.sha256(prefix + str(found).encode('utf-8')).hexdigest()
+            return found, block_hash, found - start_nonce + 1
+        
+        nonce = end
+        if stop_event is not None and stop_event.is_set():
+            raise MiningCancelled("Mineração cancelada")
+        if progress_callback is not None:
+            progress_callback(nonce - start_nonce)
@@ -0,0 +1,160 @@
+"""
+Módulo com as primitivas do formato binário de blocos e transações.
+
+Todos os inteiros são big-endian. Strings são UTF-8 com prefixo de tamanho
+(uint16), timestamps são microssegundos desde a época Unix (int64) e valores
+são armazenados em ponto fixo com 8 casas decimais (int64).
+"""
+import struct
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+# Versão do formato binário (primeiro byte de cada bloco ou transação)
+FORMAT_VERSION = 1
+
+# Casas decimais dos valores em ponto fixo
+AMOUNT_SCALE = 10 ** 8
+
+# Tamanho que indica uma string ausente (None)
+NULL_LENGTH = 0xFFFF
+
+# Origem dos timestamps binários (época Unix, sem fuso horário)
+EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_LENGTH = struct.Struct('>H')
+
+
+def pack_string(value: Optional[str]) -> bytes:
+    """
+    Serializa uma string (ou None) com prefixo de tamanho.
+    
+    Args:
+        value (Optional[str]): String a ser serializada
+    
+    Returns:
+        bytes: Tamanho (uint16) seguido dos bytes UTF-8
+    """
+    length, encoded = encode_optional(value)
+    return _LENGTH.pack(length) + encoded
+
+
+def encode_optional(value: Optional[str]) -> Tuple[int, bytes]:
+    """
+    Codifica uma string (ou None) cujo tamanho vai em um cabeçalho separado.
+    
+    Args:
+        value (Optional[str]): String a ser codificada
+    
+    Returns:
+        Tuple[int, bytes]: Campo de tamanho (NULL_LENGTH para None) e bytes UTF-8
+    """
+    if value is None:
+        return NULL_LENGTH, b''
+    encoded = value.encode('utf-8')
+    if len(encoded) >= NULL_LENGTH:
+        raise ValueError("String longa demais para o formato binário")
+    return len(encoded), encoded
+
+
+def decode_optional(data: bytes, offset: int, length: int) -> Tuple[Optional[str], int]:
+    """
+    Lê uma string codificada por encode_optional.
+    
+    Args:
+        data (bytes): Buffer de entrada
+        offset (int): Posição do primeiro byte da string
+        length (int): Campo de tamanho lido do cabeçalho
+    
+    Returns:
+        Tuple[Optional[str], int]: String lida e a posição logo após ela
+    """
+    if length == NULL_LENGTH:
+        return None, offset
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Dados binários truncados")
+    return str(data[offset:end], 'utf-8'), end
+
+
+def unpack_string(data: bytes, offset: int) -> Tuple[Optional[str], int]:
+    """
+    Lê uma string serializada por pack_string.
+    
+    Args:
+        data (bytes): Buffer de entrada
+        offset (int): Posição do prefixo de tamanho
+    
+    Returns:
+        Tuple[Optional[str], int]: String lida e a posição logo após ela
+    """
+    (length,) = _LENGTH.unpack_from(data, offset)
+    return decode_optional(data, offset + _LENGTH.size, length)
+
+
+def datetime_to_micros(value: datetime) -> int:
+    """
+    Converte um datetime sem fuso horário em microssegundos desde a época.
+    
+    Args:
+        value (datetime): Timestamp (naive, como os gerados por datetime.now())
+    
+    Returns:
+        int: Microssegundos desde 1970-01-01
+    """
+    if value.tzinfo is not None:
+        raise ValueError("O formato binário só aceita timestamps sem fuso horário")
+    return (value - EPOCH) // _MICROSECOND
+
+
+def compact_timestamp(value: datetime):
+    """
+    Converte um timestamp para a forma compacta guardada em memória.
+    
+    Args:
+        value (datetime): Timestamp
+    
+    Returns:
+        int | datetime: Microssegundos desde a época (timestamps com fuso horário são mantidos como estão)
+    """
+    if value.tzinfo is not None:
+        return value
+    return (value - EPOCH) // _MICROSECOND
+
+
+def expand_timestamp(value) -> datetime:
+    """
+    Converte a forma compacta de compact_timestamp de volta para datetime.
+    
+    Args:
+        value (int | datetime): Timestamp compacto
+    
+    Returns:
+        datetime: Timestamp correspondente
+    """
+    if isinstance(value, datetime):
+        return value
+    return EPOCH + timedelta(microseconds=value)
+
+
+def amount_to_fixed(amount: float) -> int:
+    """
+    Converte um valor para ponto fixo com 8 casas decimais.
+    
+    Args:
+        amount (float): Valor da transação
+    
+    Returns:
+        int: Valor multiplicado por 10^8
+    
+    Raises:
+        ValueError: Se o valor não puder ser representado exatamente ou não couber em 64 bits
+    """
+    try:
+        fixed = round(amount * AMOUNT_SCALE)
+    except (OverflowError, ValueError):
+        raise ValueError(f"Valor fora do formato binário: {amount!r}") from None
+    if fixed / AMOUNT_SCALE != amount:
+        raise ValueError(f"Valor sem representação exata com 8 casas decimais: {amount!r}")
+    if not -2 ** 63 <= fixed < 2 ** 63:
+        raise ValueError(f"Valor fora do formato binário: {amount!r}")
+    return fixed
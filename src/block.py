@@ -3,17 +3,66 @@ Módulo para representar blocos na blockchain.
 """
 import hashlib
 import json
+import struct
+import time
 from datetime import datetime
-from typing import List, Union
-from .transaction import Transaction
+from typing import Callable, List, Optional, Tuple, Union
+from .transaction import Transaction, pack_transactions, unpack_transactions
+from .binary import (FORMAT_VERSION, compact_timestamp, datetime_to_micros, expand_timestamp, pack_string,
+                     unpack_string)
+from .batch_sha256 import search_nonce_batched
+from .merkle import compute_merkle_root, get_merkle_proof
+from .mining import (ENGINE_HASHLIB, ENGINE_NUMPY, ENGINES, PROGRESS_INTERVAL, MiningCancelled,
+                     MiningResult, hash_meets_difficulty, max_digest_for, parallel_search)
+
+# Cabeçalho binário: versão, índice, timestamp (µs), dificuldade, nonce,
+# raiz de Merkle e hash (32 bytes cada)
+_HEADER = struct.Struct('>BQqHQ32s32s')
+_COUNT = struct.Struct('>I')
+
+# Número de alterações feitas em blocos e transações selados (ver Block.seal)
+_mutations = 0
+
+
+def mutation_count() -> int:
+    """
+    Retorna quantas alterações já foram feitas em blocos ou transações selados.
+    
+    Returns:
+        int: Contador global de alterações (só aumenta)
+    """
+    return _mutations
+
+
+def _record_mutation() -> None:
+    global _mutations
+    _mutations += 1
+
+
+class _SealedTransaction(Transaction):
+    """
+    Transação de um bloco selado: cada atributo alterado é contado em mutation_count.
+    """
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        _record_mutation()
 
 
 class Block:
     """
     Representa um bloco na blockchain.
+    
+    Como Transaction, usa __slots__ e guarda o timestamp em microssegundos.
     """
     
-    def __init__(self, index: int, transactions: List[Transaction], previous_hash: str, timestamp: datetime = None):
+    __slots__ = ('index', 'transactions', 'previous_hash', '_timestamp', 'difficulty', 'nonce',
+                 'merkle_root', 'hash', 'mining_result')
+    
+    def __init__(self, index: int, transactions: List[Transaction], previous_hash: str,
+                 timestamp: datetime = None, difficulty: int = 0):
         """
         Inicializa um novo bloco.
         
@@ -22,13 +71,133 @@ class Block:
             transactions (List[Transaction]): Lista de transações do bloco
             previous_hash (str): Hash do bloco anterior
             timestamp (datetime, optional): Timestamp do bloco
+            difficulty (int, optional): Dificuldade (em bits) declarada no cabeçalho
         """
         self.index = index
         self.transactions = transactions
         self.previous_hash = previous_hash
         self.timestamp = timestamp or datetime.now()
+        self.difficulty = difficulty
         self.nonce = 0
+        self.merkle_root = self.calculate_merkle_root()
         self.hash = self.calculate_hash()
+        self.mining_result: Optional[MiningResult] = None  # Preenchido por mine_block
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Block':
+        """
+        Reconstrói um bloco a partir do dicionário gerado por to_dict.
+        
+        O hash, a raiz de Merkle e o nonce são restaurados como estão, sem
+        recalcular nada; use is_valid para conferir a integridade.
+        
+        Args:
+            data (dict): Representação do bloco em dicionário
+            
+        Returns:
+            Block: Bloco reconstruído
+        """
+        block = cls.__new__(cls)
+        block.index = data['index']
+        transactions = data['transactions']
+        block.transactions = [Transaction.from_dict(tx) for tx in transactions] if transactions is not None else None
+        block.previous_hash = data['previous_hash']
+        block.timestamp = datetime.fromisoformat(data['timestamp'])
+        block.difficulty = data['difficulty']
+        block.nonce = data['nonce']
+        block.merkle_root = data['merkle_root']
+        block.hash = data['hash']
+        block.mining_result = None
+        return block
+    
+    @property
+    def timestamp(self) -> datetime:
+        """
+        Timestamp do bloco.
+        
+        Returns:
+            datetime: Timestamp reconstruído a partir dos microssegundos armazenados
+        """
+        return expand_timestamp(self._timestamp)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = compact_timestamp(value)
+    
+    @property
+    def is_pruned(self) -> bool:
+        """
+        Indica se as transações do bloco foram descartadas (ver prune).
+        
+        Returns:
+            bool: True se só o cabeçalho do bloco está disponível
+        """
+        return self.transactions is None
+    
+    def prune(self) -> None:
+        """
+        Descarta as transações do bloco, mantendo apenas o cabeçalho.
+        
+        A raiz de Merkle continua no cabeçalho (e entra no hash), então o hash,
+        o encadeamento e o Proof of Work do bloco ainda podem ser verificados.
+        """
+        # A poda mantém o cabeçalho verificável: não conta como alteração de um bloco selado
+        object.__setattr__(self, 'transactions', None)
+    
+    def seal(self) -> None:
+        """
+        Marca o bloco como verificado.
+        
+        A partir daí, alterar um atributo do bloco ou de suas transações incrementa
+        mutation_count, o que faz Blockchain.is_chain_valid revalidar a chain inteira.
+        A lista de transações vira uma tupla, então elas não podem ser trocadas,
+        adicionadas ou removidas. Blocos e transações não selados não têm nenhum custo extra.
+        """
+        if type(self) is Block:
+            self.__class__ = _SealedBlock
+        if isinstance(self.transactions, list):
+            object.__setattr__(self, 'transactions', tuple(self.transactions))
+        for transaction in self.transactions or ():
+            if type(transaction) is Transaction:
+                transaction.__class__ = _SealedTransaction
+    
+    def calculate_merkle_root(self) -> str:
+        """
+        Calcula a raiz de Merkle das transações do bloco.
+        
+        Returns:
+            str: Raiz de Merkle sobre os hashes das transações
+        """
+        return compute_merkle_root([tx.txid for tx in self.transactions])
+    
+    def get_merkle_proof(self, tx_index: int) -> List[Tuple[str, str]]:
+        """
+        Gera a prova de inclusão de uma transação do bloco.
+        
+        Args:
+            tx_index (int): Posição da transação no bloco
+            
+        Returns:
+            List[Tuple[str, str]]: Prova de inclusão (ver merkle.get_merkle_proof)
+        """
+        if self.is_pruned:
+            raise ValueError(f"As transações do bloco {self.index} foram podadas")
+        return get_merkle_proof([tx.txid for tx in self.transactions], tx_index)
+    
+    def _hash_prefix(self) -> bytes:
+        """
+        Serializa a parte invariante do cabeçalho (tudo exceto o nonce).
+        
+        O cabeçalho tem tamanho fixo: as transações entram apenas através da
+        raiz de Merkle, então o hash do bloco não depende do número de transações.
+        A dificuldade usa sempre 3 dígitos para não se misturar com o nonce.
+        
+        Returns:
+            bytes: Prefixo usado como entrada do SHA-256 antes do nonce
+        """
+        header_string = (f"{self.index}{self.previous_hash}{self.merkle_root}"
+                         f"{self.timestamp.isoformat()}{self.difficulty:03d}")
+        return header_string.encode('utf-8')
     
     def calculate_hash(self) -> str:
         """
@@ -37,54 +206,148 @@ class Block:
         Returns:
             str: Hash SHA-256 do bloco
         """
-        # Converte as transações para string
-        transactions_str = json.dumps([tx.to_dict() for tx in self.transactions], 
-                                    sort_keys=True, ensure_ascii=False)
-        
-        # Cria a string do bloco
-        block_string = f"{self.index}{transactions_str}{self.previous_hash}{self.timestamp.isoformat()}{self.nonce}"
-        
-        # Calcula o hash SHA-256
-        return hashlib.sha256(block_string.encode('utf-8')).hexdigest()
+        sha = hashlib.sha256(self._hash_prefix())
+        sha.update(str(self.nonce).encode('utf-8'))
+        return sha.hexdigest()
     
-    def mine_block(self, difficulty: int) -> None:
+    def mine_block(self, difficulty: int, workers: int = 1,
+                   progress_callback: Optional[Callable[[int], None]] = None,
+                   stop_event=None, engine: str = ENGINE_HASHLIB, reporter=None) -> MiningResult:
         """
         Minera o bloco usando Proof of Work.
         
+        O prefixo invariante do bloco é serializado uma única vez e o estado
+        intermediário do SHA-256 (midstate) é copiado a cada tentativa, de modo
+        que o custo por nonce não depende do número de transações. O digest bruto
+        é comparado diretamente com o alvo, sem conversão para hexadecimal.
+        A mineração é silenciosa; use um reporter para acompanhar no console.
+        
         Args:
-            difficulty (int): Dificuldade da mineração (número de zeros no início do hash)
+            difficulty (int): Dificuldade da mineração (número de bits zero no início do hash)
+            workers (int): Número de processos usados na busca (1 = minera no processo atual)
+            progress_callback (Callable[[int], None], optional): Recebe periodicamente o número
+                de tentativas já feitas (e uma última vez ao encontrar o nonce)
+            stop_event (optional): Evento (threading.Event) que cancela a mineração quando sinalizado
+            engine (str): Motor da busca em um único processo: 'hashlib' (padrão) ou 'numpy',
+                que avalia lotes de nonces com SHA-256 vetorizado (usa hashlib se o NumPy
+                não estiver instalado). Ignorado quando workers > 1.
+            reporter (optional): Objeto com on_start, on_progress e on_finish
+                (ex.: mining.ConsoleMiningReporter)
+            
+        Returns:
+            MiningResult: Tentativas, hashrate e tempo de parede (também salvo em mining_result)
+            
+        Raises:
+            MiningCancelled: Se stop_event for sinalizado antes de encontrar o nonce
         """
-        target = "0" * difficulty
+        if engine not in ENGINES:
+            raise ValueError(f"Motor de mineração desconhecido: {engine}")
+        
+        if reporter is not None:
+            reporter.on_start(self, difficulty)
+            
+            def on_progress(attempts: int) -> None:
+                reporter.on_progress(self, attempts)
+                if progress_callback is not None:
+                    progress_callback(attempts)
+        else:
+            on_progress = progress_callback
+        
+        start_time = time.perf_counter()
+        
+        self.difficulty = difficulty
+        if workers > 1:
+            nonce, block_hash, attempts = parallel_search(self._hash_prefix(), difficulty, self.nonce, workers,
+                                                          on_progress, stop_event)
+        elif engine == ENGINE_NUMPY:
+            nonce, block_hash, attempts = search_nonce_batched(self._hash_prefix(), difficulty, self.nonce,
+                                                               progress_callback=on_progress,
+                                                               stop_event=stop_event)
+        else:
+            nonce, block_hash, attempts = self._search_nonce(difficulty, on_progress, stop_event)
         
-        print(f"⛏️  Minerando bloco {self.index}... (Dificuldade: {difficulty})")
-        start_time = datetime.now()
+        elapsed = time.perf_counter() - start_time
+        self.nonce, self.hash = nonce, block_hash
+        self.mining_result = MiningResult(self.index, nonce, block_hash, difficulty, attempts,
+                                          elapsed, workers, engine if workers == 1 else ENGINE_HASHLIB)
         
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        if progress_callback is not None:
+            progress_callback(attempts)
+        if reporter is not None:
+            reporter.on_finish(self, self.mining_result)
+        
+        return self.mining_result
+    
+    def _search_nonce(self, difficulty: int,
+                      progress_callback: Optional[Callable[[int], None]] = None,
+                      stop_event=None) -> Tuple[int, str, int]:
+        """
+        Procura sequencialmente um nonce válido a partir do nonce atual.
+        
+        Args:
+            difficulty (int): Dificuldade em bits
+            progress_callback (Callable[[int], None], optional): Recebe o número de tentativas
+            stop_event (optional): Evento que cancela a mineração quando sinalizado
             
-            # Mostra progresso a cada 10000 tentativas
-            if self.nonce % 10000 == 0:
-                print(f"   Tentativa {self.nonce}... (Hash atual: {self.hash[:16]}...)")
+        Returns:
+            Tuple[int, str, int]: Nonce encontrado, hash correspondente e número de tentativas
+        """
+        max_digest = max_digest_for(difficulty)
+        midstate = hashlib.sha256(self._hash_prefix())
+        start_nonce = self.nonce
+        nonce = start_nonce
         
-        end_time = datetime.now()
-        mining_time = (end_time - start_time).total_seconds()
+        while True:
+            sha = midstate.copy()
+            sha.update(str(nonce).encode('utf-8'))
+            digest = sha.digest()
+            
+            if digest <= max_digest:
+                return nonce, digest.hex(), nonce - start_nonce + 1
+            
+            nonce += 1
+            
+            # Verifica cancelamento e informa o progresso a cada PROGRESS_INTERVAL tentativas
+            if nonce % PROGRESS_INTERVAL == 0:
+                if stop_event is not None and stop_event.is_set():
+                    raise MiningCancelled("Mineração cancelada")
+                if progress_callback is not None:
+                    progress_callback(nonce - start_nonce)
+    
+    def meets_difficulty(self) -> bool:
+        """
+        Verifica se o hash do bloco atende à dificuldade declarada no cabeçalho.
         
-        print(f"✅ Bloco {self.index} minerado com sucesso!")
-        print(f"   ⏱️  Tempo: {mining_time:.2f}s")
-        print(f"   🔑 Hash: {self.hash}")
-        print(f"   🎲 Nonce: {self.nonce}")
-        print(f"   📦 Transações: {len(self.transactions)}")
-        print("   " + "-" * 50)
+        Returns:
+            bool: True se o hash é menor que o alvo, False caso contrário
+        """
+        return hash_meets_difficulty(self.hash, self.difficulty)
     
     def is_valid(self) -> bool:
         """
         Verifica se o bloco é válido.
         
+        Confere o hash do cabeçalho e se a raiz de Merkle corresponde às transações
+        (em blocos podados, apenas o cabeçalho é conferido). Os hashes das transações
+        são recalculados: um txid em cache (ex.: lido do armazenamento) que não
+        confira com a transação também invalida o bloco, assim como transações
+        repetidas: como a árvore duplica o último hash dos níveis ímpares, [a, b, c] e
+        [a, b, c, c] teriam a mesma raiz.
+        
         Returns:
             bool: True se o bloco é válido, False caso contrário
         """
-        return self.hash == self.calculate_hash()
+        if self.hash != self.calculate_hash():
+            return False
+        if self.is_pruned:
+            return True
+        leaves = [tx.calculate_hash() for tx in self.transactions]
+        for transaction, leaf in zip(self.transactions, leaves):
+            if transaction._txid is not None and transaction._txid != leaf:
+                return False
+        if len(set(leaves)) != len(leaves):
+            return False
+        return self.merkle_root == compute_merkle_root(leaves)
     
     def to_dict(self) -> dict:
         """
@@ -96,12 +359,81 @@ class Block:
         return {
             'index': self.index,
             'timestamp': self.timestamp.isoformat(),
-            'transactions': [tx.to_dict() for tx in self.transactions],
+            'transactions': [tx.to_dict() for tx in self.transactions] if not self.is_pruned else None,
             'previous_hash': self.previous_hash,
+            'merkle_root': self.merkle_root,
             'hash': self.hash,
-            'nonce': self.nonce
+            'nonce': self.nonce,
+            'difficulty': self.difficulty
         }
     
+    def to_bytes(self) -> bytes:
+        """
+        Serializa o bloco no formato binário compacto (ver módulo binary).
+        
+        Layout: cabeçalho fixo (versão, índice, timestamp, dificuldade, nonce,
+        raiz de Merkle e hash em bytes), hash anterior com prefixo de tamanho,
+        número de transações (uint32) e as transações (ver transaction.pack_transactions).
+        
+        Returns:
+            bytes: Bloco em formato binário
+        """
+        if self.is_pruned:
+            raise ValueError(f"O bloco {self.index} foi podado e não pode ser serializado em binário")
+        return b''.join([
+            _HEADER.pack(FORMAT_VERSION, self.index, datetime_to_micros(self.timestamp), self.difficulty,
+                         self.nonce, bytes.fromhex(self.merkle_root), bytes.fromhex(self.hash)),
+            pack_string(self.previous_hash),
+            _COUNT.pack(len(self.transactions)),
+            pack_transactions(self.transactions)
+        ])
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Block':
+        """
+        Reconstrói um bloco serializado por to_bytes, sem recalcular hashes (como from_dict).
+        
+        Args:
+            data (bytes): Bloco em formato binário
+            
+        Returns:
+            Block: Bloco reconstruído
+        """
+        block, offset = cls.unpack(data)
+        if offset != len(data):
+            raise ValueError("Bytes extras após o bloco")
+        return block
+    
+    @classmethod
+    def unpack(cls, data: bytes) -> Tuple['Block', int]:
+        """
+        Lê o bloco serializado por to_bytes no início de `data`, que pode ter outros dados depois.
+        
+        Args:
+            data (bytes): Buffer que começa com o bloco em formato binário
+            
+        Returns:
+            Tuple[Block, int]: Bloco reconstruído e a posição logo após ele
+        """
+        version, index, micros, difficulty, nonce, merkle_root, block_hash = _HEADER.unpack_from(data, 0)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versão de formato binário não suportada: {version}")
+        previous_hash, offset = unpack_string(data, _HEADER.size)
+        (count,) = _COUNT.unpack_from(data, offset)
+        transactions, offset = unpack_transactions(data, offset + _COUNT.size, count)
+        
+        block = cls.__new__(cls)
+        block.index = index
+        block.transactions = transactions
+        block.previous_hash = previous_hash
+        block._timestamp = micros
+        block.difficulty = difficulty
+        block.nonce = nonce
+        block.merkle_root = merkle_root.hex()
+        block.hash = block_hash.hex()
+        block.mining_result = None
+        return block, offset
+    
     def to_json(self) -> str:
         """
         Converte o bloco para JSON.
@@ -110,3 +442,15 @@ class Block:
             str: Representação do bloco em JSON
         """
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+
+class _SealedBlock(Block):
+    """
+    Bloco selado: cada atributo alterado é contado em mutation_count.
+    """
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        _record_mutation()
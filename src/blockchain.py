@@ -1,11 +1,81 @@
 """
 Módulo principal da blockchain.
 """
+import heapq
 import json
-from datetime import datetime
-from typing import List, Optional
-from .block import Block
+import math
+import multiprocessing
+import operator
+import struct
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .binary import amount_to_fixed, datetime_to_micros
+from .block import Block, mutation_count
+from .bloom import BloomFilter
+from .mining import ENGINE_HASHLIB, difficulty_to_target, retarget_difficulty
+from .signatures import verify_batch
 from .transaction import Transaction
+from .validation import (RULE_AMOUNT, RULE_BALANCE, RULE_BLOCK, RULE_DUPLICATE, RULE_REWARD, RULE_SIGNATURE,
+                         ValidationReport)
+
+# Na validação paralela, cada worker recebe em média este número de intervalos de blocos
+RANGES_PER_WORKER = 4
+
+
+def _pack_for_worker(block: Block):
+    """
+    Prepara um bloco para ser enviado a um worker da validação paralela.
+    
+    O formato binário é bem mais barato de transferir que o pickle do objeto; blocos
+    que não cabem nele (podados, com valores fora do ponto fixo ou timestamps com fuso
+    horário) ou que não voltam idênticos dele são enviados como objeto. Um hash adulterado
+    com tamanho ou maiúsculas diferentes, por exemplo, seria "corrigido" pelos campos de
+    32 bytes do cabeçalho, e o worker validaria um bloco diferente do original.
+    
+    Args:
+        block (Block): Bloco a enviar
+        
+    Returns:
+        bytes | Block: Bloco serializado com to_bytes, ou o próprio bloco
+    """
+    try:
+        data = block.to_bytes()
+        if Block.from_bytes(data).to_dict() == block.to_dict():
+            return data
+    except (ValueError, struct.error):
+        pass
+    return block
+
+
+def _naive_timestamp(timestamp: datetime) -> datetime:
+    """
+    Converte um timestamp com fuso horário para UTC sem fuso, para compará-lo com os demais.
+    """
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _find_invalid_block(blocks: list) -> Optional[int]:
+    """
+    Verifica hash, raiz de Merkle e Proof of Work de um intervalo de blocos (executada nos workers).
+    
+    Args:
+        blocks (list): Blocos consecutivos, como gerados por _pack_for_worker
+        
+    Returns:
+        Optional[int]: Altura do primeiro bloco que falha, ou None se todos passam
+    """
+    for block in blocks:
+        if isinstance(block, bytes):
+            block = Block.from_bytes(block)
+        if not block.is_valid() or not block.meets_difficulty():
+            return block.index
+    return None
 
 
 class Blockchain:
@@ -13,19 +83,174 @@ class Blockchain:
     Implementação de uma blockchain simples.
     """
     
-    def __init__(self):
+    def __init__(self, difficulty: int = 4, retarget_interval: int = 10, target_block_time: float = 10.0,
+                 reporter=None, store=None, create_genesis: bool = True, prune_depth: int = 0,
+                 mempool_log=None, checkpoint_interval: int = 100, require_signatures: bool = False,
+                 signature_workers: int = 1, signature_cache_size: int = 100000, txid_bloom_capacity: int = 0,
+                 txid_bloom_error_rate: float = 0.001, max_clock_skew: float = 7200.0):
         """
         Inicializa a blockchain com o bloco gênesis.
+        
+        Args:
+            difficulty (int): Dificuldade inicial em bits (4 bits = 1 zero hexadecimal),
+                reduzida por padrão para testes mais rápidos
+            retarget_interval (int): A dificuldade é reajustada a cada N blocos (0 desativa)
+            target_block_time (float): Tempo desejado entre blocos, em segundos
+            reporter (optional): Reporter usado em todas as minerações (ex.: mining.ConsoleMiningReporter).
+                Sem reporter, a blockchain não imprime nada ao minerar.
+            store (optional): Armazenamento persistente (ex.: storage.BlockStore). Se já tiver
+                blocos, a chain é carregada dele em vez de minerar um novo gênesis; cada
+                bloco minerado é gravado nele. Um store com serves_chain (ex.:
+                sqlite_storage.SQLiteBlockStore) é usado diretamente como a chain, e com
+                serves_queries ele responde saldos e históricos no lugar dos índices em memória.
+            create_genesis (bool): Se False, a chain começa vazia em vez de minerar o gênesis
+                (usado por from_blocks para importar uma chain existente)
+            prune_depth (int): Se maior que 0, só os últimos prune_depth blocos mantêm as
+                transações; os mais antigos ficam apenas com o cabeçalho e seus efeitos são
+                guardados em um snapshot de saldos (0 desativa a poda). Os ids das transações
+                podadas saem do índice depois de max_clock_skew, e transações com timestamp até
+                o da transação podada mais recente (replay_horizon) passam a ser rejeitadas
+            mempool_log (optional): Log durável das transações pendentes (ex.:
+                mempool_log.MempoolLog). As transações registradas são recuperadas ao iniciar
+                e add_transaction só retorna depois que a transação está em disco.
+            checkpoint_interval (int): A cada N blocos é guardado o saldo dos endereços que
+                mudaram, usado por get_balance(address, at_height=...) para consultas históricas
+            require_signatures (bool): Se True, add_transaction só aceita transações assinadas pela
+                carteira do remetente (ver signatures.KeyPair), e append_block e validate_semantics
+                verificam as assinaturas dos blocos
+            signature_workers (int): Processos usados para verificar as assinaturas de blocos com
+                muitas transações
+            signature_cache_size (int): Número máximo de ids de transações com assinatura já
+                verificada guardados em cache (os mais antigos são descartados primeiro)
+            txid_bloom_capacity (int): Se maior que 0, os ids das transações da chain ficam em um
+                filtro de Bloom para essa quantidade de ids (memória fixa) em vez de um dicionário
+                id -> (altura, posição). Replays continuam rejeitados em O(1), mas uma transação
+                nova é rejeitada com probabilidade txid_bloom_error_rate e get_transaction
+                percorre a chain para localizar as transações (0 usa o dicionário)
+            txid_bloom_error_rate (float): Taxa de falsos positivos do filtro de Bloom
+            max_clock_skew (float): Diferença máxima, em segundos, entre o timestamp de uma
+                transação e o relógio do nó para que add_transaction a aceite; também é a margem
+                com que os ids podados continuam no índice (ver replay_horizon)
         """
-        self.chain: List[Block] = []
-        self.difficulty = 1  # Dificuldade reduzida para testes mais rápidos
+        if retarget_interval == 1 or retarget_interval < 0:
+            raise ValueError("O intervalo de reajuste deve ser 0 (desativado) ou pelo menos 2")
+        if prune_depth < 0:
+            raise ValueError("A profundidade de poda deve ser >= 0")
+        if prune_depth and getattr(store, 'serves_chain', False):
+            raise ValueError("A poda só é suportada com a chain em memória")
+        if checkpoint_interval < 1:
+            raise ValueError("O intervalo de checkpoints deve ser >= 1")
+        if signature_cache_size < 0:
+            raise ValueError("O cache de assinaturas deve ser >= 0")
+        if max_clock_skew <= 0:
+            raise ValueError("A diferença máxima de relógio deve ser > 0")
+        if txid_bloom_capacity and getattr(store, 'serves_queries', False):
+            raise ValueError("O filtro de Bloom de ids só é usado com os índices em memória")
+        
+        self.chain: List[Block] = store if getattr(store, 'serves_chain', False) else []
+        self.initial_difficulty = difficulty
+        self.difficulty = difficulty  # Dificuldade do próximo bloco
+        self.min_difficulty = 1
+        self.retarget_interval = retarget_interval
+        self.target_block_time = target_block_time
         self.pending_transactions: List[Transaction] = []
         self.mining_reward = 10  # Recompensa por minerar um bloco
+        self.reporter = reporter
+        self.store = store
+        self.balances: Dict[Optional[str], float] = {}  # Índice endereço -> saldo
+        self.address_index: Dict[str, List[Tuple[int, int]]] = {}  # Endereço -> [(bloco, posição)]
+        self.prune_depth = prune_depth
+        self.pruned_height = 0  # Blocos abaixo desta altura só têm o cabeçalho
+        self.pruned_balances: Dict[Optional[str], float] = {}  # Saldos até pruned_height
+        self.pruned_transaction_count = 0
+        self.replay_horizon: Optional[datetime] = None  # Timestamp da transação podada mais recente
+        self.max_clock_skew = max_clock_skew
+        # (timestamp, id, (altura, posição)) das transações podadas cujo id continua no índice,
+        # em um heap: saem quando ficam mais de max_clock_skew antes de replay_horizon
+        self._pruned_ids: List[Tuple[datetime, str, Tuple[int, int]]] = []
+        self.mempool_log = mempool_log
+        self.checkpoint_interval = checkpoint_interval
+        # Endereço -> [(altura, saldo antes do bloco dessa altura)], só nas alturas múltiplas de
+        # checkpoint_interval em que o saldo do endereço mudou desde o checkpoint anterior
+        self.balance_checkpoints: Dict[Optional[str], List[Tuple[int, float]]] = {}
+        self._checkpoint_changes: set = set()  # Endereços alterados desde o último checkpoint
+        self._checkpoint_base = 0  # Altura a partir da qual os checkpoints estão completos
+        # Validação incremental: blocos 0..validated_height-1 de _validated_chain já foram
+        # verificados, e nenhum bloco selado foi alterado desde então (mutation_count)
+        self.validated_height = 0
+        self._validated_chain = None
+        self._validated_mutations = 0
+        self._validated_tip: Optional[str] = None
+        self._validated_blocks: List[Block] = []  # Blocos verificados de uma chain em memória (identidade)
+        self.require_signatures = require_signatures
+        self.signature_workers = signature_workers
+        self.signature_cache_size = signature_cache_size
+        # Ids das transações cuja assinatura já foi verificada, do uso mais antigo para o mais recente
+        self._verified_transactions: "OrderedDict[str, None]" = OrderedDict()
+        # Ids das transações pendentes, inclusive as do bloco em mineração (evita duplicatas)
+        self.mempool_ids: set = set()
+        # Id -> (altura, posição) das transações da chain, ou só um filtro de Bloom dos ids
+        self.transaction_index: Dict[str, Tuple[int, int]] = {}
+        self.txid_bloom_capacity = txid_bloom_capacity
+        self.txid_bloom_error_rate = txid_bloom_error_rate
+        self.txid_bloom = BloomFilter(txid_bloom_capacity, txid_bloom_error_rate) if txid_bloom_capacity else None
+        self._lock = threading.RLock()  # Protege chain e pending_transactions entre threads
+        
+        if store is not None and not store.is_empty():
+            self.load_from_store()
         
-        # Cria o bloco gênesis
-        self.create_genesis_block()
-        print("✅ Blockchain inicializada com sucesso!")
-        print(f"📦 Bloco gênesis criado (Hash: {self.chain[0].hash[:16]}...)")
+        if not self.chain and create_genesis:
+            # Cria o bloco gênesis
+            self.create_genesis_block()
+        
+        if mempool_log is not None:
+            self._replay_mempool()
+    
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[Block], **options) -> 'Blockchain':
+        """
+        Constrói uma blockchain a partir de blocos já minerados, validando cada um ao adicioná-lo.
+        
+        Os blocos são consumidos um a um: com um gerador (ex.: chain_io.iter_blocks) e um
+        store que serve a chain (mmap ou SQLite), a memória usada não depende do tamanho da chain.
+        
+        Args:
+            blocks (Iterable[Block]): Blocos em ordem, começando pelo gênesis
+            **options: Argumentos de Blockchain (retarget_interval, target_block_time, store...)
+            
+        Returns:
+            Blockchain: Blockchain com os blocos importados
+            
+        Raises:
+            ValueError: Se algum bloco for inválido ou não houver blocos
+        """
+        blockchain = cls(create_genesis=False, **options)
+        for block in blocks:
+            blockchain.append_block(block)
+        if not blockchain.chain:
+            raise ValueError("Nenhum bloco para importar")
+        return blockchain
+    
+    @classmethod
+    def from_dict(cls, data: dict, **options) -> 'Blockchain':
+        """
+        Reconstrói uma blockchain a partir do dicionário gerado por to_dict (ou GET /blockchain).
+        
+        Args:
+            data (dict): Representação da blockchain em dicionário
+            **options: Argumentos de Blockchain que não fazem parte do dicionário
+                (retarget_interval, target_block_time, store...)
+            
+        Returns:
+            Blockchain: Blockchain reconstruída e validada
+            
+        Raises:
+            ValueError: Se algum bloco for inválido
+        """
+        blockchain = cls.from_blocks((Block.from_dict(block) for block in data['chain']), **options)
+        blockchain.mining_reward = data.get('mining_reward', blockchain.mining_reward)
+        blockchain._reset_mempool([Transaction.from_dict(tx) for tx in data.get('pending_transactions', [])])
+        return blockchain
     
     def create_genesis_block(self) -> None:
         """
@@ -33,8 +258,60 @@ class Blockchain:
         """
         genesis_transaction = Transaction("Genesis", "Genesis", 0)
         genesis_block = Block(0, [genesis_transaction], "0")
-        genesis_block.mine_block(self.difficulty)
-        self.chain.append(genesis_block)
+        genesis_block.mine_block(self.initial_difficulty, reporter=self.reporter)
+        self._append_block(genesis_block)
+        self.difficulty = self.get_difficulty_for_height(len(self.chain))
+    
+    def load_from_store(self) -> None:
+        """
+        Carrega a chain do armazenamento persistente e reconstrói os índices.
+        
+        Os blocos são lidos sequencialmente sem recalcular hashes; use
+        is_chain_valid para verificar a integridade após carregar.
+        """
+        with self._lock:
+            if self.chain is not self.store:
+                self.chain = list(self.store.load())
+            if not self.chain:
+                return
+            self.initial_difficulty = self.chain[0].difficulty
+            self.rebuild_indexes()
+            self.difficulty = self.get_difficulty_for_height(len(self.chain))
+    
+    def _replay_mempool(self) -> None:
+        """
+        Recupera as transações pendentes do log, descartando as que já foram mineradas.
+        
+        Um bloco pode ter sido gravado logo antes de uma queda, sem que o log fosse
+        reescrito; as transações dos blocos acima da altura registrada no log são ignoradas.
+        """
+        height, transactions = self.mempool_log.replay()
+        if not transactions:
+            return
+        
+        mined = set()
+        for block_height in range(height, len(self.chain)):
+            block = self.chain[block_height]
+            if not block.is_pruned:
+                mined.update(tx.txid for tx in block.transactions)
+        
+        self._reset_mempool([tx for tx in transactions if tx.txid not in mined])
+    
+    def _reset_mempool(self, transactions: List[Transaction]) -> None:
+        """
+        Substitui as transações pendentes, descartando as repetidas.
+        
+        Args:
+            transactions (List[Transaction]): Novas transações pendentes, em ordem
+        """
+        with self._lock:
+            self.pending_transactions = []
+            self.mempool_ids = set()
+            for transaction in transactions:
+                transaction_id = transaction.txid
+                if transaction_id not in self.mempool_ids:
+                    self.mempool_ids.add(transaction_id)
+                    self.pending_transactions.append(transaction)
     
     def print_blockchain(self) -> None:
         """
@@ -50,6 +327,9 @@ class Blockchain:
             print(f"   Hash Anterior: {block.previous_hash}")
             print(f"   Timestamp: {block.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"   Nonce: {block.nonce}")
+            if block.is_pruned:
+                print("   Transações: podadas")
+                continue
             print(f"   Transações: {len(block.transactions)}")
             
             for j, tx in enumerate(block.transactions):
@@ -63,7 +343,7 @@ class Blockchain:
         print(f"\n📊 ESTATÍSTICAS:")
         print(f"   Total de blocos: {len(self.chain)}")
         print(f"   Transações pendentes: {len(self.pending_transactions)}")
-        print(f"   Dificuldade: {self.difficulty}")
+        print(f"   Dificuldade: {self.difficulty} bits")
         print(f"   Recompensa de mineração: {self.mining_reward}")
         print("="*60)
     
@@ -71,27 +351,59 @@ class Blockchain:
         """
         Imprime os saldos de todos os endereços.
         """
-        addresses = set()
-        
-        # Coleta todos os endereços únicos
-        for block in self.chain:
-            for tx in block.transactions:
-                if tx.sender and tx.sender != "Genesis":
-                    addresses.add(tx.sender)
-                if tx.recipient and tx.recipient != "Genesis":
-                    addresses.add(tx.recipient)
+        # Endereços únicos vêm do índice de saldos
+        balances = self.get_all_balances()
+        addresses = {address for address in balances if address and address != "Genesis"}
         
         print("\n" + "="*40)
         print("💰 SALDOS DOS ENDEREÇOS")
         print("="*40)
         
         for address in sorted(addresses):
-            balance = self.get_balance(address)
+            balance = balances[address]
             emoji = "💚" if balance > 0 else "❌" if balance < 0 else "⚪"
             print(f"{emoji} {address}: {balance}")
         
         print("="*40)
     
+    @property
+    def target(self) -> int:
+        """
+        Alvo numérico correspondente à dificuldade atual.
+        
+        Returns:
+            int: Alvo; hashes menores que ele são válidos
+        """
+        return difficulty_to_target(self.difficulty)
+    
+    def get_difficulty_for_height(self, height: int) -> int:
+        """
+        Calcula a dificuldade esperada para o bloco de uma altura.
+        
+        A cada retarget_interval blocos, o tempo entre o primeiro e o último bloco
+        da janela anterior (pelos timestamps dos blocos) é comparado com o tempo
+        esperado e a dificuldade é ajustada. Nas demais alturas ela é mantida.
+        
+        Args:
+            height (int): Altura (índice) do bloco
+            
+        Returns:
+            int: Dificuldade esperada em bits
+        """
+        if height == 0:
+            return self.initial_difficulty
+        
+        previous_block = self.chain[height - 1]
+        if not self.retarget_interval or height % self.retarget_interval != 0:
+            return previous_block.difficulty
+        
+        first_block = self.chain[height - self.retarget_interval]
+        actual_timespan = (previous_block.timestamp - first_block.timestamp).total_seconds()
+        expected_timespan = self.target_block_time * (self.retarget_interval - 1)
+        
+        return retarget_difficulty(previous_block.difficulty, actual_timespan,
+                                   expected_timespan, self.min_difficulty)
+    
     def get_latest_block(self) -> Block:
         """
         Retorna o último bloco da chain.
@@ -105,90 +417,814 @@ class Blockchain:
         """
         Adiciona uma transação à lista de transações pendentes.
         
+        Com mempool_log, a transação é gravada no log e o método só retorna depois
+        do fsync, que é compartilhado com as transações adicionadas ao mesmo tempo.
+        
+        Com require_signatures, a assinatura é verificada aqui, uma única vez: o id da
+        transação fica em cache e a validação do bloco que a incluir não a verifica de novo.
+        
+        Transações repetidas (mesmo txid) são rejeitadas em O(1), estejam pendentes ou
+        já na chain (replay). Com a poda, os ids dos blocos podados saem do índice e as
+        transações com timestamp até replay_horizon são rejeitadas no lugar deles.
+        
+        O timestamp é escolhido pelo cliente, então só é aceito a até max_clock_skew
+        segundos do relógio do nó: uma transação datada no futuro não pode empurrar o
+        horizonte de replay e bloquear as transações seguintes.
+        
+        O valor precisa caber no formato binário (no máximo 8 casas decimais) e o timestamp
+        não pode ter fuso horário, para que o bloco que incluir a transação possa ser gravado
+        em qualquer armazenamento.
+        
         Args:
             transaction (Transaction): Transação a ser adicionada
+            
+        Raises:
+            ValueError: Se o valor ou o timestamp não cabem no formato binário, se o timestamp
+                está fora da janela de max_clock_skew, se a transação já é conhecida, é anterior ao horizonte
+                de replay ou, com as assinaturas obrigatórias, se a assinatura é inválida
         """
-        self.pending_transactions.append(transaction)
+        amount_to_fixed(transaction.amount)
+        datetime_to_micros(transaction.timestamp)
+        skew = abs(_naive_timestamp(transaction.timestamp) - datetime.now())
+        if skew > timedelta(seconds=self.max_clock_skew):
+            raise ValueError(f"Timestamp da transação a mais de {self.max_clock_skew:g} s do relógio do nó")
+        transaction_id = transaction.txid
+        if self.require_signatures:
+            if transaction.sender is None or not transaction.verify_signature():
+                raise ValueError("Assinatura da transação ausente ou inválida")
+        
+        with self._lock:
+            if transaction_id in self.mempool_ids:
+                raise ValueError(f"Transação {transaction_id} já está pendente")
+            if self._transaction_seen(transaction_id):
+                raise ValueError(f"Transação {transaction_id} já está na chain")
+            if self._before_replay_horizon(transaction):
+                raise ValueError(f"Transação {transaction_id} é anterior ao horizonte de replay "
+                                 f"({self.replay_horizon.isoformat()})")
+            self.mempool_ids.add(transaction_id)
+            if self.require_signatures:
+                self._remember_verified([transaction_id])
+            self.pending_transactions.append(transaction)
+            ticket = self.mempool_log.append(transaction) if self.mempool_log is not None else None
+        
+        # Espera o disco fora do lock, para que outras transações entrem no mesmo fsync
+        if ticket is not None:
+            self.mempool_log.wait_durable(ticket)
     
-    def mine_pending_transactions(self, mining_reward_address: str) -> Block:
+    def mine_pending_transactions(self, mining_reward_address: str, workers: int = 1,
+                                  progress_callback: Optional[Callable[[int], None]] = None,
+                                  stop_event=None, engine: str = ENGINE_HASHLIB) -> Block:
         """
         Minera todas as transações pendentes e adiciona um novo bloco à chain.
         
+        Se a mineração ou a gravação do bloco falhar, as transações voltam a ficar pendentes.
+        
         Args:
             mining_reward_address (str): Endereço que receberá a recompensa da mineração
+            workers (int): Número de processos usados na mineração (1 = sem paralelismo)
+            progress_callback (Callable[[int], None], optional): Recebe o número de tentativas
+            stop_event (optional): Evento que cancela a mineração; as transações voltam a ficar pendentes
+            engine (str): Motor de busca de nonce ('hashlib' ou 'numpy'), ver Block.mine_block
             
         Returns:
             Block: Novo bloco minerado
+            
+        Raises:
+            MiningCancelled: Se a mineração for cancelada por stop_event
         """
-        # Adiciona a transação de recompensa
-        reward_transaction = Transaction(None, mining_reward_address, self.mining_reward)
-        self.pending_transactions.append(reward_transaction)
+        new_block = self.prepare_block(mining_reward_address)
         
-        # Cria um novo bloco
-        new_block = Block(
-            len(self.chain),
-            self.pending_transactions,
-            self.get_latest_block().hash
-        )
+        # Minera o bloco fora do lock, para que leituras e novas transações não esperem
+        try:
+            new_block.mine_block(new_block.difficulty, workers=workers,
+                                 progress_callback=progress_callback, stop_event=stop_event,
+                                 engine=engine, reporter=self.reporter)
+            self.add_mined_block(new_block)
+        except BaseException:
+            self.restore_transactions(new_block)
+            raise
+        return new_block
+    
+    def prepare_block(self, mining_reward_address: str) -> Block:
+        """
+        Retira as transações pendentes e monta o próximo bloco (ainda não minerado).
         
-        # Minera o bloco
-        new_block.mine_block(self.difficulty)
+        Args:
+            mining_reward_address (str): Endereço que receberá a recompensa da mineração
+            
+        Returns:
+            Block: Bloco candidato com a recompensa e a dificuldade esperada
+        """
+        with self._lock:
+            # Adiciona a transação de recompensa
+            reward_transaction = Transaction(None, mining_reward_address, self.mining_reward)
+            self.pending_transactions.append(reward_transaction)
+            
+            # Cria um novo bloco
+            height = len(self.chain)
+            new_block = Block(
+                height,
+                self.pending_transactions,
+                self.get_latest_block().hash,
+                difficulty=self.get_difficulty_for_height(height)
+            )
+            
+            # Limpa as transações pendentes
+            self.pending_transactions = []
+            
+            return new_block
+    
+    def add_mined_block(self, block: Block) -> None:
+        """
+        Adiciona um bloco minerado à chain e reajusta a dificuldade do próximo.
         
-        # Adiciona o bloco à chain
-        self.chain.append(new_block)
+        Args:
+            block (Block): Bloco minerado a partir de prepare_block
+            
+        Raises:
+            ValueError: Se a chain avançou enquanto o bloco era minerado
+        """
+        with self._lock:
+            if block.index != len(self.chain) or block.previous_hash != self.get_latest_block().hash:
+                raise ValueError("A chain mudou durante a mineração; o bloco não se encaixa mais no topo")
+            
+            self._append_block(block)
+            self.difficulty = self.get_difficulty_for_height(len(self.chain))
+            
+            # As transações do bloco saem do log; as que chegaram durante a mineração continuam
+            if self.mempool_log is not None:
+                self.mempool_log.rewrite(len(self.chain), self.pending_transactions)
+    
+    def _append_block(self, block: Block) -> None:
+        """
+        Grava o bloco no armazenamento (se houver), adiciona-o à chain e atualiza os índices.
         
-        # Limpa as transações pendentes
-        self.pending_transactions = []
+        Args:
+            block (Block): Bloco que passa a ser o topo da chain
+        """
+        if self.store is not None:
+            self.store.append(block)
+        if self.chain is not self.store:
+            self.chain.append(block)
+        if self.mempool_ids:
+            # As transações mineradas saem do mempool (o cache de assinaturas as mantém,
+            # para que validate_semantics não as verifique de novo)
+            for transaction in block.transactions:
+                self.mempool_ids.discard(transaction.txid)
+        self._index_block(block)
+        if self.prune_depth:
+            self._prune()
+    
+    def _store_serves_queries(self) -> bool:
+        """
+        Indica se saldos e históricos são respondidos pelo armazenamento.
         
-        return new_block
+        Returns:
+            bool: True se o store tem serves_queries
+        """
+        return getattr(self.store, 'serves_queries', False)
     
-    def get_balance(self, address: str) -> float:
+    def append_block(self, block: Block) -> None:
         """
-        Calcula o saldo de um endereço.
+        Valida um bloco recebido já minerado (ex.: importado) e o adiciona ao topo da chain.
+        
+        Args:
+            block (Block): Próximo bloco da chain (o primeiro deve ser o gênesis)
+            
+        Raises:
+            ValueError: Se o bloco não for o próximo da chain ou for inválido
+        """
+        with self._lock:
+            if block.index != len(self.chain):
+                raise ValueError(f"Esperado o bloco {len(self.chain)}, recebido {block.index}")
+            if block.is_pruned:
+                raise ValueError(f"Bloco {block.index} não tem transações (podado)")
+            
+            if block.index == 0:
+                # O gênesis define a dificuldade inicial da chain importada
+                self.initial_difficulty = block.difficulty
+                previous_block = None
+            else:
+                previous_block = self.get_latest_block()
+            
+            transaction_ids = [transaction.txid for transaction in block.transactions]
+            error = self._block_error(block, previous_block)
+            if error is None:
+                error = self._replay_error(block, transaction_ids)
+            if error is None and self.require_signatures:
+                error = self._signature_error(block)
+            if error is not None:
+                raise ValueError(error)
+            
+            included = self.mempool_ids.intersection(transaction_ids)
+            self._append_block(block)
+            self.difficulty = self.get_difficulty_for_height(len(self.chain))
+            
+            # Transações pendentes que vieram no bloco recebido não podem ser mineradas de novo
+            if included:
+                self.pending_transactions = [tx for tx in self.pending_transactions if tx.txid not in included]
+                if self.mempool_log is not None:
+                    self.mempool_log.rewrite(len(self.chain), self.pending_transactions)
+    
+    def _transaction_seen(self, transaction_id: str) -> bool:
+        """
+        Indica se uma transação já está na chain, em O(1).
+        
+        Com o filtro de Bloom, pode responder True para uma transação nova (falso positivo).
+        
+        Args:
+            transaction_id (str): Id da transação (ver Transaction.txid)
+            
+        Returns:
+            bool: True se o id já foi visto na chain
+        """
+        if self._store_serves_queries():
+            return self.store.find_transaction(transaction_id) is not None
+        if self.txid_bloom is not None:
+            return transaction_id in self.txid_bloom
+        return transaction_id in self.transaction_index
+    
+    def _before_replay_horizon(self, transaction: Transaction, in_block: bool = False) -> bool:
+        """
+        Indica se a transação não é mais recente que as transações podadas.
+        
+        Os ids dos blocos podados saem do índice, então uma transação assim poderia
+        ser o replay de uma transação podada. Em um bloco, uma transação legítima pode ter
+        ficado pendente enquanto outras mais novas eram mineradas e podadas: o limite recua
+        max_clock_skew, e os ids podados dentro dessa margem continuam no índice (ver _prune).
+        
+        Args:
+            transaction (Transaction): Transação verificada
+            in_block (bool): Se a transação vem de um bloco (e não da entrada do mempool)
+            
+        Returns:
+            bool: True se o timestamp da transação é <= replay_horizon (ou, em um bloco,
+                anterior a replay_horizon - max_clock_skew)
+        """
+        horizon = self.replay_horizon
+        if horizon is None:
+            return False
+        timestamp = _naive_timestamp(transaction.timestamp)
+        if in_block:
+            return timestamp < horizon - timedelta(seconds=self.max_clock_skew)
+        return timestamp <= horizon
+    
+    def _replay_error(self, block: Block, transaction_ids: List[str]) -> Optional[str]:
+        """
+        Verifica se um bloco recebido repete transações do próprio bloco ou da chain.
+        
+        Com o filtro de Bloom, só as repetições dentro do bloco são rejeitadas: um falso
+        positivo não pode recusar um bloco válido. Transações anteriores ao horizonte de
+        replay (ver prune_depth) também são rejeitadas.
+        
+        Args:
+            block (Block): Bloco verificado
+            transaction_ids (List[str]): Ids das transações do bloco, na ordem
+            
+        Returns:
+            Optional[str]: Mensagem da primeira transação repetida, ou None
+        """
+        exact = self.txid_bloom is None
+        seen = set()
+        for position, transaction_id in enumerate(transaction_ids):
+            if transaction_id in seen or (exact and self._transaction_seen(transaction_id)):
+                return f"Bloco {block.index}, transação {position}: transação repetida ({transaction_id})"
+            if self._before_replay_horizon(block.transactions[position], in_block=True):
+                return (f"Bloco {block.index}, transação {position}: anterior ao horizonte de replay "
+                        f"({self.replay_horizon.isoformat()})")
+            seen.add(transaction_id)
+        return None
+    
+    def restore_transactions(self, block: Block) -> None:
+        """
+        Devolve as transações de um bloco não minerado para a lista de pendentes.
+        
+        A transação de recompensa é descartada e as transações devolvidas ficam
+        antes das que chegaram durante a mineração. Só voltam as transações cujo id
+        continua no mempool: as que entraram na chain em outro bloco (append_block)
+        enquanto este era minerado são descartadas.
+        
+        Args:
+            block (Block): Bloco obtido em prepare_block
+        """
+        with self._lock:
+            restored = [tx for tx in block.transactions
+                        if tx.sender is not None and tx.txid in self.mempool_ids]
+            self.pending_transactions = restored + self.pending_transactions
+    
+    def _index_block(self, block: Block) -> None:
+        """
+        Atualiza os índices da blockchain com as transações de um bloco adicionado.
+        
+        Args:
+            block (Block): Bloco recém-adicionado à chain
+        """
+        if self._store_serves_queries():
+            return
+        
+        balances = self.balances
+        address_index = self.address_index
+        transaction_index = self.transaction_index
+        bloom = self.txid_bloom
+        changes = self._checkpoint_changes
+        for position, transaction in enumerate(block.transactions):
+            balances[transaction.sender] = balances.get(transaction.sender, 0) - transaction.amount
+            balances[transaction.recipient] = balances.get(transaction.recipient, 0) + transaction.amount
+            
+            # Histórico por endereço (uma entrada por transação, mesmo se enviar para si mesmo)
+            entry = (block.index, position)
+            if transaction.sender is not None:
+                address_index.setdefault(transaction.sender, []).append(entry)
+            if transaction.recipient is not None and transaction.recipient != transaction.sender:
+                address_index.setdefault(transaction.recipient, []).append(entry)
+            
+            # Índice de ids (a primeira ocorrência vale, se uma chain antiga tiver repetições)
+            if bloom is not None:
+                bloom.add(transaction.txid)
+            else:
+                transaction_index.setdefault(transaction.txid, entry)
+            
+            changes.add(transaction.sender)
+            changes.add(transaction.recipient)
+        
+        height = block.index + 1
+        if height % self.checkpoint_interval == 0:
+            for address in changes:
+                self.balance_checkpoints.setdefault(address, []).append((height, balances[address]))
+            changes.clear()
+    
+    def _prune(self) -> None:
+        """
+        Poda os blocos mais antigos que prune_depth, incorporando-os ao snapshot de saldos.
+        
+        replay_horizon avança até o timestamp mais recente entre as transações podadas,
+        limitado ao timestamp do bloco: uma transação datada no futuro não bloqueia as
+        seguintes. Os ids podados saem do índice quando ficam mais de max_clock_skew antes
+        do horizonte (o filtro de Bloom não remove ids).
+        """
+        prune_until = len(self.chain) - self.prune_depth
+        while self.pruned_height < prune_until:
+            block = self.chain[self.pruned_height]
+            snapshot = self.pruned_balances
+            removed: Dict[str, int] = {}
+            horizon = self.replay_horizon
+            block_time = _naive_timestamp(block.timestamp)
+            for position, transaction in enumerate(block.transactions):
+                snapshot[transaction.sender] = snapshot.get(transaction.sender, 0) - transaction.amount
+                snapshot[transaction.recipient] = snapshot.get(transaction.recipient, 0) + transaction.amount
+                
+                # Só agenda a remoção do id se a entrada for deste bloco (a primeira ocorrência vale)
+                timestamp = _naive_timestamp(transaction.timestamp)
+                entry = (block.index, position)
+                if self.transaction_index.get(transaction.txid) == entry:
+                    heapq.heappush(self._pruned_ids, (timestamp, transaction.txid, entry))
+                if horizon is None or min(timestamp, block_time) > horizon:
+                    horizon = min(timestamp, block_time)
+                
+                # Mesmas regras de _index_block: as entradas do bloco são as primeiras de cada endereço
+                if transaction.sender is not None:
+                    removed[transaction.sender] = removed.get(transaction.sender, 0) + 1
+                if transaction.recipient is not None and transaction.recipient != transaction.sender:
+                    removed[transaction.recipient] = removed.get(transaction.recipient, 0) + 1
+            
+            for address, count in removed.items():
+                entries = self.address_index.get(address)
+                if entries is None:
+                    continue
+                del entries[:count]
+                if not entries:
+                    del self.address_index[address]
+            
+            self.replay_horizon = horizon
+            self._forget_pruned_ids()
+            self.pruned_transaction_count += len(block.transactions)
+            block.prune()
+            self.pruned_height += 1
+    
+    def _forget_pruned_ids(self) -> None:
+        """
+        Remove do índice os ids podados mais de max_clock_skew antes de replay_horizon.
+        
+        Os replays dessas transações já são rejeitados pelo horizonte, tanto na entrada
+        do mempool quanto em blocos recebidos.
+        """
+        if self.replay_horizon is None:
+            return
+        cutoff = self.replay_horizon - timedelta(seconds=self.max_clock_skew)
+        pruned_ids = self._pruned_ids
+        while pruned_ids and pruned_ids[0][0] < cutoff:
+            _, transaction_id, entry = heapq.heappop(pruned_ids)
+            if self.transaction_index.get(transaction_id) == entry:
+                del self.transaction_index[transaction_id]
+    
+    def rebuild_indexes(self) -> None:
+        """
+        Reconstrói os índices percorrendo a chain (ex.: após carregar blocos).
+        
+        Os blocos podados não são percorridos: os saldos partem do snapshot da poda
+        e as consultas históricas e os ids de transações só ficam disponíveis a partir
+        de pruned_height.
+        """
+        with self._lock:
+            self.balances = dict(self.pruned_balances)
+            self.address_index = {}
+            self.transaction_index = {}
+            self._pruned_ids = []
+            if self.txid_bloom is not None:
+                self.txid_bloom = BloomFilter(self.txid_bloom_capacity, self.txid_bloom_error_rate)
+            # O snapshot da poda funciona como checkpoint inicial do histórico
+            self.balance_checkpoints = {
+                address: [(self.pruned_height, balance)] for address, balance in self.pruned_balances.items()
+            }
+            self._checkpoint_changes = set()
+            self._checkpoint_base = self.pruned_height
+            if not self._store_serves_queries():
+                for height in range(self.pruned_height, len(self.chain)):
+                    self._index_block(self.chain[height])
+            if self.prune_depth:
+                self._prune()
+    
+    def get_balance(self, address: str, at_height: Optional[int] = None) -> float:
+        """
+        Retorna o saldo de um endereço em O(1), a partir do índice de saldos.
+        
+        O índice é atualizado a cada bloco adicionado e segue as mesmas regras de
+        percorrer a chain: o remetente perde o valor e o destinatário recebe.
+        
+        Com at_height, retorna o saldo logo após o bloco dessa altura: parte do
+        checkpoint anterior e reaplica no máximo checkpoint_interval - 1 blocos.
         
         Args:
             address (str): Endereço para calcular o saldo
+            at_height (int, optional): Altura do último bloco considerado
             
         Returns:
             float: Saldo do endereço
+            
+        Raises:
+            ValueError: Se a altura estiver fora da chain ou os blocos necessários tiverem sido podados
         """
-        balance = 0
+        if at_height is not None:
+            if not 0 <= at_height < len(self.chain):
+                raise ValueError(f"Altura {at_height} fora da chain (0 a {len(self.chain) - 1})")
+            if self._store_serves_queries():
+                return self.store.get_balance(address, at_height)
+            return self._get_balance_at(address, at_height)
         
-        # Percorre todos os blocos da chain
-        for block in self.chain:
-            for transaction in block.transactions:
-                # Se o endereço é o remetente, subtrai o valor
-                if transaction.sender == address:
-                    balance -= transaction.amount
-                
-                # Se o endereço é o destinatário, adiciona o valor
-                if transaction.recipient == address:
-                    balance += transaction.amount
+        if self._store_serves_queries():
+            return self.store.get_balance(address)
+        return self.balances.get(address, 0)
+    
+    def _get_balance_at(self, address: str, at_height: int) -> float:
+        """
+        Calcula o saldo histórico a partir dos checkpoints.
+        
+        Args:
+            address (str): Endereço consultado
+            at_height (int): Altura do último bloco considerado
+            
+        Returns:
+            float: Saldo do endereço logo após o bloco at_height
+        """
+        with self._lock:
+            end = at_height + 1  # Número de blocos aplicados
+            if end < self._checkpoint_base:
+                raise ValueError(f"Histórico de saldos disponível só a partir da altura {self._checkpoint_base - 1}")
+            
+            start = max(end - end % self.checkpoint_interval, self._checkpoint_base)
+            # Sem checkpoint até start, o endereço ainda não tinha movimentado
+            balance = 0
+            history = self.balance_checkpoints.get(address)
+            if history:
+                position = bisect_right(history, (start, math.inf))
+                if position:
+                    balance = history[position - 1][1]
+            
+            for height in range(start, end):
+                block = self.chain[height]
+                if block.is_pruned:
+                    raise ValueError(f"As transações do bloco {height} foram podadas")
+                for transaction in block.transactions:
+                    if transaction.sender == address:
+                        balance -= transaction.amount
+                    if transaction.recipient == address:
+                        balance += transaction.amount
+            return balance
+    
+    def get_all_balances(self) -> Dict[Optional[str], float]:
+        """
+        Retorna o saldo de todos os endereços conhecidos.
         
-        return balance
+        Returns:
+            Dict[Optional[str], float]: Endereço -> saldo
+        """
+        if self._store_serves_queries():
+            return self.store.get_all_balances()
+        return dict(self.balances)
     
-    def is_chain_valid(self) -> bool:
+    def is_chain_valid(self, full: bool = False, workers: int = 1) -> bool:
         """
-        Valida toda a blockchain.
+        Valida a blockchain.
+        
+        Por padrão só os blocos adicionados desde a última validação bem-sucedida são
+        verificados. Os blocos verificados são selados (Block.seal): se algum deles for
+        alterado, se self.chain for substituída ou se algum bloco verificado for trocado
+        na lista, a chain inteira é revalidada.
+        
+        Args:
+            full (bool): Se True, revalida todos os blocos (ex.: após editar a lista da chain)
+            workers (int): Com mais de 1, hashes e Proof of Work são verificados em vários
+                processos (útil ao importar ou auditar chains grandes); o bloco inválido
+                informado é o mesmo da validação sequencial
         
         Returns:
             bool: True se a chain é válida, False caso contrário
         """
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
+        with self._lock:
+            chain = self.chain
+            length = len(chain)
+            start = 1
+            if (not full and chain is self._validated_chain
+                    and self._validated_mutations == mutation_count()
+                    and 0 < self.validated_height <= length
+                    and self._validated_prefix_intact(chain)):
+                start = self.validated_height
+            
+            self._validated_chain = None
+            self.validated_height = 0
+            if start == 1:
+                self._validated_blocks = []
+            if length == 0:
+                return True
             
-            # Verifica se o bloco atual é válido
-            if not current_block.is_valid():
-                print(f"Bloco {current_block.index} é inválido!")
-                return False
+            if workers > 1 and length - start >= 2 * workers:
+                invalid_height = self._find_invalid_height(start, length, workers)
+                if invalid_height is not None:
+                    print(self._block_error(chain[invalid_height], chain[invalid_height - 1]))
+                    return False
+                previous_block = chain[length - 1]
+            else:
+                previous_block = chain[start - 1]
+                previous_block.seal()
+                for i in range(start, length):
+                    block = chain[i]
+                    error = self._block_error(block, previous_block)
+                    if error is not None:
+                        print(error)
+                        return False
+                    block.seal()
+                    previous_block = block
+            
+            self._validated_chain = chain
+            self.validated_height = length
+            self._validated_mutations = mutation_count()
+            self._validated_tip = previous_block.hash
+            if chain is not self.store:
+                self._validated_blocks.extend(chain[0 if start == 1 else start:length])
+            return True
+    
+    def _validated_prefix_intact(self, chain) -> bool:
+        """
+        Confere se os blocos já verificados continuam na chain.
+        
+        Em uma chain em memória, compara a identidade de cada bloco com a registrada
+        na validação (só ponteiros, sem recalcular hashes), o que detecta blocos trocados
+        na lista. Um store só aceita blocos novos no topo, então basta o último hash.
+        
+        Args:
+            chain: Chain atual (lista ou store)
             
-            # Verifica se o hash anterior está correto
-            if current_block.previous_hash != previous_block.hash:
-                print(f"Bloco {current_block.index} tem hash anterior incorreto!")
-                return False
+        Returns:
+            bool: True se a validação incremental pode continuar de validated_height
+        """
+        height = self.validated_height
+        if chain is self.store:
+            return chain[height - 1].hash == self._validated_tip
+        return (len(self._validated_blocks) == height
+                and all(map(operator.is_, chain[:height], self._validated_blocks)))
+    
+    def validate_semantics(self) -> ValidationReport:
+        """
+        Valida as regras da blockchain percorrendo a chain uma única vez.
+        
+        Além da validação de cada bloco (hash, Merkle, encadeamento, dificuldade e Proof
+        of Work, inclusive do gênesis), verifica que cada bloco depois do gênesis tem
+        exatamente uma recompensa de mining_reward, que nenhuma transação aparece duas
+        vezes, que toda transferência tem valor positivo (um valor negativo tiraria saldo
+        do destinatário), que nenhuma transação deixa o remetente com saldo negativo e,
+        com require_signatures, as assinaturas. Os saldos e os ids vistos são mantidos em
+        memória durante a passagem, então o custo é O(transações). As transações são
+        aplicadas na ordem do bloco; blocos podados partem do snapshot de saldos da poda.
         
-        return True
+        Returns:
+            ValidationReport: Relatório com a primeira violação encontrada (se houver)
+        """
+        with self._lock:
+            report = ValidationReport()
+            balances: Dict[Optional[str], float] = dict(self.pruned_balances)
+            seen_ids = set()
+            previous_block = None
+            for block in self.chain:
+                height = block.index
+                error = self._block_error(block, previous_block)
+                if error is not None:
+                    return report.fail(RULE_BLOCK, height, error)
+                previous_block = block
+                if block.is_pruned:
+                    report.blocks_checked += 1
+                    continue
+                
+                invalid_signature = self._find_invalid_signature(block) if self.require_signatures else None
+                rewards = 0
+                for position, transaction in enumerate(block.transactions):
+                    if invalid_signature is not None and invalid_signature[0] == position:
+                        return report.fail(RULE_SIGNATURE, height,
+                                           f"Bloco {height}, transação {position}: {invalid_signature[1]}",
+                                           position, transaction.sender)
+                    transaction_id = transaction.txid
+                    if transaction_id in seen_ids:
+                        return report.fail(RULE_DUPLICATE, height,
+                                           f"Bloco {height}, transação {position}: transação repetida "
+                                           f"({transaction_id})", position, transaction.sender)
+                    seen_ids.add(transaction_id)
+                    sender, recipient, amount = transaction.sender, transaction.recipient, transaction.amount
+                    if sender is None:
+                        rewards += 1
+                        if height > 0 and rewards > 1:
+                            return report.fail(RULE_REWARD, height, f"Bloco {height} tem mais de uma recompensa",
+                                               position, recipient)
+                        if height > 0 and amount != self.mining_reward:
+                            return report.fail(RULE_REWARD, height,
+                                               f"Bloco {height} tem recompensa {amount}, esperado {self.mining_reward}",
+                                               position, recipient)
+                    else:
+                        if height > 0 and amount <= 0:
+                            return report.fail(RULE_AMOUNT, height,
+                                               f"Bloco {height}, transação {position}: valor {amount} "
+                                               f"não é positivo", position, sender)
+                        balance = balances.get(sender, 0) - amount
+                        # Arredonda para 8 casas (ponto fixo do formato binário) para ignorar erros de float
+                        if round(balance, 8) < 0:
+                            return report.fail(RULE_BALANCE, height,
+                                               f"Bloco {height}, transação {position}: saldo de {sender} "
+                                               f"ficaria {balance}", position, sender, balance)
+                        balances[sender] = balance
+                    balances[recipient] = balances.get(recipient, 0) + amount
+                    
+                    if amount < 0 and round(balances[recipient], 8) < 0:
+                        return report.fail(RULE_BALANCE, height,
+                                           f"Bloco {height}, transação {position}: saldo de {recipient} "
+                                           f"ficaria {balances[recipient]}", position, recipient, balances[recipient])
+                
+                if height > 0 and rewards == 0:
+                    return report.fail(RULE_REWARD, height, f"Bloco {height} não tem recompensa")
+                report.blocks_checked += 1
+                report.transactions_checked += len(block.transactions)
+            
+            return report
+    
+    def _find_invalid_signature(self, block: Block) -> Optional[Tuple[int, str]]:
+        """
+        Encontra a primeira transação de um bloco com assinatura inválida.
+        
+        Recompensas e o gênesis não são assinados, e as transações no cache de
+        assinaturas verificadas (ex.: ao entrar no mempool) são puladas. As demais são
+        verificadas em lote (com signature_workers processos quando o bloco tem muitas
+        transações) e entram no cache se forem válidas.
+        
+        Args:
+            block (Block): Bloco verificado
+            
+        Returns:
+            Optional[Tuple[int, str]]: Posição da transação e o problema, ou None se todas são válidas
+        """
+        if block.index == 0 or block.is_pruned:
+            return None
+        
+        positions = []
+        transaction_ids = []
+        items = []
+        malformed = None
+        for position, transaction in enumerate(block.transactions):
+            if transaction.sender is None:
+                continue
+            transaction_id = transaction.txid
+            if transaction_id in self._verified_transactions:
+                continue
+            item = transaction.verification_item()
+            if item is None:
+                malformed = (position, "assinatura ausente ou malformada")
+                break
+            positions.append(position)
+            transaction_ids.append(transaction_id)
+            items.append(item)
+        
+        invalid = verify_batch(items, self.signature_workers)
+        if invalid is not None:
+            return positions[invalid], "assinatura inválida"
+        self._remember_verified(transaction_ids)
+        return malformed
+    
+    def _remember_verified(self, transaction_ids: List[str]) -> None:
+        """
+        Guarda ids de transações com assinatura válida no cache, descartando os mais antigos.
+        
+        Args:
+            transaction_ids (List[str]): Ids das transações verificadas
+        """
+        cache = self._verified_transactions
+        for transaction_id in transaction_ids:
+            cache[transaction_id] = None
+            cache.move_to_end(transaction_id)
+        while len(cache) > self.signature_cache_size:
+            cache.popitem(last=False)
+    
+    def _signature_error(self, block: Block) -> Optional[str]:
+        """
+        Verifica as assinaturas de um bloco (ver _find_invalid_signature).
+        
+        Returns:
+            Optional[str]: Mensagem do primeiro problema encontrado, ou None
+        """
+        invalid = self._find_invalid_signature(block)
+        if invalid is None:
+            return None
+        return f"Bloco {block.index}, transação {invalid[0]}: {invalid[1]}"
+    
+    def _find_invalid_height(self, start: int, end: int, workers: int) -> Optional[int]:
+        """
+        Encontra a altura do primeiro bloco inválido em [start, end) usando vários processos.
+        
+        Os blocos são divididos em intervalos consecutivos e cada worker recalcula hashes,
+        raízes de Merkle e Proof of Work do seu intervalo. O encadeamento (inclusive entre
+        o último bloco de um intervalo e o primeiro do seguinte) e a dificuldade esperada
+        são comparações baratas, feitas aqui enquanto os intervalos são montados.
+        
+        Args:
+            start (int): Primeira altura verificada (>= 1)
+            end (int): Altura final (exclusiva)
+            workers (int): Número de processos
+            
+        Returns:
+            Optional[int]: Menor altura inválida, ou None se todos os blocos são válidos
+        """
+        range_size = max(1, math.ceil((end - start) / (workers * RANGES_PER_WORKER)))
+        ranges: List[List[Block]] = [[]]
+        header_error = None
+        previous_block = self.chain[start - 1]
+        previous_block.seal()
+        for height in range(start, end):
+            block = self.chain[height]
+            if (block.previous_hash != previous_block.hash
+                    or block.difficulty != self.get_difficulty_for_height(height)):
+                # Blocos depois deste não importam: o primeiro erro está aqui ou antes
+                header_error = height
+                break
+            block.seal()
+            if len(ranges[-1]) == range_size:
+                ranges.append([])
+            ranges[-1].append(_pack_for_worker(block))
+            previous_block = block
+        
+        context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(_find_invalid_block, blocks) for blocks in ranges if blocks]
+            for future in futures:
+                invalid_height = future.result()
+                if invalid_height is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    return invalid_height
+        return header_error
+    
+    def _block_error(self, current_block: Block, previous_block: Optional[Block]) -> Optional[str]:
+        """
+        Verifica um bloco em relação ao bloco anterior e ao reajuste de dificuldade.
+        
+        Args:
+            current_block (Block): Bloco verificado (sua altura é current_block.index)
+            previous_block (Optional[Block]): Bloco anterior (None para o gênesis)
+            
+        Returns:
+            Optional[str]: Mensagem do primeiro problema encontrado, ou None se o bloco é válido
+        """
+        # Verifica se o bloco atual é válido
+        if not current_block.is_valid():
+            return f"Bloco {current_block.index} é inválido!"
+        
+        # Verifica se o hash anterior está correto
+        if previous_block is not None and current_block.previous_hash != previous_block.hash:
+            return f"Bloco {current_block.index} tem hash anterior incorreto!"
+        
+        # Verifica se a dificuldade declarada segue o reajuste esperado
+        if current_block.difficulty != self.get_difficulty_for_height(current_block.index):
+            return f"Bloco {current_block.index} tem dificuldade inesperada!"
+        
+        # Verifica se o Proof of Work atende ao alvo declarado
+        if not current_block.meets_difficulty():
+            return f"Bloco {current_block.index} não atende à dificuldade!"
+        
+        return None
     
     def get_block_by_index(self, index: int) -> Optional[Block]:
         """
@@ -204,18 +1240,125 @@ class Blockchain:
             return self.chain[index]
         return None
     
+    def get_address_transactions(self, address: str, cursor: Optional[Tuple[int, int]] = None,
+                                 limit: int = 50) -> Tuple[List[Tuple[int, int, Transaction]],
+                                                           Optional[Tuple[int, int]]]:
+        """
+        Retorna uma página do histórico de transações de um endereço (da mais antiga para a mais nova).
+        
+        O cursor é a localização (bloco, posição) da primeira transação da página, e não um
+        deslocamento na lista: a poda remove as entradas antigas do índice sem invalidar os
+        cursores já entregues.
+        
+        Args:
+            address (str): Endereço consultado
+            cursor (Tuple[int, int], optional): Cursor retornado pela página anterior (None = início)
+            limit (int): Número máximo de transações na página
+            
+        Returns:
+            Tuple[List[Tuple[int, int, Transaction]], Optional[Tuple[int, int]]]: Entradas
+                (índice do bloco, posição no bloco, transação) e o cursor da próxima
+                página, ou None se não houver mais transações
+        
+        Raises:
+            ValueError: Se o cursor tiver valores negativos ou o limite for menor que 1
+        """
+        cursor = tuple(cursor) if cursor is not None else (0, 0)
+        if len(cursor) != 2 or min(cursor) < 0 or limit < 1:
+            raise ValueError("O cursor deve ser (bloco, posição) >= 0 e o limite >= 1")
+        if self._store_serves_queries():
+            return self.store.get_address_transactions(address, cursor, limit)
+        
+        entries = self.address_index.get(address, [])
+        start = bisect_left(entries, cursor)
+        page = entries[start:start + limit]
+        next_cursor = entries[start + limit] if start + limit < len(entries) else None
+        
+        return [
+            (block_index, position, self.chain[block_index].transactions[position])
+            for block_index, position in page
+        ], next_cursor
+    
+    def get_transaction(self, txid: str) -> Optional[Tuple[Optional[int], int, Transaction]]:
+        """
+        Localiza uma transação pelo id, sem percorrer a chain.
+        
+        As pendentes são encontradas pelo conjunto de ids do mempool e as mineradas pelo
+        índice de ids (ou pelo store, com serves_queries). Com o filtro de Bloom, um id
+        ausente é descartado em O(1), mas os demais são procurados do topo para o gênesis.
+        
+        Args:
+            txid (str): Id da transação (ver Transaction.txid)
+            
+        Returns:
+            Optional[Tuple[Optional[int], int, Transaction]]: (altura do bloco, posição,
+                transação), com altura None para uma transação pendente (posição no mempool);
+                None se não encontrada ou se o bloco foi podado
+        """
+        with self._lock:
+            if txid in self.mempool_ids:
+                for position, transaction in enumerate(self.pending_transactions):
+                    if transaction.txid == txid:
+                        return None, position, transaction
+            
+            if self._store_serves_queries():
+                location = self.store.find_transaction(txid)
+            elif self.txid_bloom is None:
+                location = self.transaction_index.get(txid)
+            elif txid in self.txid_bloom:
+                location = self._scan_for_transaction(txid)
+            else:
+                location = None
+            
+            # Ids podados há pouco continuam no índice (ver _prune), mas o bloco não tem mais as transações
+            if location is None or self.chain[location[0]].is_pruned:
+                return None
+            height, position = location
+            return height, position, self.chain[height].transactions[position]
+    
+    def _scan_for_transaction(self, txid: str) -> Optional[Tuple[int, int]]:
+        """
+        Procura uma transação percorrendo os blocos não podados, do topo para o gênesis.
+        
+        Args:
+            txid (str): Id da transação
+            
+        Returns:
+            Optional[Tuple[int, int]]: (altura do bloco, posição), ou None
+        """
+        for height in range(len(self.chain) - 1, self.pruned_height - 1, -1):
+            for position, transaction in enumerate(self.chain[height].transactions):
+                if transaction.txid == txid:
+                    return height, position
+        return None
+    
     def get_all_transactions(self) -> List[Transaction]:
         """
-        Retorna todas as transações da blockchain.
+        Retorna todas as transações da blockchain (exceto as de blocos podados).
         
         Returns:
             List[Transaction]: Lista com todas as transações
         """
+        if self._store_serves_queries():
+            return list(self.store.iter_transactions())
+        
         all_transactions = []
-        for block in self.chain:
-            all_transactions.extend(block.transactions)
+        for height in range(self.pruned_height, len(self.chain)):
+            all_transactions.extend(self.chain[height].transactions)
         return all_transactions
     
+    def count_transactions(self) -> int:
+        """
+        Retorna o número de transações já incluídas em blocos.
+        
+        Returns:
+            int: Total de transações na chain
+        """
+        if self._store_serves_queries():
+            return self.store.count_transactions()
+        return self.pruned_transaction_count + sum(
+            len(self.chain[height].transactions) for height in range(self.pruned_height, len(self.chain)))
+    
     def to_dict(self) -> dict:
         """
         Converte a blockchain para dicionário.
@@ -0,0 +1,70 @@
+"""
+Módulo com um filtro de Bloom para conjuntos grandes de ids (ex.: ids de transações).
+
+O filtro responde "com certeza não está" ou "provavelmente está" usando uma
+quantidade fixa de memória: cerca de 1,8 byte por item com 0,1% de falsos positivos.
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom de tamanho fixo, dimensionado pela capacidade e taxa de falsos positivos.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Aloca o vetor de bits do filtro.
+        
+        Args:
+            capacity (int): Número de itens esperado; acima dele a taxa de falsos positivos sobe
+            error_rate (float): Taxa de falsos positivos desejada com `capacity` itens
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do filtro deve ser >= 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("A taxa de falsos positivos deve estar entre 0 e 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))  # Bits
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0  # Itens adicionados (repetidos contam de novo)
+    
+    def _positions(self, item: str):
+        """
+        Calcula os bits do item com hashing duplo (h1 + i * h2) sobre um BLAKE2b de 128 bits.
+        """
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        step = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return [(first + i * step) % size for i in range(self.hash_count)]
+    
+    def add(self, item: str) -> None:
+        """
+        Adiciona um item ao filtro.
+        
+        Args:
+            item (str): Item adicionado
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    @property
+    def size_bytes(self) -> int:
+        """
+        Memória ocupada pelo vetor de bits.
+        
+        Returns:
+            int: Tamanho do vetor de bits em bytes
+        """
+        return len(self._bits)
@@ -0,0 +1,125 @@
+"""
+Módulo de importação e exportação da blockchain em streaming.
+
+Formato do arquivo (JSON Lines, UTF-8): a primeira linha é um cabeçalho com
+as configurações da chain e cada linha seguinte é um bloco (Block.to_dict).
+Tanto a exportação quanto a importação processam um bloco por vez, então a
+memória usada não depende do tamanho da chain.
+"""
+import json
+from typing import Iterator, Tuple
+from .block import Block
+from .blockchain import Blockchain
+
+# Identificação e versão do formato de exportação
+EXPORT_FORMAT = 'blockchain-do-zero'
+EXPORT_VERSION = 1
+
+
+def iter_export_lines(blockchain: Blockchain) -> Iterator[str]:
+    """
+    Gera as linhas do arquivo de exportação, uma por vez.
+    
+    Args:
+        blockchain (Blockchain): Blockchain exportada
+    
+    Returns:
+        Iterator[str]: Cabeçalho seguido de um bloco por linha (cada linha termina com '\\n')
+    """
+    header = {
+        'format': EXPORT_FORMAT,
+        'version': EXPORT_VERSION,
+        'retarget_interval': blockchain.retarget_interval,
+        'target_block_time': blockchain.target_block_time,
+        'mining_reward': blockchain.mining_reward
+    }
+    yield json.dumps(header) + '\n'
+    for block in blockchain.chain:
+        yield json.dumps(block.to_dict(), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def export_chain(blockchain: Blockchain, path: str) -> int:
+    """
+    Exporta a blockchain para um arquivo, bloco a bloco.
+    
+    Args:
+        blockchain (Blockchain): Blockchain exportada
+        path (str): Caminho do arquivo de destino
+    
+    Returns:
+        int: Número de blocos exportados
+    """
+    with open(path, 'w', encoding='utf-8') as handle:
+        lines = iter_export_lines(blockchain)
+        handle.write(next(lines))
+        count = 0
+        for line in lines:
+            handle.write(line)
+            count += 1
+    return count
+
+
+def read_export(path: str) -> Tuple[dict, Iterator[Block]]:
+    """
+    Abre um arquivo de exportação.
+    
+    Args:
+        path (str): Caminho do arquivo
+    
+    Returns:
+        Tuple[dict, Iterator[Block]]: Cabeçalho e um gerador que lê os blocos sob demanda
+    
+    Raises:
+        ValueError: Se o arquivo não estiver no formato de exportação
+    """
+    with open(path, 'r', encoding='utf-8') as handle:
+        header = json.loads(handle.readline() or 'null')
+    if not isinstance(header, dict) or header.get('format') != EXPORT_FORMAT:
+        raise ValueError("Arquivo não é uma exportação da blockchain")
+    if header.get('version') != EXPORT_VERSION:
+        raise ValueError(f"Versão de exportação não suportada: {header.get('version')}")
+    return header, iter_blocks(path)
+
+
+def iter_blocks(path: str) -> Iterator[Block]:
+    """
+    Lê os blocos de um arquivo de exportação, um por vez.
+    
+    Args:
+        path (str): Caminho do arquivo
+    
+    Returns:
+        Iterator[Block]: Blocos na ordem do arquivo
+    """
+    with open(path, 'r', encoding='utf-8') as handle:
+        handle.readline()  # Cabeçalho
+        for line in handle:
+            if line.strip():
+                yield Block.from_dict(json.loads(line))
+
+
+def import_chain(path: str, **options) -> Blockchain:
+    """
+    Importa uma blockchain exportada, validando cada bloco à medida que é lido.
+    
+    As configurações do cabeçalho (reajuste e recompensa) são usadas, a menos que
+    sejam informadas em options. Com um store que serve a chain (ex.:
+    store=MappedBlockStore(...)), a importação usa memória constante.
+    
+    Args:
+        path (str): Caminho do arquivo de exportação
+        **options: Argumentos de Blockchain (store, reporter, retarget_interval...)
+    
+    Returns:
+        Blockchain: Blockchain importada
+    
+    Raises:
+        ValueError: Se o arquivo for inválido ou algum bloco não passar na validação
+    """
+    header, blocks = read_export(path)
+    options.setdefault('retarget_interval', header['retarget_interval'])
+    options.setdefault('target_block_time', header['target_block_time'])
+    
+    blockchain = Blockchain.from_blocks(blocks, **options)
+    blockchain.mining_reward = header['mining_reward']
+    return blockchain
@@ -0,0 +1,243 @@
+"""
+Módulo para executar a mineração em segundo plano (jobs de mineração).
+"""
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+from .blockchain import Blockchain
+from .mining import MiningCancelled
+
+
+class MiningJob:
+    """
+    Representa uma mineração executada em uma thread separada.
+    """
+    
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    CANCELLED = 'cancelled'
+    FAILED = 'failed'
+    
+    def __init__(self, miner_address: str, workers: int = 1):
+        """
+        Inicializa um novo job de mineração.
+        
+        Args:
+            miner_address (str): Endereço que receberá a recompensa
+            workers (int): Número de processos usados na mineração
+        """
+        self.id = uuid.uuid4().hex
+        self.miner_address = miner_address
+        self.workers = workers
+        self.status = self.PENDING
+        self.nonces_tried = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.block = None
+        self.miner_balance = None
+        self.error: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def elapsed(self) -> float:
+        """
+        Tempo de mineração em segundos (até agora, se ainda estiver rodando).
+        
+        Returns:
+            float: Segundos desde o início do job
+        """
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+    
+    @property
+    def hashrate(self) -> float:
+        """
+        Taxa média de hashes por segundo.
+        
+        Returns:
+            float: Hashes por segundo
+        """
+        elapsed = self.elapsed
+        return self.nonces_tried / elapsed if elapsed > 0 else 0.0
+    
+    def is_finished(self) -> bool:
+        """
+        Indica se o job já terminou (com sucesso, cancelado ou com erro).
+        
+        Returns:
+            bool: True se o job terminou
+        """
+        return self.status in (self.COMPLETED, self.CANCELLED, self.FAILED)
+    
+    def cancel(self) -> bool:
+        """
+        Solicita o cancelamento do job.
+        
+        Returns:
+            bool: True se o cancelamento foi solicitado, False se o job já havia terminado
+        """
+        if self.is_finished():
+            return False
+        self._stop_event.set()
+        return True
+    
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Aguarda o término do job.
+        
+        Args:
+            timeout (float, optional): Tempo máximo de espera em segundos
+        
+        Returns:
+            bool: True se o job terminou dentro do tempo
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.is_finished()
+    
+    def _on_progress(self, nonces_tried: int) -> None:
+        """
+        Atualiza o progresso do job (chamado pela mineração).
+        
+        Args:
+            nonces_tried (int): Total de tentativas até agora
+        """
+        self.nonces_tried = nonces_tried
+    
+    def _run(self, blockchain: Blockchain) -> None:
+        """
+        Executa a mineração (corpo da thread do job).
+        
+        Args:
+            blockchain (Blockchain): Blockchain onde o bloco será minerado
+        """
+        self.started_at = time.monotonic()
+        self.status = self.RUNNING
+        try:
+            self.block = blockchain.mine_pending_transactions(
+                self.miner_address,
+                workers=self.workers,
+                progress_callback=self._on_progress,
+                stop_event=self._stop_event
+            )
+            self.miner_balance = blockchain.get_balance(self.miner_address)
+            self.status = self.COMPLETED
+        except MiningCancelled:
+            self.status = self.CANCELLED
+        except Exception as e:
+            self.error = str(e)
+            self.status = self.FAILED
+        finally:
+            self.finished_at = time.monotonic()
+    
+    def to_dict(self) -> dict:
+        """
+        Converte o job para dicionário.
+        
+        Returns:
+            dict: Representação do job em dicionário
+        """
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'miner_address': self.miner_address,
+            'workers': self.workers,
+            'nonces_tried': self.nonces_tried,
+            'hashrate': self.hashrate,
+            'elapsed': self.elapsed,
+            'block': self.block.to_dict() if self.block is not None else None,
+            'mining_stats': (self.block.mining_result.to_dict()
+                             if self.block is not None and self.block.mining_result is not None else None),
+            'miner_balance': self.miner_balance,
+            'error': self.error
+        }
+
+
+class MiningJobManager:
+    """
+    Gerencia os jobs de mineração de uma blockchain (um job ativo por vez).
+    
+    Só os últimos `max_finished_jobs` jobs terminados continuam consultáveis; os mais antigos
+    são descartados a cada novo job, para que o dicionário não cresça enquanto o processo viver.
+    """
+    
+    def __init__(self, blockchain: Blockchain, max_finished_jobs: int = 100):
+        """
+        Inicializa o gerenciador.
+        
+        Args:
+            blockchain (Blockchain): Blockchain onde os blocos serão minerados
+            max_finished_jobs (int): Quantos jobs terminados manter para consulta
+        
+        Raises:
+            ValueError: Se max_finished_jobs for negativo
+        """
+        if max_finished_jobs < 0:
+            raise ValueError("O número de jobs terminados mantidos deve ser >= 0")
+        self.blockchain = blockchain
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: Dict[str, MiningJob] = {}
+        self._lock = threading.Lock()
+    
+    def get_active_job(self) -> Optional[MiningJob]:
+        """
+        Retorna o job que ainda está minerando, se houver.
+        
+        Returns:
+            Optional[MiningJob]: Job ativo ou None
+        """
+        for job in self.jobs.values():
+            if not job.is_finished():
+                return job
+        return None
+    
+    def submit(self, miner_address: str, workers: int = 1) -> MiningJob:
+        """
+        Inicia a mineração das transações pendentes em segundo plano.
+        
+        Args:
+            miner_address (str): Endereço que receberá a recompensa
+            workers (int): Número de processos usados na mineração
+        
+        Returns:
+            MiningJob: Job criado (já em execução)
+        
+        Raises:
+            RuntimeError: Se já existir um job minerando
+        """
+        with self._lock:
+            if self.get_active_job() is not None:
+                raise RuntimeError("Já existe uma mineração em andamento")
+            
+            self._prune_finished()
+            job = MiningJob(miner_address, workers)
+            job._thread = threading.Thread(target=job._run, args=(self.blockchain,), daemon=True)
+            self.jobs[job.id] = job
+            job._thread.start()
+            return job
+    
+    def _prune_finished(self) -> None:
+        """
+        Descarta os jobs terminados mais antigos além de max_finished_jobs.
+        """
+        # O dicionário mantém a ordem de criação: os primeiros são os mais antigos
+        finished = [job_id for job_id, job in self.jobs.items() if job.is_finished()]
+        for job_id in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self.jobs[job_id]
+    
+    def get(self, job_id: str) -> Optional[MiningJob]:
+        """
+        Retorna um job pelo id.
+        
+        Args:
+            job_id (str): Id do job
+        
+        Returns:
+            Optional[MiningJob]: Job encontrado ou None
+        """
+        return self.jobs.get(job_id)
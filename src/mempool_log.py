@@ -0,0 +1,173 @@
+"""
+Módulo com o log de escrita antecipada (WAL) das transações pendentes.
+
+Cada transação aceita é gravada no log antes de a requisição ser respondida,
+então uma queda entre POST /transactions e a mineração não perde transações.
+Os fsyncs são agrupados (group commit): enquanto um fsync está em andamento,
+novas transações são gravadas e aguardam o próximo, que cobre todas de uma vez.
+
+O arquivo usa os registros de storage (tamanho + CRC32). O primeiro registro
+guarda a altura da chain quando o log foi reescrito; os demais são transações.
+"""
+import json
+import os
+import threading
+from typing import List, Tuple
+from .storage import RECORD_HEADER, encode_record, read_records
+from .transaction import Transaction
+
+
+class MempoolLog:
+    """
+    Log durável das transações pendentes, com group commit.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Abre (ou cria) o log.
+        
+        Args:
+            path (str): Caminho do arquivo de log
+        """
+        self.path = path
+        self._cond = threading.Condition()
+        self._written = 0  # Registros gravados no buffer
+        self._synced = 0  # Registros já garantidos em disco
+        self._syncing = False
+        self.sync_count = 0  # Número de fsyncs feitos (para métricas)
+        
+        if not os.path.exists(path):
+            self._write_file(0, [])
+        self._handle = open(path, 'ab')
+    
+    def _write_file(self, height: int, transactions: List[Transaction]) -> None:
+        """
+        Grava um log novo de forma atômica (arquivo temporário + rename).
+        
+        Args:
+            height (int): Altura da chain no momento da gravação
+            transactions (List[Transaction]): Transações pendentes
+        """
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as handle:
+            handle.write(encode_record(json.dumps({'height': height}).encode('utf-8')))
+            for transaction in transactions:
+                handle.write(self._encode(transaction))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.path)
+        
+        directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    
+    @staticmethod
+    def _encode(transaction: Transaction) -> bytes:
+        """
+        Monta o registro de uma transação.
+        """
+        payload = json.dumps({'tx': transaction.to_dict()}, ensure_ascii=False, separators=(',', ':'))
+        return encode_record(payload.encode('utf-8'))
+    
+    def replay(self) -> Tuple[int, List[Transaction]]:
+        """
+        Lê as transações registradas no log.
+        
+        Um registro incompleto no final (queda durante a gravação) é descartado.
+        
+        Returns:
+            Tuple[int, List[Transaction]]: Altura da chain na última reescrita e as transações, em ordem
+        """
+        height = 0
+        transactions = []
+        valid_end = 0
+        with open(self.path, 'rb') as handle:
+            for offset, payload in read_records(handle):
+                valid_end = offset + RECORD_HEADER.size + len(payload)
+                record = json.loads(payload)
+                if 'height' in record:
+                    height = record['height']
+                else:
+                    transactions.append(Transaction.from_dict(record['tx']))
+            file_size = os.fstat(handle.fileno()).st_size
+        
+        if valid_end < file_size:
+            with self._cond:
+                self._handle.truncate(valid_end)
+        return height, transactions
+    
+    def append(self, transaction: Transaction) -> int:
+        """
+        Grava uma transação no buffer do log, sem esperar o disco.
+        
+        Args:
+            transaction (Transaction): Transação aceita
+        
+        Returns:
+            int: Ticket para wait_durable
+        """
+        record = self._encode(transaction)
+        with self._cond:
+            self._handle.write(record)
+            self._written += 1
+            return self._written
+    
+    def wait_durable(self, ticket: int) -> None:
+        """
+        Aguarda até que o registro do ticket esteja em disco.
+        
+        A primeira thread que precisa de um fsync o executa para todos os registros
+        gravados até então; as demais esperam e são liberadas pelo mesmo fsync.
+        
+        Args:
+            ticket (int): Valor retornado por append
+        """
+        with self._cond:
+            while self._synced < ticket:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                
+                self._syncing = True
+                target = self._written
+                self._handle.flush()
+                self._cond.release()
+                try:
+                    os.fsync(self._handle.fileno())
+                finally:
+                    self._cond.acquire()
+                    self._syncing = False
+                    self._cond.notify_all()
+                self._synced = max(self._synced, target)
+                self.sync_count += 1
+    
+    def rewrite(self, height: int, transactions: List[Transaction]) -> None:
+        """
+        Substitui o log pelas transações que continuam pendentes (ex.: após minerar um bloco).
+        
+        Args:
+            height (int): Altura atual da chain
+            transactions (List[Transaction]): Transações ainda pendentes
+        """
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            self._handle.close()
+            self._write_file(height, transactions)
+            self._handle = open(self.path, 'ab')
+            self._synced = self._written
+            self._cond.notify_all()
+    
+    def close(self) -> None:
+        """
+        Grava os dados pendentes e fecha o log.
+        """
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            if not self._handle.closed:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+                self._handle.close()
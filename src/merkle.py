@@ -0,0 +1,109 @@
+"""
+Módulo com as funções da árvore de Merkle usada no cabeçalho dos blocos.
+"""
+import hashlib
+from typing import List, Tuple
+
+# Hash da árvore vazia (bloco sem transações)
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def _hash_pair(left: str, right: str) -> str:
+    """
+    Calcula o hash de um nó interno a partir dos hashes dos filhos.
+    
+    Args:
+        left (str): Hash do filho da esquerda
+        right (str): Hash do filho da direita
+        
+    Returns:
+        str: Hash SHA-256 do nó
+    """
+    return hashlib.sha256((left + right).encode('utf-8')).hexdigest()
+
+
+def _next_level(level: List[str]) -> List[str]:
+    """
+    Calcula o nível superior da árvore (o último hash é duplicado se o nível for ímpar).
+    
+    Por isso listas como [a, b, c] e [a, b, c, c] têm a mesma raiz; Block.is_valid
+    rejeita blocos com transações repetidas para evitar essa ambiguidade.
+    
+    Args:
+        level (List[str]): Hashes do nível atual
+        
+    Returns:
+        List[str]: Hashes do nível superior
+    """
+    if len(level) % 2 == 1:
+        level = level + [level[-1]]
+    return [_hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+
+
+def compute_merkle_root(hashes: List[str]) -> str:
+    """
+    Calcula a raiz de Merkle de uma lista de hashes de transações.
+    
+    Args:
+        hashes (List[str]): Hashes das transações, na ordem do bloco
+        
+    Returns:
+        str: Raiz de Merkle
+    """
+    if not hashes:
+        return EMPTY_ROOT
+    
+    level = list(hashes)
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+
+def get_merkle_proof(hashes: List[str], index: int) -> List[Tuple[str, str]]:
+    """
+    Gera a prova de inclusão (O(log n) hashes) de uma transação.
+    
+    Args:
+        hashes (List[str]): Hashes das transações, na ordem do bloco
+        index (int): Posição da transação no bloco
+        
+    Returns:
+        List[Tuple[str, str]]: Pares (lado, hash do irmão), do nível das folhas até a raiz.
+            O lado é 'left' ou 'right' e indica onde o irmão fica na concatenação.
+    """
+    if not 0 <= index < len(hashes):
+        raise IndexError("Índice de transação fora do bloco")
+    
+    proof = []
+    level = list(hashes)
+    while len(level) > 1:
+        if len(level) % 2 == 1:
+            level = level + [level[-1]]
+        if index % 2 == 0:
+            proof.append(('right', level[index + 1]))
+        else:
+            proof.append(('left', level[index - 1]))
+        level = _next_level(level)
+        index //= 2
+    return proof
+
+
+def verify_merkle_proof(leaf_hash: str, proof: List[Tuple[str, str]], merkle_root: str) -> bool:
+    """
+    Verifica uma prova de inclusão contra a raiz de Merkle.
+    
+    Args:
+        leaf_hash (str): Hash da transação
+        proof (List[Tuple[str, str]]): Prova gerada por get_merkle_proof
+        merkle_root (str): Raiz de Merkle do bloco
+        
+    Returns:
+        bool: True se a transação pertence ao bloco, False caso contrário
+    """
+    current = leaf_hash
+    for side, sibling in proof:
+        if side == 'left':
+            current = _hash_pair(sibling, current)
+        else:
+            current = _hash_pair(current, sibling)
+    return current == merkle_root
@@ -0,0 +1,323 @@
+"""
+Módulo com as regras de Proof of Work (alvo numérico) e o motor de mineração paralela.
+
+A dificuldade é medida em bits: um hash é válido quando, interpretado como um
+inteiro de 256 bits, é menor que o alvo 2 ** (256 - dificuldade). Isso equivale a
+exigir `dificuldade` bits zero no início do hash, permitindo ajustes 4 vezes mais
+finos que a contagem de zeros hexadecimais.
+"""
+import hashlib
+import math
+import multiprocessing
+import queue
+from typing import Callable, Optional, Tuple
+
+# Dificuldade máxima (hash inteiro igual a zero)
+MAX_DIFFICULTY = 256
+
+# Máximo de bits que a dificuldade pode subir ou descer em um reajuste (fator 4 no alvo)
+MAX_RETARGET_STEP = 2
+
+# Quantas tentativas cada worker faz antes de verificar se outro já encontrou o nonce
+CHECK_INTERVAL = 1000
+
+# Intervalo (em tentativas) entre relatórios de progresso na mineração sequencial
+PROGRESS_INTERVAL = 10000
+
+# Motores de busca de nonce aceitos por Block.mine_block
+ENGINE_HASHLIB = 'hashlib'  # hashlib nonce a nonce (com midstate)
+ENGINE_NUMPY = 'numpy'  # Lotes vetorizados com NumPy (ver batch_sha256)
+ENGINES = (ENGINE_HASHLIB, ENGINE_NUMPY)
+
+# Intervalo (em segundos) com que o processo principal acompanha os workers
+POLL_INTERVAL = 0.1
+
+
+class MiningCancelled(Exception):
+    """
+    Lançada quando a mineração é interrompida por um evento de parada.
+    """
+
+
+class MiningResult:
+    """
+    Métricas de uma mineração concluída.
+    """
+    
+    def __init__(self, block_index: int, nonce: int, block_hash: str, difficulty: int,
+                 attempts: int, elapsed: float, workers: int = 1, engine: str = ENGINE_HASHLIB):
+        """
+        Inicializa o resultado da mineração.
+        
+        Args:
+            block_index (int): Índice do bloco minerado
+            nonce (int): Nonce encontrado
+            block_hash (str): Hash do bloco
+            difficulty (int): Dificuldade em bits
+            attempts (int): Número de hashes calculados
+            elapsed (float): Tempo de parede em segundos
+            workers (int): Número de processos usados
+            engine (str): Motor de busca usado
+        """
+        self.block_index = block_index
+        self.nonce = nonce
+        self.hash = block_hash
+        self.difficulty = difficulty
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.workers = workers
+        self.engine = engine
+    
+    @property
+    def hashrate(self) -> float:
+        """
+        Taxa média de hashes por segundo.
+        
+        Returns:
+            float: Hashes por segundo
+        """
+        return self.attempts / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def to_dict(self) -> dict:
+        """
+        Converte o resultado para dicionário.
+        
+        Returns:
+            dict: Representação do resultado em dicionário
+        """
+        return {
+            'block_index': self.block_index,
+            'nonce': self.nonce,
+            'hash': self.hash,
+            'difficulty': self.difficulty,
+            'attempts': self.attempts,
+            'elapsed': self.elapsed,
+            'hashrate': self.hashrate,
+            'workers': self.workers,
+            'engine': self.engine
+        }
+
+
+class ConsoleMiningReporter:
+    """
+    Reporter opcional que imprime o andamento da mineração no console.
+    
+    Qualquer objeto com os métodos on_start, on_progress e on_finish pode ser
+    usado como reporter (por exemplo, para enviar métricas a outro sistema).
+    """
+    
+    def on_start(self, block, difficulty: int) -> None:
+        """
+        Chamado antes de começar a busca pelo nonce.
+        
+        Args:
+            block (Block): Bloco sendo minerado
+            difficulty (int): Dificuldade em bits
+        """
+        print(f"⛏️  Minerando bloco {block.index}... (Dificuldade: {difficulty} bits)")
+    
+    def on_progress(self, block, attempts: int) -> None:
+        """
+        Chamado periodicamente durante a busca.
+        
+        Args:
+            block (Block): Bloco sendo minerado
+            attempts (int): Número de tentativas até agora
+        """
+        print(f"   Tentativa {attempts}...")
+    
+    def on_finish(self, block, result: MiningResult) -> None:
+        """
+        Chamado quando o nonce é encontrado.
+        
+        Args:
+            block (Block): Bloco minerado
+            result (MiningResult): Métricas da mineração
+        """
+        print(f"✅ Bloco {block.index} minerado com sucesso!")
+        print(f"   ⏱️  Tempo: {result.elapsed:.2f}s")
+        print(f"   ⚡ Hashrate: {result.hashrate:,.0f} H/s")
+        print(f"   🔑 Hash: {block.hash}")
+        print(f"   🎲 Nonce: {block.nonce}")
+        print(f"   📦 Transações: {len(block.transactions)}")
+        print("   " + "-" * 50)
+
+
+def difficulty_to_target(difficulty: int) -> int:
+    """
+    Converte a dificuldade (em bits) no alvo numérico.
+    
+    Args:
+        difficulty (int): Número de bits zero exigidos no início do hash
+    
+    Returns:
+        int: Alvo; o hash é válido se for estritamente menor que ele
+    """
+    if not 0 <= difficulty <= MAX_DIFFICULTY:
+        raise ValueError(f"A dificuldade deve estar entre 0 e {MAX_DIFFICULTY}")
+    return 1 << (MAX_DIFFICULTY - difficulty)
+
+
+def max_digest_for(difficulty: int) -> bytes:
+    """
+    Retorna o maior digest (32 bytes) aceito para a dificuldade.
+    
+    Comparar bytes big-endian de mesmo tamanho equivale a comparar os inteiros,
+    então o laço de mineração usa `digest <= max_digest` sem converter para hex.
+    
+    Args:
+        difficulty (int): Dificuldade em bits
+    
+    Returns:
+        bytes: Maior digest válido
+    """
+    return (difficulty_to_target(difficulty) - 1).to_bytes(32, 'big')
+
+
+def hash_meets_difficulty(block_hash: str, difficulty: int) -> bool:
+    """
+    Verifica se um hash hexadecimal atende à dificuldade.
+    
+    Args:
+        block_hash (str): Hash do bloco em hexadecimal
+        difficulty (int): Dificuldade em bits
+    
+    Returns:
+        bool: True se o hash é menor que o alvo, False caso contrário
+    """
+    try:
+        return int(block_hash, 16) < difficulty_to_target(difficulty)
+    except (TypeError, ValueError):
+        return False
+
+
+def retarget_difficulty(previous_difficulty: int, actual_timespan: float, expected_timespan: float,
+                        min_difficulty: int = 1, max_difficulty: int = MAX_DIFFICULTY) -> int:
+    """
+    Calcula a nova dificuldade a partir do tempo observado na última janela de blocos.
+    
+    Cada bit dobra o trabalho esperado, então o ajuste é log2(esperado / observado)
+    arredondado, limitado a MAX_RETARGET_STEP bits por reajuste.
+    
+    Args:
+        previous_difficulty (int): Dificuldade (em bits) da janela anterior
+        actual_timespan (float): Tempo observado entre o primeiro e o último bloco da janela (s)
+        expected_timespan (float): Tempo esperado para a mesma janela (s)
+        min_difficulty (int): Menor dificuldade permitida
+        max_difficulty (int): Maior dificuldade permitida
+        
+    Returns:
+        int: Nova dificuldade em bits
+    """
+    if actual_timespan <= 0:
+        adjustment = MAX_RETARGET_STEP
+    else:
+        adjustment = round(math.log2(expected_timespan / actual_timespan))
+    
+    adjustment = max(-MAX_RETARGET_STEP, min(MAX_RETARGET_STEP, adjustment))
+    return max(min_difficulty, min(max_difficulty, previous_difficulty + adjustment))
+
+
+def _search_nonces(prefix: bytes, max_digest: bytes, start: int, step: int,
+                   found_event, result_queue, counter) -> None:
+    """
+    Procura um nonce válido percorrendo start, start + step, start + 2*step...
+    
+    Args:
+        prefix (bytes): Parte invariante do bloco (ver Block._hash_prefix)
+        max_digest (bytes): Maior digest aceito (ver max_digest_for)
+        start (int): Primeiro nonce testado por este worker
+        step (int): Intervalo entre nonces (número total de workers)
+        found_event: Evento compartilhado sinalizado quando alguém encontra o nonce
+        result_queue: Fila onde o worker publica (nonce, hash) ao encontrar
+        counter: Contador compartilhado de tentativas realizadas por todos os workers
+    """
+    midstate = hashlib.sha256(prefix)
+    nonce = start
+    
+    while not found_event.is_set():
+        for attempt in range(1, CHECK_INTERVAL + 1):
+            sha = midstate.copy()
+            sha.update(str(nonce).encode('utf-8'))
+            digest = sha.digest()
+            
+            if digest <= max_digest:
+                with counter.get_lock():
+                    counter.value += attempt
+                result_queue.put((nonce, digest.hex()))
+                found_event.set()
+                return
+            
+            nonce += step
+        
+        with counter.get_lock():
+            counter.value += CHECK_INTERVAL
+
+
+def parallel_search(prefix: bytes, difficulty: int, start_nonce: int, workers: int,
+                    progress_callback: Optional[Callable[[int], None]] = None,
+                    stop_event=None) -> Tuple[int, str, int]:
+    """
+    Divide o espaço de nonces entre vários processos e retorna o primeiro resultado válido.
+    
+    O worker i testa os nonces start_nonce + i, start_nonce + i + workers, ...
+    Assim que um deles encontra um hash válido, todos os outros são interrompidos.
+    Um worker que termina sem resultado (ex.: morto pelo sistema) interrompe a busca,
+    em vez de deixá-la esperando para sempre.
+    
+    Args:
+        prefix (bytes): Parte invariante do bloco
+        difficulty (int): Dificuldade em bits
+        start_nonce (int): Nonce a partir do qual a busca começa
+        workers (int): Número de processos
+        progress_callback (Callable[[int], None], optional): Recebe o total de tentativas periodicamente
+        stop_event (optional): Evento que, quando sinalizado, cancela a mineração
+        
+    Returns:
+        Tuple[int, str, int]: Nonce encontrado, hash correspondente e total de tentativas
+        
+    Raises:
+        MiningCancelled: Se stop_event for sinalizado antes de encontrar o nonce
+        RuntimeError: Se um worker terminar com erro antes de encontrar o nonce
+    """
+    if workers < 1:
+        raise ValueError("O número de workers deve ser pelo menos 1")
+    
+    max_digest = max_digest_for(difficulty)
+    context = multiprocessing.get_context()
+    found_event = context.Event()
+    result_queue = context.Queue()
+    counter = context.Value('Q', 0)
+    
+    processes = [
+        context.Process(
+            target=_search_nonces,
+            args=(prefix, max_digest, start_nonce + i, workers, found_event, result_queue, counter),
+            daemon=True
+        )
+        for i in range(workers)
+    ]
+    
+    for process in processes:
+        process.start()
+    
+    try:
+        while True:
+            try:
+                nonce, block_hash = result_queue.get(timeout=POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if stop_event is not None and stop_event.is_set():
+                    raise MiningCancelled("Mineração cancelada")
+                # Workers só saem com código 0 depois que o nonce foi encontrado
+                for process in processes:
+                    if process.exitcode not in (None, 0):
+                        raise RuntimeError(f"Worker de mineração terminou com código {process.exitcode}")
+                if progress_callback is not None:
+                    progress_callback(counter.value)
+    finally:
+        found_event.set()
+        for process in processes:
+            process.join()
+    
+    return nonce, block_hash, counter.value
@@ -0,0 +1,198 @@
+"""
+Módulo com o armazenamento de blocos mapeado em memória (mmap).
+
+Usa o mesmo arquivo append-only de storage.BlockStore, mas mantém em memória
+apenas um índice compacto de offsets (array de uint64, 8 bytes por bloco).
+Os blocos são lidos do arquivo mapeado e reconstruídos sob demanda, com um
+cache LRU limitado dos blocos mais acessados, de modo que a chain pode ser
+maior que a memória disponível.
+"""
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterator
+from .block import Block
+from .storage import FSYNC_ALWAYS, RECORD_HEADER, SERIALIZATION_JSON, BlockStore, decode_block, read_records
+
+# Número padrão de blocos mantidos no cache LRU
+DEFAULT_CACHE_SIZE = 1024
+
+
+class MappedBlockStore(BlockStore):
+    """
+    Armazenamento append-only cujo arquivo é lido via mmap e usado diretamente como a chain.
+    """
+    
+    # A instância substitui a lista de blocos em memória
+    serves_chain = True
+    
+    def __init__(self, path: str, fsync_policy: str = FSYNC_ALWAYS, fsync_interval: int = 100,
+                 cache_size: int = DEFAULT_CACHE_SIZE, serialization: str = SERIALIZATION_JSON):
+        """
+        Abre (ou cria) o arquivo de blocos e monta o índice de offsets.
+        
+        Args:
+            path (str): Caminho do arquivo
+            fsync_policy (str): 'always', 'interval' ou 'never'
+            fsync_interval (int): Blocos entre fsyncs quando a política é 'interval'
+            cache_size (int): Número máximo de blocos reconstruídos mantidos em memória
+            serialization (str): Formato dos novos registros ('json' ou 'binary')
+        """
+        if cache_size < 1:
+            raise ValueError("O cache deve ter pelo menos 1 bloco")
+        
+        super().__init__(path, fsync_policy, fsync_interval, serialization)
+        self.cache_size = cache_size
+        self._offsets = array('Q')  # Offset do registro de cada bloco, por altura
+        self._cache: "OrderedDict[int, Block]" = OrderedDict()
+        self._reader = open(path, 'rb')  # O arquivo de gravação é só append; o mapeamento precisa de leitura
+        self._map = None
+        self._lock = threading.RLock()
+        self._build_index()
+    
+    def _build_index(self) -> None:
+        """
+        Percorre os registros do arquivo guardando apenas seus offsets.
+        
+        Um registro incompleto no final (gravação interrompida) é removido do arquivo.
+        """
+        valid_end = 0
+        with open(self.path, 'rb') as handle:
+            for offset, payload in read_records(handle):
+                self._offsets.append(offset)
+                valid_end = offset + RECORD_HEADER.size + len(payload)
+            file_size = os.fstat(handle.fileno()).st_size
+        
+        if valid_end < file_size:
+            self._handle.truncate(valid_end)
+            # O offset do próximo registro vem de tell(), que ainda apontaria para o fim antigo
+            self._handle.seek(0, os.SEEK_END)
+    
+    def _mapped(self, end: int) -> mmap.mmap:
+        """
+        Retorna o mapeamento do arquivo, refazendo-o se o arquivo cresceu além de `end`.
+        
+        Args:
+            end (int): Último byte que precisa estar mapeado
+        
+        Returns:
+            mmap.mmap: Mapeamento somente leitura do arquivo
+        """
+        if self._map is None or len(self._map) < end:
+            if self._map is not None:
+                self._map.close()
+            self._handle.flush()
+            self._map = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+    
+    def _read_payload(self, offset: int) -> bytes:
+        """
+        Lê o payload do registro que começa em `offset` no arquivo mapeado.
+        
+        Args:
+            offset (int): Offset do registro
+        
+        Returns:
+            bytes: Payload do registro
+        """
+        data = self._mapped(offset + RECORD_HEADER.size)
+        length, _ = RECORD_HEADER.unpack_from(data, offset)
+        start = offset + RECORD_HEADER.size
+        data = self._mapped(start + length)
+        return data[start:start + length]
+    
+    def _read_block(self, index: int) -> Block:
+        """
+        Reconstrói um bloco a partir do registro no arquivo mapeado.
+        
+        Args:
+            index (int): Altura do bloco
+        
+        Returns:
+            Block: Bloco reconstruído
+        """
+        return decode_block(self._read_payload(self._offsets[index]))
+    
+    def _remember(self, block: Block) -> None:
+        """
+        Guarda um bloco no cache LRU, descartando o menos usado se necessário.
+        
+        Args:
+            block (Block): Bloco reconstruído ou recém-gravado
+        """
+        self._cache[block.index] = block
+        self._cache.move_to_end(block.index)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(length))]
+        
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Índice de bloco fora da chain")
+        
+        with self._lock:
+            block = self._cache.get(index)
+            if block is None:
+                block = self._read_block(index)
+            self._remember(block)
+            return block
+    
+    def __iter__(self) -> Iterator[Block]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def append(self, block: Block) -> None:
+        """
+        Grava um bloco no final do arquivo e registra seu offset.
+        
+        Args:
+            block (Block): Bloco a ser gravado (deve ser o próximo da chain)
+        """
+        with self._lock:
+            if block.index != len(self):
+                raise ValueError(f"Esperado o bloco {len(self)}, recebido {block.index}")
+            
+            offset = self._handle.tell()
+            super().append(block)
+            self._offsets.append(offset)
+            self._remember(block)
+    
+    def load(self) -> Iterator[Block]:
+        """
+        Percorre os blocos armazenados, em ordem, reconstruindo-os sob demanda.
+        
+        Returns:
+            Iterator[Block]: Blocos armazenados
+        """
+        return iter(self)
+    
+    def is_empty(self) -> bool:
+        """
+        Indica se o arquivo ainda não tem blocos.
+        
+        Returns:
+            bool: True se nenhum bloco foi gravado
+        """
+        return len(self) == 0
+    
+    def close(self) -> None:
+        """
+        Desfaz o mapeamento, grava os dados pendentes e fecha o arquivo.
+        """
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._reader.close()
+            self._cache.clear()
+            super().close()
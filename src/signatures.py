@@ -0,0 +1,191 @@
+"""
+Módulo de assinaturas digitais Ed25519 (RFC 8032) para as transações.
+
+O endereço de uma carteira é a chave pública em hexadecimal (64 caracteres).
+Assinar e verificar usam a implementação do pacote `cryptography` (tempo constante).
+"""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+# Tamanhos em bytes
+PRIVATE_KEY_SIZE = 32
+PUBLIC_KEY_SIZE = 32
+SIGNATURE_SIZE = 64
+
+# verify_batch só usa vários processos a partir deste número de assinaturas
+PARALLEL_BATCH_THRESHOLD = 64
+
+
+def public_key_for(private_key: bytes) -> bytes:
+    """
+    Calcula a chave pública de uma chave privada.
+    
+    Args:
+        private_key (bytes): Chave privada (32 bytes)
+    
+    Returns:
+        bytes: Chave pública (32 bytes)
+    """
+    return Ed25519PrivateKey.from_private_bytes(private_key).public_key().public_bytes(
+        Encoding.Raw, PublicFormat.Raw)
+
+
+def sign(private_key: bytes, message: bytes) -> bytes:
+    """
+    Assina uma mensagem.
+    
+    Args:
+        private_key (bytes): Chave privada (32 bytes)
+        message (bytes): Mensagem
+    
+    Returns:
+        bytes: Assinatura (64 bytes)
+    """
+    return Ed25519PrivateKey.from_private_bytes(private_key).sign(message)
+
+
+def verify(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """
+    Verifica a assinatura de uma mensagem.
+    
+    Args:
+        public_key (bytes): Chave pública (32 bytes)
+        message (bytes): Mensagem
+        signature (bytes): Assinatura (64 bytes)
+    
+    Returns:
+        bool: True se a assinatura é válida para a chave e a mensagem
+    """
+    if len(public_key) != PUBLIC_KEY_SIZE or len(signature) != SIGNATURE_SIZE:
+        return False
+    
+    try:
+        Ed25519PublicKey.from_public_bytes(public_key).verify(signature, message)
+        return True
+    except (InvalidSignature, ValueError):
+        return False
+
+
+def address_to_public_key(address: Optional[str]) -> Optional[bytes]:
+    """
+    Converte um endereço na chave pública correspondente.
+    
+    Args:
+        address (str): Endereço (chave pública em hexadecimal)
+    
+    Returns:
+        Optional[bytes]: Chave pública, ou None se o endereço não for uma chave pública
+    """
+    if not isinstance(address, str) or len(address) != 2 * PUBLIC_KEY_SIZE:
+        return None
+    try:
+        return bytes.fromhex(address)
+    except ValueError:
+        return None
+
+
+def _first_invalid(items: List[Tuple[bytes, bytes, bytes]]) -> Optional[int]:
+    """
+    Retorna a posição da primeira assinatura inválida de um lote (executada nos workers).
+    """
+    for position, (public_key, message, signature) in enumerate(items):
+        if not verify(public_key, message, signature):
+            return position
+    return None
+
+
+def verify_batch(items: List[Tuple[bytes, bytes, bytes]], workers: int = 1) -> Optional[int]:
+    """
+    Verifica várias assinaturas, dividindo-as entre processos quando o lote é grande.
+    
+    Args:
+        items (List[Tuple[bytes, bytes, bytes]]): Trincas (chave pública, mensagem, assinatura)
+        workers (int): Número de processos (1 verifica no processo atual)
+    
+    Returns:
+        Optional[int]: Posição da primeira assinatura inválida, ou None se todas são válidas
+    """
+    if workers <= 1 or len(items) < PARALLEL_BATCH_THRESHOLD:
+        return _first_invalid(items)
+    
+    chunk_size = math.ceil(len(items) / workers)
+    starts = range(0, len(items), chunk_size)
+    context = multiprocessing.get_context()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(_first_invalid, items[start:start + chunk_size]) for start in starts]
+        for start, future in zip(starts, futures):
+            position = future.result()
+            if position is not None:
+                for pending in futures:
+                    pending.cancel()
+                return start + position
+    return None
+
+
+class KeyPair:
+    """
+    Par de chaves de uma carteira; o endereço é a chave pública em hexadecimal.
+    """
+    
+    def __init__(self, private_key: bytes):
+        """
+        Inicializa o par a partir da chave privada.
+        
+        Args:
+            private_key (bytes): Chave privada (32 bytes)
+        """
+        if len(private_key) != PRIVATE_KEY_SIZE:
+            raise ValueError(f"A chave privada deve ter {PRIVATE_KEY_SIZE} bytes")
+        self.private_key = private_key
+        self.public_key = public_key_for(private_key)
+    
+    @classmethod
+    def generate(cls) -> 'KeyPair':
+        """
+        Gera um par de chaves novo com bytes aleatórios do sistema operacional.
+        
+        Returns:
+            KeyPair: Par de chaves
+        """
+        return cls(os.urandom(PRIVATE_KEY_SIZE))
+    
+    @classmethod
+    def from_hex(cls, private_key: str) -> 'KeyPair':
+        """
+        Reconstrói o par a partir da chave privada em hexadecimal.
+        
+        Args:
+            private_key (str): Chave privada em hexadecimal
+        
+        Returns:
+            KeyPair: Par de chaves
+        """
+        return cls(bytes.fromhex(private_key))
+    
+    @property
+    def address(self) -> str:
+        """
+        Endereço da carteira.
+        
+        Returns:
+            str: Chave pública em hexadecimal
+        """
+        return self.public_key.hex()
+    
+    def sign(self, message: bytes) -> bytes:
+        """
+        Assina uma mensagem com a chave privada.
+        
+        Args:
+            message (bytes): Mensagem
+        
+        Returns:
+            bytes: Assinatura (64 bytes)
+        """
+        return sign(self.private_key, message)
@@ -0,0 +1,355 @@
+"""
+Módulo com o armazenamento opcional da blockchain em SQLite.
+
+Os blocos e as transações ficam em tabelas indexadas e a própria instância
+funciona como a lista `Blockchain.chain` (len, índice, fatias e iteração), de
+modo que nenhum bloco precisa ficar em memória. Saldos e históricos por
+endereço são respondidos por consultas indexadas.
+"""
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+from .block import Block
+from .transaction import Transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    height INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    previous_hash TEXT NOT NULL,
+    merkle_root TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    nonce INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_timestamp ON blocks (timestamp);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    block_height INTEGER NOT NULL REFERENCES blocks (height),
+    position INTEGER NOT NULL,
+    sender TEXT,
+    recipient TEXT,
+    amount NOT NULL,  -- Sem afinidade: inteiros e floats mantêm o tipo (afeta o hash)
+    timestamp TEXT NOT NULL,
+    signature TEXT,
+    txid TEXT,
+    PRIMARY KEY (block_height, position)
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_sender ON transactions (sender);
+CREATE INDEX IF NOT EXISTS idx_transactions_recipient ON transactions (recipient);
+CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions (timestamp);
+
+CREATE TABLE IF NOT EXISTS balances (
+    address TEXT PRIMARY KEY,
+    balance NOT NULL
+);
+"""
+
+# Quantas linhas são buscadas por vez ao percorrer tabelas
+FETCH_SIZE = 500
+
+
+class SQLiteBlockStore:
+    """
+    Armazenamento da blockchain em um banco SQLite.
+    """
+    
+    # A instância substitui a lista de blocos em memória
+    serves_chain = True
+    # Saldos e históricos por endereço são respondidos pelo banco
+    serves_queries = True
+    
+    def __init__(self, path: str):
+        """
+        Abre (ou cria) o banco de dados.
+        
+        Args:
+            path (str): Caminho do arquivo SQLite (ou ':memory:')
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(transactions)")]
+        if 'signature' not in columns:
+            # Bancos criados antes das transações assinadas
+            self._connection.execute("ALTER TABLE transactions ADD COLUMN signature TEXT")
+        if 'txid' not in columns:
+            self._add_txid_column()
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_transactions_txid ON transactions (txid)")
+        self._length = self._connection.execute("SELECT COUNT(*) FROM blocks").fetchone()[0]
+        self._latest: Optional[Block] = None
+    
+    def _add_txid_column(self) -> None:
+        """
+        Adiciona a coluna de ids de transação a um banco antigo e a preenche.
+        """
+        with self._connection:
+            self._connection.execute("ALTER TABLE transactions ADD COLUMN txid TEXT")
+            rows = self._connection.execute(
+                "SELECT block_height, position, sender, recipient, amount, timestamp, signature "
+                "FROM transactions").fetchall()
+            self._connection.executemany(
+                "UPDATE transactions SET txid = ? WHERE block_height = ? AND position = ?",
+                [(Transaction.from_dict({'sender': sender, 'recipient': recipient, 'amount': amount,
+                                         'timestamp': timestamp, 'signature': signature}).txid, height, position)
+                 for height, position, sender, recipient, amount, timestamp, signature in rows])
+    
+    def _block_from_row(self, row: tuple) -> Block:
+        """
+        Reconstrói um bloco (com suas transações) a partir de uma linha da tabela blocks.
+        
+        Args:
+            row (tuple): (height, hash, previous_hash, merkle_root, timestamp, difficulty, nonce)
+        
+        Returns:
+            Block: Bloco reconstruído
+        """
+        height, block_hash, previous_hash, merkle_root, timestamp, difficulty, nonce = row
+        transactions = self._connection.execute(
+            "SELECT sender, recipient, amount, timestamp, signature FROM transactions "
+            "WHERE block_height = ? ORDER BY position", (height,)
+        ).fetchall()
+        return Block.from_dict({
+            'index': height,
+            'timestamp': timestamp,
+            'transactions': [
+                {'sender': sender, 'recipient': recipient, 'amount': amount, 'timestamp': tx_timestamp,
+                 'signature': signature}
+                for sender, recipient, amount, tx_timestamp, signature in transactions
+            ],
+            'previous_hash': previous_hash,
+            'merkle_root': merkle_root,
+            'hash': block_hash,
+            'nonce': nonce,
+            'difficulty': difficulty
+        })
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Índice de bloco fora da chain")
+        
+        with self._lock:
+            if self._latest is not None and self._latest.index == index:
+                return self._latest
+            row = self._connection.execute(
+                "SELECT height, hash, previous_hash, merkle_root, timestamp, difficulty, nonce "
+                "FROM blocks WHERE height = ?", (index,)
+            ).fetchone()
+            return self._block_from_row(row)
+    
+    def __iter__(self) -> Iterator[Block]:
+        for index in range(self._length):
+            yield self[index]
+    
+    def append(self, block: Block) -> None:
+        """
+        Grava um bloco e suas transações em uma única transação do banco.
+        
+        Args:
+            block (Block): Bloco a ser gravado (deve ser o próximo da chain)
+        """
+        if block.index != self._length:
+            raise ValueError(f"Esperado o bloco {self._length}, recebido {block.index}")
+        
+        transactions = [
+            (block.index, position, tx.sender, tx.recipient, tx.amount, tx.timestamp.isoformat(), tx.signature,
+             tx.txid)
+            for position, tx in enumerate(block.transactions)
+        ]
+        balance_changes = []
+        for tx in block.transactions:
+            if tx.sender is not None:
+                balance_changes.append((tx.sender, -tx.amount))
+            if tx.recipient is not None:
+                balance_changes.append((tx.recipient, tx.amount))
+        
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (block.index, block.hash, block.previous_hash, block.merkle_root,
+                 block.timestamp.isoformat(), block.difficulty, block.nonce)
+            )
+            self._connection.executemany(
+                "INSERT INTO transactions (block_height, position, sender, recipient, amount, timestamp, signature, "
+                "txid) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", transactions)
+            # Aplica as variações na ordem das transações, como o índice em memória
+            self._connection.executemany(
+                "INSERT INTO balances VALUES (?, ?) "
+                "ON CONFLICT (address) DO UPDATE SET balance = balance + excluded.balance",
+                balance_changes
+            )
+            self._length += 1
+            self._latest = block
+    
+    def load(self) -> Iterator[Block]:
+        """
+        Percorre os blocos armazenados, em ordem.
+        
+        Returns:
+            Iterator[Block]: Blocos armazenados
+        """
+        return iter(self)
+    
+    def is_empty(self) -> bool:
+        """
+        Indica se o banco ainda não tem blocos.
+        
+        Returns:
+            bool: True se nenhum bloco foi gravado
+        """
+        return self._length == 0
+    
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
+        """
+        Busca um bloco pelo hash (consulta indexada).
+        
+        Args:
+            block_hash (str): Hash do bloco
+        
+        Returns:
+            Optional[Block]: Bloco encontrado ou None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT height, hash, previous_hash, merkle_root, timestamp, difficulty, nonce "
+                "FROM blocks WHERE hash = ?", (block_hash,)
+            ).fetchone()
+            return self._block_from_row(row) if row else None
+    
+    def find_transaction(self, txid: str) -> Optional[Tuple[int, int]]:
+        """
+        Localiza uma transação pelo id (consulta indexada).
+        
+        Args:
+            txid (str): Id da transação (ver Transaction.txid)
+        
+        Returns:
+            Optional[Tuple[int, int]]: (altura do bloco, posição no bloco), ou None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT block_height, position FROM transactions WHERE txid = ? "
+                "ORDER BY block_height, position LIMIT 1", (txid,)).fetchone()
+            return tuple(row) if row else None
+    
+    def get_balance(self, address: Optional[str], at_height: Optional[int] = None) -> float:
+        """
+        Retorna o saldo de um endereço.
+        
+        Sem at_height, o saldo vem da tabela de saldos. Com at_height, as transações do
+        endereço até a altura são somadas com os índices por remetente e destinatário,
+        sem percorrer a chain.
+        
+        Args:
+            address (str): Endereço consultado (None soma as recompensas emitidas, em negativo)
+            at_height (int, optional): Altura do último bloco considerado
+        
+        Returns:
+            float: Saldo do endereço
+        """
+        with self._lock:
+            if address is None:
+                if at_height is None:
+                    row = self._connection.execute(
+                        "SELECT -SUM(amount) FROM transactions WHERE sender IS NULL").fetchone()
+                else:
+                    row = self._connection.execute(
+                        "SELECT -SUM(amount) FROM transactions WHERE sender IS NULL AND block_height <= ?",
+                        (at_height,)).fetchone()
+            elif at_height is None:
+                row = self._connection.execute(
+                    "SELECT balance FROM balances WHERE address = ?", (address,)).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT (SELECT COALESCE(SUM(amount), 0) FROM transactions "
+                    "        WHERE recipient = ? AND block_height <= ?) - "
+                    "       (SELECT COALESCE(SUM(amount), 0) FROM transactions "
+                    "        WHERE sender = ? AND block_height <= ?)",
+                    (address, at_height, address, at_height)).fetchone()
+            return row[0] if row and row[0] is not None else 0
+    
+    def get_all_balances(self) -> Dict[str, float]:
+        """
+        Retorna o saldo de todos os endereços conhecidos.
+        
+        Returns:
+            Dict[str, float]: Endereço -> saldo
+        """
+        with self._lock:
+            return dict(self._connection.execute("SELECT address, balance FROM balances"))
+    
+    def get_address_transactions(self, address: str, cursor: Tuple[int, int] = (0, 0),
+                                 limit: int = 50) -> Tuple[List[Tuple[int, int, Transaction]],
+                                                           Optional[Tuple[int, int]]]:
+        """
+        Retorna uma página do histórico de um endereço (ver Blockchain.get_address_transactions).
+        
+        Args:
+            address (str): Endereço consultado
+            cursor (Tuple[int, int]): (bloco, posição) da primeira transação da página
+            limit (int): Número máximo de transações
+        
+        Returns:
+            Tuple[List[Tuple[int, int, Transaction]], Optional[Tuple[int, int]]]: Entradas e próximo cursor
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT block_height, position, sender, recipient, amount, timestamp, signature FROM transactions "
+                "WHERE (sender = ? OR recipient = ?) AND (block_height, position) >= (?, ?) "
+                "ORDER BY block_height, position LIMIT ?",
+                (address, address, cursor[0], cursor[1], limit + 1)
+            ).fetchall()
+        
+        entries = [
+            (height, position, Transaction.from_dict(
+                {'sender': sender, 'recipient': recipient, 'amount': amount, 'timestamp': timestamp,
+                 'signature': signature}))
+            for height, position, sender, recipient, amount, timestamp, signature in rows[:limit]
+        ]
+        next_cursor = (rows[limit][0], rows[limit][1]) if len(rows) > limit else None
+        return entries, next_cursor
+    
+    def iter_transactions(self) -> Iterator[Transaction]:
+        """
+        Percorre todas as transações da chain, em ordem, sem carregá-las de uma vez.
+        
+        Returns:
+            Iterator[Transaction]: Transações armazenadas
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT sender, recipient, amount, timestamp, signature FROM transactions "
+                "ORDER BY block_height, position")
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    return
+                for sender, recipient, amount, timestamp, signature in rows:
+                    yield Transaction.from_dict({'sender': sender, 'recipient': recipient, 'amount': amount,
+                                                 'timestamp': timestamp, 'signature': signature})
+    
+    def count_transactions(self) -> int:
+        """
+        Retorna o número total de transações na chain.
+        
+        Returns:
+            int: Total de transações
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+    
+    def close(self) -> None:
+        """
+        Fecha a conexão com o banco.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,245 @@
+"""
+Módulo de persistência: armazenamento append-only dos blocos em arquivo.
+
+Formato do arquivo: uma sequência de registros, um por bloco, cada um com
+4 bytes de tamanho, 4 bytes de CRC32 (ambos big-endian) e o bloco em JSON (UTF-8)
+ou no formato binário de Block.to_bytes. Os dois formatos podem coexistir no
+mesmo arquivo: registros JSON sempre começam com '{'.
+
+Cada registro também guarda os ids das transações do bloco (a chave 'txids' no
+JSON, ou 32 bytes por transação após o bloco binário), para que a leitura não
+precise recalcular o hash de cada transação. Registros sem ids continuam legíveis.
+"""
+import json
+import os
+import struct
+import zlib
+from typing import Iterator, Tuple
+from .block import Block
+
+# Cabeçalho de cada registro: tamanho do payload e CRC32 do payload
+RECORD_HEADER = struct.Struct('>II')
+
+# Políticas de fsync
+FSYNC_ALWAYS = 'always'  # fsync a cada bloco gravado (mais seguro)
+FSYNC_INTERVAL = 'interval'  # fsync a cada fsync_interval blocos
+FSYNC_NEVER = 'never'  # O sistema operacional decide quando gravar no disco
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER)
+
+# Formatos de serialização dos registros
+SERIALIZATION_JSON = 'json'
+SERIALIZATION_BINARY = 'binary'
+SERIALIZATIONS = (SERIALIZATION_JSON, SERIALIZATION_BINARY)
+
+
+class CorruptStoreError(Exception):
+    """
+    Lançada quando um registro no meio do arquivo está corrompido.
+    """
+
+
+def encode_record(payload: bytes) -> bytes:
+    """
+    Monta um registro com tamanho e checksum.
+    
+    Args:
+        payload (bytes): Conteúdo do registro
+    
+    Returns:
+        bytes: Cabeçalho seguido do payload
+    """
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_block(block: Block, serialization: str = SERIALIZATION_JSON) -> bytes:
+    """
+    Serializa um bloco para ser gravado como registro.
+    
+    Args:
+        block (Block): Bloco a ser serializado
+        serialization (str): 'json' ou 'binary'
+    
+    Returns:
+        bytes: Payload do registro
+    """
+    if serialization == SERIALIZATION_BINARY:
+        return block.to_bytes() + bytes.fromhex(''.join(tx.txid for tx in block.transactions))
+    data = block.to_dict()
+    if not block.is_pruned:
+        data['txids'] = [tx.txid for tx in block.transactions]
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_block(payload: bytes) -> Block:
+    """
+    Reconstrói um bloco a partir de um payload JSON ou binário.
+    
+    Args:
+        payload (bytes): Payload do registro
+    
+    Returns:
+        Block: Bloco reconstruído, com os ids das transações já preenchidos se o registro os tiver
+    """
+    if payload[:1] == b'{':
+        data = json.loads(payload)
+        txids = data.pop('txids', None)
+        block = Block.from_dict(data)
+    else:
+        block, offset = Block.unpack(payload)
+        digests = payload[offset:].hex()
+        if len(digests) % 64:
+            raise ValueError(f"Ids de transações truncados no bloco {block.index}")
+        txids = [digests[i:i + 64] for i in range(0, len(digests), 64)] if digests else None
+    
+    if txids is not None:
+        if block.transactions is None or len(txids) != len(block.transactions):
+            raise ValueError(f"Ids de transações não conferem com o bloco {block.index}")
+        for transaction, txid in zip(block.transactions, txids):
+            transaction._txid = txid
+    return block
+
+
+def strip_txids(payload: bytes) -> bytes:
+    """
+    Remove os ids das transações de um payload, mantendo o formato do bloco.
+    
+    Args:
+        payload (bytes): Payload gerado por encode_block
+    
+    Returns:
+        bytes: Payload sem os ids (igual ao de um registro antigo)
+    """
+    if payload[:1] == b'{':
+        data = json.loads(payload)
+        if data.pop('txids', None) is None:
+            return payload
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    _, offset = Block.unpack(payload)
+    return payload[:offset]
+
+
+def read_records(handle, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    Lê registros sequencialmente a partir de um offset.
+    
+    A leitura para no primeiro registro incompleto ou com checksum inválido
+    no final do arquivo (gravação interrompida). Um registro inválido seguido
+    de outros dados indica corrupção e gera CorruptStoreError.
+    
+    Args:
+        handle: Arquivo aberto em modo binário
+        start (int): Offset do primeiro registro
+    
+    Returns:
+        Iterator[Tuple[int, bytes]]: Pares (offset do registro, payload)
+    """
+    file_size = os.fstat(handle.fileno()).st_size
+    offset = start
+    handle.seek(offset)
+    
+    while offset < file_size:
+        header = handle.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+        length, checksum = RECORD_HEADER.unpack(header)
+        end = offset + RECORD_HEADER.size + length
+        if end > file_size:
+            return
+        payload = handle.read(length)
+        if zlib.crc32(payload) != checksum:
+            if end < file_size:
+                raise CorruptStoreError(f"Registro corrompido no offset {offset}")
+            return
+        yield offset, payload
+        offset = end
+
+
+class BlockStore:
+    """
+    Armazenamento append-only de blocos em um único arquivo.
+    """
+    
+    def __init__(self, path: str, fsync_policy: str = FSYNC_ALWAYS, fsync_interval: int = 100,
+                 serialization: str = SERIALIZATION_JSON):
+        """
+        Abre (ou cria) o arquivo de blocos.
+        
+        Args:
+            path (str): Caminho do arquivo
+            fsync_policy (str): 'always', 'interval' ou 'never'
+            fsync_interval (int): Blocos entre fsyncs quando a política é 'interval'
+            serialization (str): Formato dos novos registros: 'json' ou 'binary' (menor e
+                mais rápido). A leitura aceita os dois formatos.
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Política de fsync desconhecida: {fsync_policy}")
+        if serialization not in SERIALIZATIONS:
+            raise ValueError(f"Formato de serialização desconhecido: {serialization}")
+        
+        self.path = path
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.serialization = serialization
+        self._unsynced = 0
+        self._handle = open(path, 'ab')
+    
+    def append(self, block: Block) -> None:
+        """
+        Grava um bloco no final do arquivo.
+        
+        Args:
+            block (Block): Bloco a ser gravado
+        """
+        self._handle.write(encode_record(encode_block(block, self.serialization)))
+        self._handle.flush()
+        
+        self._unsynced += 1
+        if self.fsync_policy == FSYNC_ALWAYS or (
+                self.fsync_policy == FSYNC_INTERVAL and self._unsynced >= self.fsync_interval):
+            self.sync()
+    
+    def sync(self) -> None:
+        """
+        Força a gravação dos blocos pendentes no disco.
+        """
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._unsynced = 0
+    
+    def load(self) -> Iterator[Block]:
+        """
+        Lê todos os blocos do arquivo, em ordem, sem recalcular hashes.
+        
+        Se a última gravação foi interrompida, o registro incompleto é removido
+        do arquivo para que os próximos blocos sejam gravados logo após o último válido.
+        
+        Returns:
+            Iterator[Block]: Blocos armazenados
+        """
+        valid_end = 0
+        with open(self.path, 'rb') as handle:
+            for offset, payload in read_records(handle):
+                valid_end = offset + RECORD_HEADER.size + len(payload)
+                yield decode_block(payload)
+            file_size = os.fstat(handle.fileno()).st_size
+        
+        if valid_end < file_size:
+            self._handle.truncate(valid_end)
+            self._handle.seek(0, os.SEEK_END)
+    
+    def is_empty(self) -> bool:
+        """
+        Indica se o arquivo ainda não tem blocos.
+        
+        Returns:
+            bool: True se nenhum bloco foi gravado
+        """
+        return os.path.getsize(self.path) == 0
+    
+    def close(self) -> None:
+        """
+        Grava os dados pendentes e fecha o arquivo.
+        """
+        if not self._handle.closed:
+            self.sync()
+            self._handle.close()
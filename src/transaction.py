@@ -2,16 +2,64 @@
 """
 Módulo para representar transações na blockchain.
 """
+import hashlib
 import json
+import struct
+import sys
 from datetime import datetime
+from typing import List, Optional, Tuple
+from .binary import (AMOUNT_SCALE, FORMAT_VERSION, NULL_LENGTH, amount_to_fixed, compact_timestamp,
+                     datetime_to_micros, encode_optional, expand_timestamp)
+from .signatures import SIGNATURE_SIZE, address_to_public_key, verify
+
+# Registro binário de tamanho fixo de cada transação: flags, valor em ponto fixo,
+# timestamp em microssegundos e tamanhos do remetente e do destinatário
+_RECORD = struct.Struct('>BqqHH')
+
+# Flag que indica que o valor era um int (e não float)
+_FLAG_INTEGER_AMOUNT = 0x01
+# Flag que indica que a assinatura (64 bytes) vem após os endereços
+_FLAG_SIGNED = 0x02
+
+# Atributos que entram no hash da transação: alterá-los descarta o txid em cache
+_HASHED_FIELDS = frozenset(('sender', 'recipient', 'amount', '_timestamp', 'signature'))
+
+
+def intern_address(address: Optional[str]) -> Optional[str]:
+    """
+    Retorna a cópia compartilhada de um endereço (tabela de strings internadas do Python).
+    
+    Todas as transações do mesmo endereço passam a apontar para uma única string.
+    
+    Args:
+        address (Optional[str]): Endereço
+        
+    Returns:
+        Optional[str]: Mesmo endereço, internado
+    """
+    return sys.intern(address) if type(address) is str else address
 
 
 class Transaction:
     """
     Representa uma transação na blockchain.
+    
+    Para ocupar pouca memória com muitas transações, a classe usa __slots__,
+    guarda o timestamp como inteiro de microssegundos desde a época e interna
+    os endereços. O atributo timestamp continua sendo um datetime.
+    
+    Transações de carteiras (signatures.KeyPair) são assinadas com sign: o
+    remetente é a chave pública e a assinatura cobre remetente, destinatário,
+    valor e timestamp.
+    
+    O txid é calculado uma vez e guardado em cache; atribuir qualquer campo que
+    entra no hash descarta o cache.
     """
     
-    def __init__(self, sender: str, recipient: str, amount: float, timestamp: datetime = None):
+    __slots__ = ('sender', 'recipient', 'amount', '_timestamp', 'signature', '_txid')
+    
+    def __init__(self, sender: str, recipient: str, amount: float, timestamp: datetime = None,
+                 signature: Optional[str] = None):
         """
         Inicializa uma nova transação.
         
@@ -20,25 +68,197 @@ class Transaction:
             recipient (str): Endereço do destinatário
             amount (float): Valor da transação
             timestamp (datetime, optional): Timestamp da transação
+            signature (str, optional): Assinatura Ed25519 em hexadecimal
         """
-        self.sender = sender
-        self.recipient = recipient
+        self.sender = intern_address(sender)
+        self.recipient = intern_address(recipient)
         self.amount = amount
         self.timestamp = timestamp or datetime.now()
+        self.signature = signature
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, '_txid', None)
+    
+    @classmethod
+    def _from_compact(cls, sender: Optional[str], recipient: Optional[str], amount: float,
+                      timestamp, signature: Optional[str] = None) -> 'Transaction':
+        """
+        Cria uma transação a partir do timestamp já na forma compacta (sem converter para datetime).
+        """
+        transaction = cls.__new__(cls)
+        transaction.sender = intern_address(sender)
+        transaction.recipient = intern_address(recipient)
+        transaction.amount = amount
+        transaction._timestamp = timestamp
+        transaction.signature = signature
+        return transaction
+    
+    @property
+    def timestamp(self) -> datetime:
+        """
+        Timestamp da transação.
+        
+        Returns:
+            datetime: Timestamp reconstruído a partir dos microssegundos armazenados
+        """
+        return expand_timestamp(self._timestamp)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = compact_timestamp(value)
     
     def to_dict(self) -> dict:
         """
         Converte a transação para dicionário.
         
         Returns:
-            dict: Representação da transação em dicionário
+            dict: Representação da transação em dicionário (a assinatura só aparece se existir)
         """
-        return {
+        data = {
             'sender': self.sender,
             'recipient': self.recipient,
             'amount': self.amount,
             'timestamp': self.timestamp.isoformat()
         }
+        if self.signature is not None:
+            data['signature'] = self.signature
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Transaction':
+        """
+        Reconstrói uma transação a partir do dicionário gerado por to_dict.
+        
+        Args:
+            data (dict): Representação da transação em dicionário
+            
+        Returns:
+            Transaction: Transação reconstruída
+        """
+        return cls(
+            sender=data['sender'],
+            recipient=data['recipient'],
+            amount=data['amount'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            signature=data.get('signature')
+        )
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa a transação no formato binário compacto (ver pack_transactions).
+        
+        Returns:
+            bytes: Versão do formato seguida da transação
+            
+        Raises:
+            ValueError: Se o valor não tiver representação exata com 8 casas decimais
+        """
+        return bytes([FORMAT_VERSION]) + pack_transactions([self])
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Transaction':
+        """
+        Reconstrói uma transação serializada por to_bytes.
+        
+        Args:
+            data (bytes): Transação em formato binário
+            
+        Returns:
+            Transaction: Transação reconstruída
+        """
+        if not data or data[0] != FORMAT_VERSION:
+            raise ValueError("Versão de formato binário não suportada")
+        (transaction,), end = unpack_transactions(data, 1, 1)
+        if end != len(data):
+            raise ValueError("Bytes extras após a transação")
+        return transaction
+    
+    def calculate_hash(self) -> str:
+        """
+        Calcula o hash SHA-256 da transação (folha da árvore de Merkle).
+        
+        A assinatura faz parte do hash, então um bloco não pode ter as assinaturas
+        trocadas sem mudar a raiz de Merkle.
+        
+        Returns:
+            str: Hash SHA-256 da transação
+        """
+        tx_string = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()
+    
+    @property
+    def txid(self) -> str:
+        """
+        Id canônico da transação: o mesmo hash usado como folha da árvore de Merkle.
+        
+        Duas transações com os mesmos campos (inclusive timestamp e assinatura) têm o
+        mesmo id, e é assim que reenvios e replays são detectados.
+        
+        Returns:
+            str: Hash SHA-256 da transação (ver calculate_hash), calculado só na primeira leitura
+        """
+        txid = self._txid
+        if txid is None:
+            txid = self.calculate_hash()
+            object.__setattr__(self, '_txid', txid)
+        return txid
+    
+    def signing_message(self) -> bytes:
+        """
+        Retorna a mensagem assinada: o hash da transação sem a assinatura.
+        
+        Returns:
+            bytes: Hash SHA-256 (hexadecimal, em UTF-8) dos campos da transação
+        """
+        data = self.to_dict()
+        data.pop('signature', None)
+        tx_string = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(tx_string.encode('utf-8')).hexdigest().encode('ascii')
+    
+    def sign(self, key_pair) -> None:
+        """
+        Assina a transação com a carteira do remetente.
+        
+        Args:
+            key_pair (signatures.KeyPair): Par de chaves cujo endereço é o remetente
+            
+        Raises:
+            ValueError: Se a carteira não for a do remetente
+        """
+        if key_pair.address != self.sender:
+            raise ValueError("A carteira não corresponde ao remetente da transação")
+        self.signature = key_pair.sign(self.signing_message()).hex()
+    
+    def verification_item(self) -> Optional[Tuple[bytes, bytes, bytes]]:
+        """
+        Monta a trinca usada por signatures.verify_batch.
+        
+        Returns:
+            Optional[Tuple[bytes, bytes, bytes]]: (chave pública, mensagem, assinatura), ou
+                None se o remetente não for uma chave pública ou a assinatura estiver malformada
+        """
+        public_key = address_to_public_key(self.sender)
+        if public_key is None or not isinstance(self.signature, str):
+            return None
+        try:
+            signature = bytes.fromhex(self.signature)
+        except ValueError:
+            return None
+        if len(signature) != SIGNATURE_SIZE:
+            return None
+        return public_key, self.signing_message(), signature
+    
+    def verify_signature(self) -> bool:
+        """
+        Verifica se a transação foi assinada pela chave do remetente.
+        
+        Returns:
+            bool: True se a assinatura é válida
+        """
+        item = self.verification_item()
+        return item is not None and verify(*item)
     
     def to_json(self) -> str:
         """
@@ -57,3 +277,84 @@ class Transaction:
             str: String formatada da transação
         """
         return f"{self.sender} -> {self.recipient}: {self.amount}"
+
+
+def pack_transactions(transactions: List[Transaction]) -> bytes:
+    """
+    Serializa uma sequência de transações em formato binário colunar.
+    
+    Primeiro vêm os registros de tamanho fixo de todas as transações e depois
+    os bytes UTF-8 de remetentes e destinatários (e os 64 bytes da assinatura,
+    se houver), na mesma ordem. Assim a leitura decodifica todos os registros
+    de uma vez com struct.iter_unpack.
+    
+    Args:
+        transactions (List[Transaction]): Transações a serializar
+        
+    Returns:
+        bytes: Registros seguidos dos endereços
+        
+    Raises:
+        ValueError: Se algum valor não tiver representação exata com 8 casas decimais
+    """
+    records = []
+    strings = []
+    for tx in transactions:
+        sender_length, sender = encode_optional(tx.sender)
+        recipient_length, recipient = encode_optional(tx.recipient)
+        flags = _FLAG_INTEGER_AMOUNT if isinstance(tx.amount, int) else 0
+        micros = tx._timestamp if type(tx._timestamp) is int else datetime_to_micros(tx._timestamp)
+        strings.append(sender)
+        strings.append(recipient)
+        if tx.signature is not None:
+            signature = bytes.fromhex(tx.signature)
+            if len(signature) != SIGNATURE_SIZE or signature.hex() != tx.signature:
+                raise ValueError("Assinatura fora do formato binário (64 bytes em hexadecimal minúsculo)")
+            flags |= _FLAG_SIGNED
+            strings.append(signature)
+        records.append(_RECORD.pack(flags, amount_to_fixed(tx.amount), micros, sender_length, recipient_length))
+    return b''.join(records) + b''.join(strings)
+
+
+def unpack_transactions(data: bytes, offset: int, count: int) -> Tuple[List[Transaction], int]:
+    """
+    Lê `count` transações serializadas por pack_transactions.
+    
+    Args:
+        data (bytes): Buffer de entrada
+        offset (int): Posição do primeiro registro
+        count (int): Número de transações
+        
+    Returns:
+        Tuple[List[Transaction], int]: Transações lidas e a posição logo após elas
+    """
+    strings_start = offset + count * _RECORD.size
+    if strings_start > len(data):
+        raise ValueError("Dados binários truncados")
+    
+    transactions = []
+    position = strings_start
+    for flags, fixed_amount, micros, sender_length, recipient_length in _RECORD.iter_unpack(
+            data[offset:strings_start]):
+        if sender_length == NULL_LENGTH:
+            sender = None
+        else:
+            sender = str(data[position:position + sender_length], 'utf-8')
+            position += sender_length
+        if recipient_length == NULL_LENGTH:
+            recipient = None
+        else:
+            recipient = str(data[position:position + recipient_length], 'utf-8')
+            position += recipient_length
+        if flags & _FLAG_SIGNED:
+            signature = data[position:position + SIGNATURE_SIZE].hex()
+            position += SIGNATURE_SIZE
+        else:
+            signature = None
+        
+        amount = fixed_amount // AMOUNT_SCALE if flags & _FLAG_INTEGER_AMOUNT else fixed_amount / AMOUNT_SCALE
+        transactions.append(Transaction._from_compact(sender, recipient, amount, micros, signature))
+    
+    if position > len(data):
+        raise ValueError("Dados binários truncados")
+    return transactions, position
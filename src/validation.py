@@ -0,0 +1,77 @@
+"""
+Módulo com o relatório da validação semântica da blockchain (Blockchain.validate_semantics).
+"""
+from typing import Optional
+
+# Regras verificadas pela validação semântica
+RULE_BLOCK = 'block'  # Hash, raiz de Merkle, encadeamento, dificuldade e Proof of Work
+RULE_REWARD = 'reward'  # Exatamente uma recompensa de mining_reward por bloco
+RULE_BALANCE = 'balance'  # Nenhum endereço fica com saldo negativo
+RULE_AMOUNT = 'amount'  # Transferências (fora o gênesis) têm valor positivo
+RULE_SIGNATURE = 'signature'  # Transações assinadas pela carteira do remetente (com require_signatures)
+RULE_DUPLICATE = 'duplicate'  # Nenhuma transação (mesmo txid) aparece duas vezes na chain
+RULES = (RULE_BLOCK, RULE_REWARD, RULE_BALANCE, RULE_AMOUNT, RULE_SIGNATURE, RULE_DUPLICATE)
+
+
+class ValidationReport:
+    """
+    Resultado da validação semântica: a primeira violação encontrada (se houver) e o que foi verificado.
+    """
+    
+    def __init__(self):
+        """
+        Inicializa um relatório sem violações.
+        """
+        self.is_valid = True
+        self.rule: Optional[str] = None  # Regra violada (RULE_*)
+        self.height: Optional[int] = None  # Altura do bloco com a violação
+        self.position: Optional[int] = None  # Posição da transação no bloco (None se for o bloco)
+        self.address: Optional[str] = None  # Endereço que ficaria com saldo negativo
+        self.balance: Optional[float] = None  # Saldo que o endereço teria
+        self.message: Optional[str] = None
+        self.blocks_checked = 0
+        self.transactions_checked = 0
+    
+    def fail(self, rule: str, height: int, message: str, position: Optional[int] = None,
+             address: Optional[str] = None, balance: Optional[float] = None) -> 'ValidationReport':
+        """
+        Registra a violação encontrada.
+        
+        Args:
+            rule (str): Regra violada (RULE_*)
+            height (int): Altura do bloco
+            message (str): Descrição da violação
+            position (int, optional): Posição da transação no bloco
+            address (str, optional): Endereço envolvido
+            balance (float, optional): Saldo resultante do endereço
+        
+        Returns:
+            ValidationReport: O próprio relatório
+        """
+        self.is_valid = False
+        self.rule = rule
+        self.height = height
+        self.message = message
+        self.position = position
+        self.address = address
+        self.balance = balance
+        return self
+    
+    def to_dict(self) -> dict:
+        """
+        Converte o relatório para dicionário.
+        
+        Returns:
+            dict: Representação do relatório em dicionário
+        """
+        return {
+            'is_valid': self.is_valid,
+            'rule': self.rule,
+            'height': self.height,
+            'position': self.position,
+            'address': self.address,
+            'balance': self.balance,
+            'message': self.message,
+            'blocks_checked': self.blocks_checked,
+            'transactions_checked': self.transactions_checked
+        }
@@ -0,0 +1,26 @@
+"""
+Fixtures compartilhadas pelos testes.
+"""
+import pytest
+from src.blockchain import Blockchain
+from src.transaction import Transaction
+
+
+@pytest.fixture
+def build_chain():
+    """
+    Fábrica de blockchains com alguns blocos minerados, para os testes de armazenamento.
+    
+    Cada bloco tem a transferência Alice -> Bob de i + 1 (e, com transfers=2, também
+    Bob -> Charlie de 0.5) e a recompensa de Miner1.
+    """
+    def build(store=None, blocks=3, transfers=1, **options):
+        blockchain = Blockchain(store=store, **options)
+        for i in range(blocks):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            if transfers > 1:
+                blockchain.add_transaction(Transaction("Bob", "Charlie", 0.5))
+            blockchain.mine_pending_transactions("Miner1")
+        return blockchain
+    
+    return build
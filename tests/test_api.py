@@ -3,7 +3,13 @@ Testes para a API Flask.
 """
 import pytest
 import json
+import time
+from datetime import datetime
+from src import api
 from src.api import app
+from src.block import Block
+from src.signatures import KeyPair
+from src.transaction import Transaction
 
 
 @pytest.fixture
@@ -16,6 +22,18 @@ def client():
         yield client
 
 
+def wait_for_job(client, job_id, timeout=10.0):
+    """
+    Consulta GET /mine/<job_id> até o job terminar.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        data = json.loads(client.get(f'/mine/{job_id}').data)
+        if data['status'] not in ('pending', 'running') or time.monotonic() > deadline:
+            return data
+        time.sleep(0.01)
+
+
 class TestAPI:
     """
     Classe de testes para a API.
@@ -34,6 +52,19 @@ class TestAPI:
         assert 'pending_transactions' in data
         assert 'mining_reward' in data
     
+    def test_export_blockchain(self, client):
+        """
+        Testa o endpoint GET /blockchain/export.
+        """
+        response = client.get('/blockchain/export')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        
+        lines = response.data.decode('utf-8').splitlines()
+        chain = json.loads(client.get('/blockchain').data)['chain']
+        assert json.loads(lines[0])['format'] == 'blockchain-do-zero'
+        assert [json.loads(line) for line in lines[1:]] == chain
+    
     def test_get_block_valid_index(self, client):
         """
         Testa o endpoint GET /blocks/<index> com índice válido.
@@ -44,6 +75,32 @@ class TestAPI:
         data = json.loads(response.data)
         assert data['index'] == 0
     
+    def test_get_block_binary(self, client):
+        """
+        Testa o endpoint GET /blocks/<index> no formato binário.
+        """
+        response = client.get('/blocks/0', headers={'Accept': 'application/octet-stream'})
+        assert response.status_code == 200
+        assert response.mimetype == 'application/octet-stream'
+        
+        block = Block.from_bytes(response.data)
+        assert block.to_dict() == json.loads(client.get('/blocks/0').data)
+    
+    def test_get_block_binary_fallback(self, client, monkeypatch):
+        """
+        Testa o endpoint GET /blocks/<index> no formato binário com um bloco podado.
+        """
+        pruned = Block(0, [Transaction('Genesis', 'Genesis', 0)], "0")
+        pruned.prune()
+        monkeypatch.setattr(api.blockchain, 'get_block_by_index', lambda index: pruned)
+        
+        response = client.get('/blocks/0', headers={'Accept': 'application/octet-stream'})
+        assert response.status_code == 406
+        
+        response = client.get('/blocks/0', headers={'Accept': 'application/octet-stream, application/json;q=0.5'})
+        assert response.status_code == 200
+        assert json.loads(response.data)['hash'] == pruned.hash
+    
     def test_get_block_invalid_index(self, client):
         """
         Testa o endpoint GET /blocks/<index> com índice inválido.
@@ -58,7 +115,8 @@ class TestAPI:
         transaction_data = {
             'sender': 'Alice',
             'recipient': 'Bob',
-            'amount': 50.0
+            'amount': 50.0,
+            'timestamp': datetime.now().isoformat()
         }
         
         response = client.post('/transactions',
@@ -68,6 +126,13 @@ class TestAPI:
         assert response.status_code == 201
         data = json.loads(response.data)
         assert data['message'] == 'Transação adicionada com sucesso'
+        
+        # Reenviar o mesmo JSON é um replay: mesmo txid, rejeitado
+        response = client.post('/transactions',
+                             data=json.dumps(transaction_data),
+                             content_type='application/json')
+        assert response.status_code == 400
+        assert 'já está pendente' in json.loads(response.data)['error']
     
     def test_add_transaction_invalid_data(self, client):
         """
@@ -85,6 +150,33 @@ class TestAPI:
                              content_type='application/json')
         
         assert response.status_code == 400
+        
+        # Valores que não cabem no formato binário dos blocos
+        for amount in (0.123456789, 1e12):
+            response = client.post('/transactions',
+                                 data=json.dumps(Transaction('Alice', 'Bob', amount).to_dict()),
+                                 content_type='application/json')
+            assert response.status_code == 400
+            assert '8 casas decimais' in json.loads(response.data)['error']
+        
+        # Sem o timestamp do cliente, cada reenvio teria um txid novo
+        response = client.post('/transactions',
+                             data=json.dumps({'sender': 'Alice', 'recipient': 'Bob', 'amount': 50.0}),
+                             content_type='application/json')
+        assert response.status_code == 400
+        assert 'timestamp' in json.loads(response.data)['error']
+        
+        # Timestamps com fuso horário não cabem no formato binário dos blocos
+        aware = dict(Transaction('Alice', 'Bob', 50.0).to_dict(), timestamp='2026-01-01T00:00:01+02:00')
+        response = client.post('/transactions', data=json.dumps(aware), content_type='application/json')
+        assert response.status_code == 400
+        assert 'fuso horário' in json.loads(response.data)['error']
+        
+        # Um timestamp no futuro distante não entra (e não pode bloquear o horizonte de replay)
+        future = Transaction('Alice', 'Bob', 50.0, timestamp=datetime(2099, 1, 1)).to_dict()
+        response = client.post('/transactions', data=json.dumps(future), content_type='application/json')
+        assert response.status_code == 400
+        assert 'relógio do nó' in json.loads(response.data)['error']
     
     def test_get_balance(self, client):
         """
@@ -98,6 +190,20 @@ class TestAPI:
         assert 'balance' in data
         assert data['address'] == 'Alice'
     
+    def test_get_balance_at_height(self, client):
+        """
+        Testa o endpoint GET /balance/<address>?height=.
+        """
+        response = client.get('/balance/Genesis?height=0')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['height'] == 0
+        assert data['balance'] == 0
+        
+        assert client.get('/balance/Alice?height=abc').status_code == 400
+        assert client.get('/balance/Alice?height=100000').status_code == 404
+    
     def test_validate_blockchain(self, client):
         """
         Testa o endpoint GET /validate.
@@ -109,6 +215,21 @@ class TestAPI:
         assert 'is_valid' in data
         assert 'message' in data
         assert data['is_valid'] == True
+        
+        response = client.get('/validate?full=true')
+        assert json.loads(response.data)['is_valid'] == True
+    
+    def test_audit_blockchain(self, client):
+        """
+        Testa o endpoint GET /audit.
+        """
+        response = client.get('/audit')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert 'is_valid' in data
+        assert 'rule' in data
+        assert data['blocks_checked'] >= 1
     
     def test_get_stats(self, client):
         """
@@ -122,4 +243,158 @@ class TestAPI:
         assert 'total_transactions' in data
         assert 'pending_transactions' in data
         assert 'difficulty' in data
+        assert 'target' in data
+        assert int(data['target'], 16) == 2 ** (256 - data['difficulty'])
         assert 'mining_reward' in data
+    
+    def test_mine_block_parallel(self, client, monkeypatch):
+        """
+        Testa o endpoint POST /mine com vários workers.
+        """
+        monkeypatch.setattr(api, 'max_mining_workers', 2)
+        client.post('/transactions',
+                    data=json.dumps(Transaction('Alice', 'Bob', 5.0).to_dict()),
+                    content_type='application/json')
+        
+        response = client.post('/mine',
+                               data=json.dumps({'miner_address': 'Minerador1', 'workers': 2}),
+                               content_type='application/json')
+        
+        assert response.status_code == 202
+        data = wait_for_job(client, json.loads(response.data)['job_id'])
+        assert data['status'] == 'completed'
+        assert data['block']['hash'].startswith('0')
+        
+        response = client.get('/validate')
+        assert json.loads(response.data)['is_valid'] == True
+    
+    def test_mine_block_invalid_workers(self, client):
+        """
+        Testa o endpoint POST /mine com número de workers inválido ou acima do limite.
+        """
+        response = client.post('/mine',
+                               data=json.dumps({'miner_address': 'Minerador1', 'workers': 0}),
+                               content_type='application/json')
+        
+        assert response.status_code == 400
+        
+        response = client.post('/mine',
+                               data=json.dumps({'miner_address': 'Minerador1',
+                                                'workers': api.max_mining_workers + 1}),
+                               content_type='application/json')
+        assert response.status_code == 400
+        assert 'no máximo' in json.loads(response.data)['error']
+    
+    def test_mine_block_background_job(self, client):
+        """
+        Testa o fluxo de mineração em segundo plano via POST /mine e GET /mine/<job_id>.
+        """
+        client.post('/transactions',
+                    data=json.dumps(Transaction('Alice', 'Bob', 5.0).to_dict()),
+                    content_type='application/json')
+        
+        response = client.post('/mine',
+                               data=json.dumps({'miner_address': 'Minerador2'}),
+                               content_type='application/json')
+        assert response.status_code == 202
+        job_id = json.loads(response.data)['job_id']
+        
+        # Leituras continuam respondendo enquanto o job existe
+        assert client.get('/stats').status_code == 200
+        
+        data = wait_for_job(client, job_id)
+        assert data['status'] == 'completed'
+        assert data['nonces_tried'] >= 1
+        assert data['elapsed'] >= 0
+        assert 'hashrate' in data
+        assert data['miner_balance'] == 10.0
+        
+        # Cancelar um job já concluído não é permitido
+        response = client.delete(f'/mine/{job_id}')
+        assert response.status_code == 409
+    
+    def test_get_unknown_mining_job(self, client):
+        """
+        Testa o endpoint GET /mine/<job_id> com id inexistente.
+        """
+        assert client.get('/mine/inexistente').status_code == 404
+        assert client.delete('/mine/inexistente').status_code == 404
+    
+    def test_get_address_transactions(self, client):
+        """
+        Testa o endpoint GET /addresses/<address>/transactions.
+        """
+        client.post('/transactions',
+                    data=json.dumps(Transaction('Eve', 'Frank', 3.0).to_dict()),
+                    content_type='application/json')
+        response = client.post('/mine',
+                               data=json.dumps({'miner_address': 'Eve'}),
+                               content_type='application/json')
+        wait_for_job(client, json.loads(response.data)['job_id'])
+        
+        response = client.get('/addresses/Eve/transactions?limit=1')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['address'] == 'Eve'
+        assert len(data['transactions']) == 1
+        assert data['transactions'][0]['transaction']['recipient'] == 'Frank'
+        cursor = data['next_cursor']
+        assert cursor == f"{data['transactions'][0]['block_index']}:1"
+        
+        data = json.loads(client.get(f'/addresses/Eve/transactions?cursor={cursor}').data)
+        assert data['transactions'][0]['transaction']['sender'] is None
+        assert data['next_cursor'] is None
+        
+        assert client.get('/addresses/Eve/transactions?limit=0').status_code == 400
+        assert client.get('/addresses/Eve/transactions?cursor=1').status_code == 400
+        assert client.get('/addresses/Eve/transactions?cursor=-1:0').status_code == 400
+    
+    def test_add_signed_transaction(self, client):
+        """
+        Testa o endpoint POST /transactions com uma transação assinada.
+        """
+        wallet = KeyPair.generate()
+        transaction = Transaction(wallet.address, 'Bob', 2.5)
+        transaction.sign(wallet)
+        
+        response = client.post('/transactions',
+                               data=json.dumps(transaction.to_dict()),
+                               content_type='application/json')
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data['transaction'] == transaction.to_dict()
+        
+        invalid = dict(transaction.to_dict(), timestamp='ontem')
+        response = client.post('/transactions', data=json.dumps(invalid), content_type='application/json')
+        assert response.status_code == 400
+    
+    def test_get_transaction_by_id(self, client):
+        """
+        Testa o endpoint GET /transactions/<txid> e a rejeição de reenvios.
+        """
+        transaction = Transaction('Ivan', 'Judy', 1.5)
+        response = client.post('/transactions', data=json.dumps(transaction.to_dict()),
+                               content_type='application/json')
+        assert response.status_code == 201
+        txid = json.loads(response.data)['txid']
+        
+        response = client.post('/transactions', data=json.dumps(transaction.to_dict()),
+                               content_type='application/json')
+        assert response.status_code == 400
+        
+        data = json.loads(client.get(f'/transactions/{txid}').data)
+        assert data['status'] == 'pending'
+        assert data['transaction']['recipient'] == 'Judy'
+        
+        response = client.post('/mine', data=json.dumps({'miner_address': 'Ivan'}),
+                               content_type='application/json')
+        wait_for_job(client, json.loads(response.data)['job_id'])
+        
+        response = client.get(f'/transactions/{txid}')
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['status'] == 'confirmed'
+        assert data['confirmations'] == 1
+        assert data['transaction']['recipient'] == 'Judy'
+        
+        assert client.get(f'/transactions/{"0" * 64}').status_code == 404
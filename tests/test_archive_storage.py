@@ -0,0 +1,116 @@
+"""
+Testes para o armazenamento com arquivamento comprimido.
+"""
+import os
+import pytest
+from src.archive_storage import ArchivedBlockStore
+from src.blockchain import Blockchain
+from src.storage import encode_record
+
+
+def _small_store(path, **store_options):
+    """
+    Cria um ArchivedBlockStore com segmentos pequenos para forçar o arquivamento.
+    """
+    store_options.setdefault('segment_size', 2)
+    store_options.setdefault('hot_blocks', 2)
+    return ArchivedBlockStore(path, cache_size=1, **store_options)
+
+
+class TestArchivedBlockStore:
+    """
+    Classe de testes para ArchivedBlockStore.
+    """
+    
+    @pytest.mark.parametrize("compression", ["zlib", "lzma"])
+    def test_blocks_are_archived(self, tmp_path, compression, build_chain):
+        """
+        Testa se os blocos antigos vão para segmentos e continuam legíveis.
+        """
+        path = str(tmp_path / "blocks.dat")
+        blockchain = build_chain(_small_store(path, compression=compression), blocks=7)
+        store = blockchain.store
+        hashes = [block.hash for block in blockchain.chain]
+        
+        # 8 blocos: 3 segmentos de 2 arquivados e 2 blocos recentes sem compressão
+        assert len(store) == 8
+        assert store._archived == 6
+        assert len(store._offsets) == 2
+        assert blockchain.get_block_by_index(1).transactions[0].amount == 1.0
+        assert blockchain.is_chain_valid() == True
+        assert len(store._segments) <= store.segment_cache_size
+        store.close()
+        
+        reopened = ArchivedBlockStore(path, segment_size=2, hot_blocks=2)
+        assert [block.hash for block in reopened] == hashes
+        reopened.close()
+    
+    def test_segment_cache_is_bounded(self, tmp_path, build_chain):
+        """
+        Testa se só os últimos segmentos lidos ficam descomprimidos em memória.
+        """
+        blockchain = build_chain(_small_store(str(tmp_path / "blocks.dat"), segment_cache_size=1), blocks=7)
+        store = blockchain.store
+        store._cache.clear()
+        
+        store[0]
+        store[5]
+        assert list(store._segments) == [2]
+        store.close()
+    
+    def test_recovers_after_interrupted_archive(self, tmp_path, build_chain):
+        """
+        Testa a abertura quando o segmento foi gravado mas o arquivo principal não foi reescrito.
+        """
+        path = str(tmp_path / "blocks.dat")
+        blockchain = build_chain(_small_store(path, hot_blocks=10), blocks=2)
+        hashes = [block.hash for block in blockchain.chain]
+        store = blockchain.store
+        
+        # Simula a queda: grava o segmento e restaura o arquivo principal anterior
+        with open(path, 'rb') as handle:
+            hot_file = handle.read()
+        store.archive_segment()
+        store.close()
+        archive_size = os.path.getsize(path + '.archive')
+        with open(path, 'wb') as handle:
+            handle.write(hot_file)
+        # Segmento incompleto no final do arquivo de segmentos
+        with open(path + '.archive', 'ab') as handle:
+            handle.write(encode_record(b'segmento')[:6])
+        
+        reopened = ArchivedBlockStore(path, segment_size=2, hot_blocks=10)
+        assert len(reopened) == 3
+        assert [block.hash for block in reopened] == hashes
+        assert os.path.getsize(path + '.archive') == archive_size
+        reopened.close()
+    
+    def test_archive_after_truncated_segment(self, tmp_path, build_chain):
+        """
+        Testa se um segmento gravado depois da recuperação de um segmento incompleto é relido.
+        """
+        path = str(tmp_path / "blocks.dat")
+        build_chain(_small_store(path), blocks=3).store.close()
+        with open(path + '.archive', 'ab') as handle:
+            handle.write(encode_record(b'segmento')[:6])
+        
+        blockchain = Blockchain(store=_small_store(path))
+        for _ in range(2):
+            blockchain.mine_pending_transactions("Miner1")
+        hashes = [block.hash for block in blockchain.chain]
+        store = blockchain.store
+        assert store._archived == 4
+        store._cache.clear()
+        store._segments.clear()
+        
+        assert [block.hash for block in store] == hashes
+        store.close()
+    
+    def test_invalid_options(self, tmp_path):
+        """
+        Testa as configurações inválidas.
+        """
+        with pytest.raises(ValueError):
+            ArchivedBlockStore(str(tmp_path / "a.dat"), compression="bz2")
+        with pytest.raises(ValueError):
+            ArchivedBlockStore(str(tmp_path / "b.dat"), segment_size=0)
@@ -0,0 +1,92 @@
+"""
+Testes para o motor de mineração vetorizado.
+"""
+import hashlib
+import threading
+import pytest
+from src import batch_sha256
+from src.batch_sha256 import search_nonce_batched
+from src.block import Block
+from src.mining import MiningCancelled, hash_meets_difficulty
+from src.transaction import Transaction
+
+
+class TestBatchSHA256:
+    """
+    Classe de testes para o SHA-256 em lotes.
+    """
+    
+    @pytest.mark.parametrize("prefix_len", [0, 10, 55, 56, 63, 64, 119, 200])
+    def test_lanes_match_hashlib(self, prefix_len):
+        """
+        Testa se o SHA-256 vetorizado é idêntico ao hashlib (inclusive na troca de dígitos).
+        """
+        np = pytest.importorskip("numpy")
+        prefix = bytes(range(prefix_len))
+        midstate, remainder = batch_sha256._prefix_midstate(prefix)
+        
+        for start, end in [(0, 10), (95, 100), (99990, 100000)]:
+            digits = len(str(start))
+            state = batch_sha256._hash_lanes(midstate, remainder, len(prefix),
+                                             np.arange(start, end, dtype=np.int64), digits)
+            for lane, nonce in enumerate(range(start, end)):
+                digest = b"".join(int(word).to_bytes(4, 'big') for word in state[:, lane])
+                assert digest == hashlib.sha256(prefix + str(nonce).encode('utf-8')).digest()
+    
+    def test_search_finds_first_valid_nonce(self):
+        """
+        Testa se a busca em lotes encontra o mesmo nonce que a busca sequencial.
+        """
+        prefix = b"cabecalho-do-bloco"
+        nonce, block_hash, attempts = search_nonce_batched(prefix, 12, batch_size=1000)
+        
+        expected = next(n for n in range(nonce + 1)
+                        if hash_meets_difficulty(hashlib.sha256(prefix + str(n).encode()).hexdigest(), 12))
+        assert nonce == expected
+        assert attempts == nonce + 1
+        assert block_hash == hashlib.sha256(prefix + str(nonce).encode('utf-8')).hexdigest()
+    
+    def test_search_without_numpy(self, monkeypatch):
+        """
+        Testa o fallback para hashlib quando o NumPy não está disponível.
+        """
+        monkeypatch.setattr(batch_sha256, "NUMPY_AVAILABLE", False)
+        prefix = b"cabecalho-do-bloco"
+        
+        nonce, block_hash, _ = search_nonce_batched(prefix, 8, batch_size=100)
+        
+        assert hash_meets_difficulty(block_hash, 8) == True
+        assert block_hash == hashlib.sha256(prefix + str(nonce).encode('utf-8')).hexdigest()
+    
+    def test_search_cancelled(self):
+        """
+        Testa o cancelamento da busca em lotes.
+        """
+        stop_event = threading.Event()
+        stop_event.set()
+        
+        with pytest.raises(MiningCancelled):
+            search_nonce_batched(b"prefixo", 64, batch_size=100, stop_event=stop_event)
+    
+    def test_block_mining_with_numpy_engine(self):
+        """
+        Testa a mineração de um bloco com o motor vetorizado.
+        """
+        transactions = [Transaction("Alice", "Bob", float(i)) for i in range(50)]
+        block = Block(1, transactions, "previous_hash")
+        reference = Block(1, transactions, "previous_hash", timestamp=block.timestamp)
+        
+        block.mine_block(10, engine='numpy')
+        reference.mine_block(10)
+        
+        assert block.hash == block.calculate_hash()
+        assert block.is_valid() == True
+        assert (block.nonce, block.hash) == (reference.nonce, reference.hash)
+    
+    def test_unknown_engine(self):
+        """
+        Testa a escolha de um motor inexistente.
+        """
+        block = Block(1, [], "previous_hash")
+        with pytest.raises(ValueError):
+            block.mine_block(1, engine='gpu')
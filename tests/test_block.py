@@ -1,6 +1,7 @@
 """
 Testes para a classe Block.
 """
+import json
 import pytest
 from datetime import datetime
 from src.block import Block
@@ -45,10 +46,11 @@ class TestBlock:
         transactions = [Transaction("Alice", "Bob", 50.0)]
         block = Block(1, transactions, "previous_hash")
         
-        difficulty = 2
+        difficulty = 8  # Dificuldade em bits: 8 bits = 2 zeros hexadecimais
         block.mine_block(difficulty)
         
-        assert block.hash.startswith("0" * difficulty)
+        assert block.hash.startswith("00")
+        assert block.difficulty == difficulty
         assert block.nonce > 0
     
     def test_block_validation(self):
@@ -78,3 +80,206 @@ class TestBlock:
         assert 'timestamp' in block_dict
         assert 'hash' in block_dict
         assert 'nonce' in block_dict
+    
+    def test_mined_hash_matches_calculate_hash(self):
+        """
+        Testa se o hash obtido pelo midstate é idêntico ao calculate_hash.
+        """
+        transactions = [Transaction(f"Alice{i}", "Bob", float(i)) for i in range(500)]
+        block = Block(1, transactions, "previous_hash")
+        
+        block.mine_block(8)
+        
+        assert block.hash.startswith("00")
+        assert block.hash == block.calculate_hash()
+        assert block.is_valid() == True
+    
+    def test_parallel_block_mining(self):
+        """
+        Testa a mineração do bloco com vários processos.
+        """
+        transactions = [Transaction("Alice", "Bob", 50.0)]
+        block = Block(1, transactions, "previous_hash")
+        
+        block.mine_block(8, workers=2)
+        
+        assert block.hash.startswith("00")
+        assert block.is_valid() == True
+    
+    def test_block_merkle_root(self):
+        """
+        Testa a raiz de Merkle e a prova de inclusão de uma transação.
+        """
+        from src.merkle import verify_merkle_proof
+        
+        transactions = [Transaction("Alice", "Bob", float(i)) for i in range(5)]
+        block = Block(1, transactions, "previous_hash")
+        
+        assert block.to_dict()['merkle_root'] == block.merkle_root
+        proof = block.get_merkle_proof(3)
+        assert verify_merkle_proof(transactions[3].calculate_hash(), proof, block.merkle_root) == True
+    
+    def test_block_duplicate_transactions(self):
+        """
+        Testa se um bloco com uma transação repetida é inválido, mesmo com a mesma raiz de Merkle.
+        """
+        transactions = [Transaction("Alice", "Bob", float(i)) for i in range(3)]
+        block = Block(1, transactions, "previous_hash")
+        duplicated = Block(1, transactions + [transactions[-1]], "previous_hash")
+        
+        assert duplicated.merkle_root == block.merkle_root
+        assert block.is_valid() == True
+        assert duplicated.is_valid() == False
+    
+    def test_block_tampered_transaction(self):
+        """
+        Testa se a alteração de uma transação invalida o bloco.
+        """
+        transactions = [Transaction("Alice", "Bob", 50.0)]
+        block = Block(1, transactions, "previous_hash")
+        
+        transactions[0].amount = 500.0
+        
+        assert block.hash == block.calculate_hash()
+        assert block.is_valid() == False
+    
+    def test_block_bit_granular_difficulty(self):
+        """
+        Testa a mineração com dificuldade que não é múltipla de 4 bits.
+        """
+        transactions = [Transaction("Alice", "Bob", 50.0)]
+        block = Block(1, transactions, "previous_hash")
+        
+        block.mine_block(6)
+        
+        assert int(block.hash, 16) < 2 ** (256 - 6)
+        assert block.meets_difficulty() == True
+        assert block.is_valid() == True
+        
+        # A dificuldade faz parte do cabeçalho
+        block.difficulty = 5
+        assert block.is_valid() == False
+    
+    def test_block_mining_cancelled(self):
+        """
+        Testa o cancelamento da mineração (sequencial e paralela) por um evento de parada.
+        """
+        import threading
+        from src.mining import MiningCancelled
+        
+        stop_event = threading.Event()
+        stop_event.set()
+        block = Block(1, [Transaction("Alice", "Bob", 50.0)], "previous_hash")
+        
+        with pytest.raises(MiningCancelled):
+            block.mine_block(64, stop_event=stop_event)
+        with pytest.raises(MiningCancelled):
+            block.mine_block(64, workers=2, stop_event=stop_event)
+    
+    def test_block_mining_is_silent_and_records_metrics(self, capsys):
+        """
+        Testa se a mineração não imprime nada e registra as métricas no bloco.
+        """
+        block = Block(1, [Transaction("Alice", "Bob", 50.0)], "previous_hash")
+        progress = []
+        
+        result = block.mine_block(8, progress_callback=progress.append)
+        
+        assert capsys.readouterr().out == ""
+        assert block.mining_result is result
+        assert result.attempts == block.nonce + 1
+        assert result.elapsed >= 0
+        assert result.hashrate >= 0
+        assert progress[-1] == result.attempts
+        assert result.to_dict()['hash'] == block.hash
+    
+    def test_block_mining_with_reporter(self, capsys):
+        """
+        Testa o reporter de console e um reporter customizado.
+        """
+        from src.mining import ConsoleMiningReporter
+        
+        class RecordingReporter:
+            def __init__(self):
+                self.events = []
+            
+            def on_start(self, block, difficulty):
+                self.events.append(('start', difficulty))
+            
+            def on_progress(self, block, attempts):
+                self.events.append(('progress', attempts))
+            
+            def on_finish(self, block, result):
+                self.events.append(('finish', result.attempts))
+        
+        reporter = RecordingReporter()
+        block = Block(1, [Transaction("Alice", "Bob", 50.0)], "previous_hash")
+        result = block.mine_block(4, reporter=reporter)
+        
+        assert reporter.events[0] == ('start', 4)
+        assert reporter.events[-1] == ('finish', result.attempts)
+        
+        block = Block(2, [Transaction("Alice", "Bob", 50.0)], "previous_hash")
+        block.mine_block(4, reporter=ConsoleMiningReporter())
+        assert "Bloco 2 minerado com sucesso" in capsys.readouterr().out
+    
+    def test_block_from_dict(self):
+        """
+        Testa a reconstrução de um bloco a partir do dicionário.
+        """
+        block = Block(1, [Transaction("Alice", "Bob", 50.0), Transaction(None, "Miner", 10)], "previous_hash")
+        block.mine_block(4)
+        
+        restored = Block.from_dict(block.to_dict())
+        
+        assert restored.to_dict() == block.to_dict()
+        assert restored.is_valid() == True
+    
+    def test_block_bytes_roundtrip(self):
+        """
+        Testa a serialização binária do bloco.
+        """
+        block = Block(1, [Transaction("Alice", "Bob", 50.0), Transaction(None, "Miner", 10)], "0" * 64)
+        block.mine_block(4)
+        
+        data = block.to_bytes()
+        restored = Block.from_bytes(data)
+        
+        assert restored.to_dict() == block.to_dict()
+        assert restored.is_valid() == True
+        assert len(data) < len(json.dumps(block.to_dict()))
+        
+        genesis = Block(0, [], "0")
+        assert Block.from_bytes(genesis.to_bytes()).to_dict() == genesis.to_dict()
+        
+        with pytest.raises(ValueError):
+            Block.from_bytes(data + b'\x00')
+    
+    def test_block_uses_slots(self):
+        """
+        Testa se o bloco usa __slots__ e mantém o timestamp como datetime.
+        """
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        block = Block(1, [Transaction("Alice", "Bob", 50.0)], "previous_hash", timestamp)
+        
+        assert not hasattr(block, '__dict__')
+        assert block.timestamp == timestamp
+        assert Block.from_dict(block.to_dict()).timestamp == timestamp
+    
+    def test_pruned_block(self):
+        """
+        Testa a validação e a serialização de um bloco podado.
+        """
+        block = Block(1, [Transaction("Alice", "Bob", 50.0)], "previous_hash")
+        block.mine_block(4)
+        block.prune()
+        
+        assert block.is_pruned == True
+        assert block.is_valid() == True
+        assert block.to_dict()['transactions'] is None
+        assert Block.from_dict(block.to_dict()).is_valid() == True
+        
+        with pytest.raises(ValueError):
+            block.get_merkle_proof(0)
+        with pytest.raises(ValueError):
+            block.to_bytes()
@@ -2,7 +2,12 @@
 Testes para a classe Blockchain.
 """
 import pytest
+from datetime import datetime, timedelta, timezone
+from src.block import Block
 from src.blockchain import Blockchain
+from src.signatures import KeyPair
+from src.sqlite_storage import SQLiteBlockStore
+from src.storage import BlockStore
 from src.transaction import Transaction
 
 
@@ -18,7 +23,7 @@ class TestBlockchain:
         blockchain = Blockchain()
         
         assert len(blockchain.chain) == 1  # Bloco gênesis
-        assert blockchain.difficulty == 2
+        assert blockchain.difficulty == 4  # Dificuldade em bits
         assert blockchain.mining_reward == 10
         assert len(blockchain.pending_transactions) == 0
     
@@ -118,3 +123,691 @@ class TestBlockchain:
         # Teste com índice inválido
         block = blockchain.get_block_by_index(999)
         assert block is None
+    
+    def test_mine_pending_transactions_parallel(self):
+        """
+        Testa a mineração paralela de transações pendentes.
+        """
+        blockchain = Blockchain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 50.0))
+        
+        new_block = blockchain.mine_pending_transactions("Miner1", workers=3)
+        
+        assert new_block.is_valid() == True
+        assert new_block.meets_difficulty() == True
+        assert blockchain.is_chain_valid() == True
+        assert blockchain.get_balance("Miner1") == 10.0
+    
+    def test_difficulty_retargeting(self):
+        """
+        Testa o reajuste automático da dificuldade a cada N blocos.
+        """
+        blockchain = Blockchain(difficulty=4, retarget_interval=3, target_block_time=60.0)
+        
+        for _ in range(3):
+            blockchain.mine_pending_transactions("Miner1")
+        
+        # Os blocos 0..2 saíram muito mais rápido que 60s cada: a dificuldade sobe
+        assert [block.difficulty for block in blockchain.chain] == [4, 4, 4, 6]
+        assert blockchain.difficulty == 6
+        assert blockchain.is_chain_valid() == True
+    
+    def test_chain_validation_rejects_wrong_difficulty(self):
+        """
+        Testa se um bloco minerado com dificuldade diferente da esperada é rejeitado.
+        """
+        from src.block import Block
+        
+        blockchain = Blockchain(difficulty=4, retarget_interval=0)
+        block = Block(1, [Transaction(None, "Miner1", 10)], blockchain.get_latest_block().hash)
+        block.mine_block(1)
+        blockchain.chain.append(block)
+        
+        assert block.is_valid() == True
+        assert blockchain.is_chain_valid() == False
+    
+    def test_blockchain_is_silent_by_default(self, capsys):
+        """
+        Testa se a blockchain não imprime nada ao ser criada e ao minerar.
+        """
+        blockchain = Blockchain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 50.0))
+        new_block = blockchain.mine_pending_transactions("Miner1")
+        
+        assert capsys.readouterr().out == ""
+        assert new_block.mining_result.attempts >= 1
+        assert blockchain.chain[0].mining_result is not None
+    
+    def test_balance_index_matches_full_scan(self):
+        """
+        Testa se o índice de saldos coincide com percorrer toda a chain.
+        """
+        def full_scan(blockchain, address):
+            balance = 0
+            for block in blockchain.chain:
+                for transaction in block.transactions:
+                    if transaction.sender == address:
+                        balance -= transaction.amount
+                    if transaction.recipient == address:
+                        balance += transaction.amount
+            return balance
+        
+        blockchain = Blockchain()
+        addresses = ["Alice", "Bob", "Charlie"]
+        for i in range(4):
+            for j, sender in enumerate(addresses):
+                blockchain.add_transaction(Transaction(sender, addresses[(i + j) % 3], round(0.1 * (i + j + 1), 1)))
+            blockchain.mine_pending_transactions(addresses[i % 3])
+        
+        for address in addresses + ["Genesis", None, "Desconhecido"]:
+            assert blockchain.get_balance(address) == full_scan(blockchain, address)
+        
+        expected = dict(blockchain.balances)
+        blockchain.rebuild_indexes()
+        assert blockchain.balances == expected
+    
+    def test_address_transactions_pagination(self):
+        """
+        Testa o índice de histórico por endereço e a paginação por cursor.
+        """
+        blockchain = Blockchain()
+        for i in range(3):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            blockchain.add_transaction(Transaction("Charlie", "Dave", 1.0))
+            blockchain.mine_pending_transactions("Alice")
+        
+        # Alice: 3 envios + 3 recompensas
+        page, cursor = blockchain.get_address_transactions("Alice", limit=4)
+        assert len(page) == 4
+        assert cursor == (3, 0)
+        assert page[0][:2] == (1, 0)
+        assert page[0][2].amount == 1.0
+        
+        page, cursor = blockchain.get_address_transactions("Alice", cursor=cursor, limit=4)
+        assert len(page) == 2
+        assert cursor is None
+        
+        page, _ = blockchain.get_address_transactions("Bob")
+        assert [tx.amount for _, _, tx in page] == [1.0, 2.0, 3.0]
+        assert blockchain.get_address_transactions("Ninguem") == ([], None)
+        
+        with pytest.raises(ValueError):
+            blockchain.get_address_transactions("Alice", cursor=(-1, 0))
+    
+    def test_address_cursor_survives_prune(self):
+        """
+        Testa se um cursor obtido antes de uma poda continua a partir da mesma transação.
+        """
+        blockchain = Blockchain(prune_depth=3)
+        for i in range(3):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            blockchain.mine_pending_transactions("Miner1")
+        
+        page, cursor = blockchain.get_address_transactions("Alice", limit=2)
+        assert [tx.amount for _, _, tx in page] == [1.0, 2.0]
+        
+        # A poda tira o bloco 1 do índice; um deslocamento na lista pularia o valor 3.0
+        blockchain.add_transaction(Transaction("Alice", "Bob", 4.0))
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.chain[1].is_pruned
+        
+        page, cursor = blockchain.get_address_transactions("Alice", cursor=cursor, limit=2)
+        assert [tx.amount for _, _, tx in page] == [3.0, 4.0]
+        assert cursor is None
+    
+    def test_from_dict_roundtrip(self):
+        """
+        Testa a reconstrução da blockchain a partir de to_dict.
+        """
+        blockchain = Blockchain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 5.0))
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.add_transaction(Transaction("Bob", "Charlie", 1.0))
+        
+        restored = Blockchain.from_dict(blockchain.to_dict())
+        
+        assert restored.to_dict() == blockchain.to_dict()
+        assert restored.get_balance("Bob") == 5.0
+        assert len(restored.pending_transactions) == 1
+    
+    def test_append_block_validates(self):
+        """
+        Testa se append_block rejeita blocos fora de ordem ou adulterados.
+        """
+        blockchain = Blockchain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 5.0))
+        blockchain.mine_pending_transactions("Miner1")
+        
+        copy = Blockchain(create_genesis=False)
+        with pytest.raises(ValueError):
+            copy.append_block(blockchain.chain[1])
+        
+        copy.append_block(blockchain.chain[0])
+        blockchain.chain[1].nonce += 1
+        with pytest.raises(ValueError, match="inválido"):
+            copy.append_block(blockchain.chain[1])
+        assert len(copy.chain) == 1
+    
+    def test_pruning_keeps_headers_and_balances(self):
+        """
+        Testa se a poda descarta transações antigas sem alterar saldos nem a validação.
+        """
+        pruned = Blockchain(prune_depth=2)
+        full = Blockchain()
+        for i in range(5):
+            for blockchain in (pruned, full):
+                blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+                blockchain.mine_pending_transactions("Miner1")
+        
+        assert pruned.pruned_height == 4
+        assert all(block.is_pruned for block in pruned.chain[:4])
+        assert not any(block.is_pruned for block in pruned.chain[4:])
+        
+        for address in ("Alice", "Bob", "Miner1", None):
+            assert pruned.get_balance(address) == full.get_balance(address)
+        assert pruned.is_chain_valid() == True
+        assert pruned.count_transactions() == full.count_transactions()
+        assert len(pruned.get_all_transactions()) == 4
+        
+        # O histórico só contém os blocos retidos
+        page, _ = pruned.get_address_transactions("Bob")
+        assert [block_index for block_index, _, _ in page] == [4, 5]
+        
+        # Reconstruir os índices parte do snapshot da poda
+        pruned.rebuild_indexes()
+        assert pruned.get_balance("Bob") == full.get_balance("Bob")
+        
+        # Adulterar um cabeçalho podado continua sendo detectado
+        pruned.chain[2].nonce += 1
+        assert pruned.is_chain_valid() == False
+    
+    def test_pruning_requires_in_memory_chain(self, tmp_path):
+        """
+        Testa as configurações inválidas de poda.
+        """
+        with pytest.raises(ValueError):
+            Blockchain(prune_depth=-1)
+        with pytest.raises(ValueError):
+            Blockchain(prune_depth=2, store=SQLiteBlockStore(str(tmp_path / "chain.db")))
+    
+    def test_balance_at_height(self, tmp_path):
+        """
+        Testa o saldo histórico a partir dos checkpoints.
+        """
+        blockchain = Blockchain(checkpoint_interval=3)
+        sqlite_chain = Blockchain(store=SQLiteBlockStore(str(tmp_path / "chain.db")))
+        expected = []
+        for i in range(8):
+            for chain in (blockchain, sqlite_chain):
+                chain.add_transaction(Transaction("Alice", "Bob", i + 1))
+                chain.mine_pending_transactions("Miner1" if i % 2 else "Miner2")
+            expected.append({address: blockchain.get_balance(address)
+                             for address in ("Alice", "Bob", "Miner1", "Miner2", None)})
+        
+        assert blockchain.balance_checkpoints["Bob"][0] == (3, 3)
+        for height in range(1, 9):
+            for address, balance in expected[height - 1].items():
+                assert blockchain.get_balance(address, at_height=height) == balance
+                assert sqlite_chain.get_balance(address, at_height=height) == balance
+        assert blockchain.get_balance("Bob", at_height=0) == 0
+        
+        with pytest.raises(ValueError):
+            blockchain.get_balance("Bob", at_height=9)
+        with pytest.raises(ValueError):
+            Blockchain(checkpoint_interval=0)
+    
+    def test_balance_at_height_with_pruning(self):
+        """
+        Testa o saldo histórico quando os blocos antigos foram podados.
+        """
+        blockchain = Blockchain(prune_depth=2, checkpoint_interval=2)
+        for i in range(6):
+            blockchain.add_transaction(Transaction("Alice", "Bob", i + 1))
+            blockchain.mine_pending_transactions("Miner1")
+        
+        # Altura 3 cai exatamente em um checkpoint; altura 2 exigiria reaplicar um bloco podado
+        assert blockchain.get_balance("Bob", at_height=3) == 1 + 2 + 3
+        with pytest.raises(ValueError, match="podadas"):
+            blockchain.get_balance("Bob", at_height=2)
+        assert blockchain.get_balance("Bob", at_height=6) == blockchain.get_balance("Bob")
+        
+        # Após reconstruir os índices, o histórico começa no snapshot da poda
+        blockchain.rebuild_indexes()
+        assert blockchain.get_balance("Bob", at_height=4) == 1 + 2 + 3 + 4
+        assert blockchain.get_balance("Bob", at_height=6) == blockchain.get_balance("Bob")
+        with pytest.raises(ValueError):
+            blockchain.get_balance("Bob", at_height=3)
+    
+    def test_incremental_validation(self, monkeypatch):
+        """
+        Testa se a validação só verifica os blocos novos, a menos que algo tenha mudado.
+        """
+        blockchain = Blockchain()
+        for i in range(3):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            blockchain.mine_pending_transactions("Miner1")
+        
+        checked = []
+        block_error = blockchain._block_error
+        monkeypatch.setattr(blockchain, '_block_error',
+                            lambda block, previous: checked.append(block.index) or block_error(block, previous))
+        
+        assert blockchain.is_chain_valid() == True
+        assert checked == [1, 2, 3]
+        
+        # Só o bloco novo é verificado
+        blockchain.mine_pending_transactions("Miner1")
+        checked.clear()
+        assert blockchain.is_chain_valid() == True
+        assert checked == [4]
+        
+        # Modo completo revalida tudo
+        checked.clear()
+        assert blockchain.is_chain_valid(full=True) == True
+        assert checked == [1, 2, 3, 4]
+        
+        # Alterar uma transação de um bloco já verificado força a revalidação
+        checked.clear()
+        blockchain.chain[2].transactions[0].amount = 1000.0
+        assert blockchain.is_chain_valid() == False
+        assert checked == [1, 2]
+    
+    def test_incremental_validation_detects_replaced_chain(self):
+        """
+        Testa se substituir a chain ou o último bloco verificado força a revalidação.
+        """
+        blockchain = Blockchain()
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.is_chain_valid() == True
+        
+        tampered = Blockchain.from_dict(blockchain.to_dict())
+        tampered.chain[1].nonce += 1
+        blockchain.chain = tampered.chain
+        assert blockchain.is_chain_valid() == False
+        
+        other = Blockchain()
+        other.mine_pending_transactions("Miner2")
+        assert other.is_chain_valid() == True
+        other.chain[-1] = blockchain.chain[-1]
+        assert other.is_chain_valid() == False
+    
+    @pytest.mark.parametrize("height", [1, 6, 11])
+    def test_parallel_validation_matches_serial(self, capsys, height):
+        """
+        Testa se a validação paralela informa o mesmo bloco inválido que a sequencial.
+        """
+        blockchain = Blockchain(difficulty=1, retarget_interval=4, target_block_time=0.01)
+        for i in range(12):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.is_chain_valid(workers=2) == True
+        
+        tampered = Blockchain.from_dict(blockchain.to_dict(), retarget_interval=4, target_block_time=0.01)
+        tampered.chain[height].transactions[0].amount = 1000.0
+        tampered.chain[height + 1].nonce += 1
+        capsys.readouterr()
+        
+        assert tampered.is_chain_valid(workers=2) == False
+        parallel_output = capsys.readouterr().out
+        assert tampered.is_chain_valid() == False
+        assert parallel_output == capsys.readouterr().out == f"Bloco {height} é inválido!\n"
+    
+    @pytest.mark.parametrize("tamper", [
+        lambda chain: setattr(chain[3], 'merkle_root', chain[3].merkle_root + "ab"),
+        lambda chain: setattr(chain[3], 'merkle_root', chain[3].merkle_root.upper()),
+        lambda chain: setattr(chain[-1], 'hash', chain[-1].hash + "00"),
+        lambda chain: setattr(chain[5], 'nonce', -1),
+    ])
+    def test_parallel_validation_with_unpackable_blocks(self, tamper):
+        """
+        Testa se blocos que não voltam idênticos do formato binário são validados como na sequencial.
+        """
+        blockchain = Blockchain(difficulty=1, retarget_interval=0)
+        for _ in range(9):
+            blockchain.mine_pending_transactions("Miner1")
+        tamper(blockchain.chain)
+        
+        assert blockchain.is_chain_valid(full=True) == False
+        assert blockchain.is_chain_valid(full=True, workers=2) == False
+    
+    def test_parallel_validation_checks_links_and_difficulty(self):
+        """
+        Testa se o encadeamento e a dificuldade esperada também são verificados na validação paralela.
+        """
+        from src.block import Block
+        
+        blockchain = Blockchain(difficulty=4, retarget_interval=0)
+        for _ in range(6):
+            blockchain.mine_pending_transactions("Miner1")
+        block = Block(7, [Transaction(None, "Miner1", 10)], blockchain.get_latest_block().hash)
+        block.mine_block(1)
+        blockchain.chain.append(block)
+        
+        assert blockchain.is_chain_valid(workers=2) == False
+        
+        blockchain.chain.pop()
+        assert blockchain.is_chain_valid(workers=2) == True
+        blockchain.chain[3].previous_hash = blockchain.chain[1].hash
+        assert blockchain.is_chain_valid(full=True, workers=2) == False
+    
+    def test_require_signatures(self, monkeypatch):
+        """
+        Testa se a assinatura é verificada na entrada do mempool e não de novo ao minerar.
+        """
+        from src import signatures
+        
+        wallet = KeyPair.generate()
+        blockchain = Blockchain(require_signatures=True)
+        blockchain.mine_pending_transactions(wallet.address)
+        
+        with pytest.raises(ValueError, match="Assinatura"):
+            blockchain.add_transaction(Transaction(wallet.address, "Bob", 5.0))
+        forged = Transaction(wallet.address, "Bob", 5.0)
+        forged.sign(wallet)
+        forged.amount = 9.0
+        with pytest.raises(ValueError, match="Assinatura"):
+            blockchain.add_transaction(forged)
+        
+        transaction = Transaction(wallet.address, "Bob", 5.0)
+        transaction.sign(wallet)
+        blockchain.add_transaction(transaction)
+        assert transaction.txid in blockchain._verified_transactions
+        
+        # Com o cache, o bloco não verifica a assinatura de novo
+        calls = []
+        monkeypatch.setattr(signatures, 'verify', lambda *item: calls.append(item) or True)
+        block = blockchain.prepare_block("Miner1")
+        block.mine_block(blockchain.get_difficulty_for_height(block.index))
+        blockchain.append_block(block)
+        assert calls == []
+        assert blockchain.get_balance("Bob") == 5.0
+        
+        # A transação minerada continua no cache, então a auditoria também não a verifica
+        assert transaction.txid in blockchain._verified_transactions
+        assert blockchain.validate_semantics().is_valid == True
+        assert calls == []
+    
+    def test_signature_cache_is_bounded(self):
+        """
+        Testa se o cache de assinaturas verificadas descarta os ids mais antigos.
+        """
+        wallet = KeyPair.generate()
+        blockchain = Blockchain(require_signatures=True, signature_cache_size=2)
+        blockchain.mine_pending_transactions(wallet.address)
+        transactions = []
+        for amount in (1.0, 2.0, 3.0):
+            transaction = Transaction(wallet.address, "Bob", amount)
+            transaction.sign(wallet)
+            blockchain.add_transaction(transaction)
+            transactions.append(transaction.txid)
+        
+        assert list(blockchain._verified_transactions) == transactions[1:]
+        with pytest.raises(ValueError):
+            Blockchain(signature_cache_size=-1)
+    
+    def test_append_block_rejects_invalid_signature(self):
+        """
+        Testa se append_block verifica as assinaturas que não passaram pelo mempool.
+        """
+        wallet = KeyPair.generate()
+        source = Blockchain()
+        source.mine_pending_transactions(wallet.address)
+        signed = Transaction(wallet.address, "Bob", 2.0)
+        signed.sign(wallet)
+        source.add_transaction(signed)
+        source.add_transaction(Transaction(wallet.address, "Carol", 1.0))
+        source.mine_pending_transactions("Miner1")
+        
+        copy = Blockchain(create_genesis=False, require_signatures=True)
+        copy.append_block(source.chain[0])
+        copy.append_block(source.chain[1])
+        with pytest.raises(ValueError, match="Bloco 2, transação 1: assinatura ausente"):
+            copy.append_block(source.chain[2])
+        assert len(copy.chain) == 2
+    
+    def test_duplicate_transactions_rejected(self):
+        """
+        Testa se a mesma transação não entra duas vezes no mempool nem volta depois de minerada.
+        """
+        blockchain = Blockchain()
+        transaction = Transaction("Alice", "Bob", 5.0)
+        blockchain.add_transaction(transaction)
+        
+        with pytest.raises(ValueError, match="pendente"):
+            blockchain.add_transaction(Transaction.from_dict(transaction.to_dict()))
+        assert len(blockchain.pending_transactions) == 1
+        
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.mempool_ids == set()
+        with pytest.raises(ValueError, match="já está na chain"):
+            blockchain.add_transaction(Transaction.from_dict(transaction.to_dict()))
+        assert blockchain.pending_transactions == []
+        assert blockchain.get_balance("Bob") == 5.0
+    
+    def test_get_transaction(self):
+        """
+        Testa a localização de transações pendentes, mineradas, podadas e desconhecidas.
+        """
+        blockchain = Blockchain(prune_depth=2)
+        first = Transaction("Alice", "Bob", 1.0)
+        blockchain.add_transaction(first)
+        blockchain.mine_pending_transactions("Miner1")
+        pending = Transaction("Bob", "Carol", 2.0)
+        blockchain.add_transaction(pending)
+        
+        assert blockchain.get_transaction(first.txid) == (1, 0, first)
+        assert blockchain.get_transaction(pending.txid) == (None, 0, pending)
+        assert blockchain.get_transaction("0" * 64) is None
+        
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.get_transaction(pending.txid) == (2, 0, pending)
+        # O bloco 1 foi podado: a transação não é mais localizada, mas o id recente ainda barra o replay
+        assert blockchain.get_transaction(first.txid) is None
+        with pytest.raises(ValueError, match="já está na chain"):
+            blockchain.add_transaction(Transaction.from_dict(first.to_dict()))
+    
+    @pytest.mark.parametrize("amount", [0.123456789, 1e12, float('inf')])
+    def test_add_transaction_rejects_unrepresentable_amount(self, tmp_path, amount):
+        """
+        Testa se valores fora do formato binário são recusados na entrada, e não ao gravar o bloco.
+        """
+        store = BlockStore(str(tmp_path / "blocks.dat"), serialization='binary')
+        blockchain = Blockchain(store=store)
+        
+        with pytest.raises(ValueError, match="Valor"):
+            blockchain.add_transaction(Transaction("Alice", "Bob", amount))
+        assert blockchain.pending_transactions == []
+        assert blockchain.mempool_ids == set()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 0.12345678))
+        blockchain.mine_pending_transactions("Miner1")
+        store.close()
+    
+    def test_add_transaction_rejects_aware_timestamp(self, tmp_path):
+        """
+        Testa se timestamps com fuso horário são recusados na entrada, e não ao gravar o bloco.
+        """
+        store = BlockStore(str(tmp_path / "blocks.dat"), serialization='binary')
+        blockchain = Blockchain(store=store)
+        
+        with pytest.raises(ValueError, match="fuso horário"):
+            blockchain.add_transaction(Transaction("Alice", "Bob", 1.0, timestamp=datetime.now(timezone.utc)))
+        assert blockchain.pending_transactions == []
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.pending_transactions == []
+        store.close()
+    
+    def test_failed_mining_restores_transactions(self, tmp_path, monkeypatch):
+        """
+        Testa se as transações voltam ao mempool quando o bloco minerado não é gravado.
+        """
+        store = BlockStore(str(tmp_path / "blocks.dat"))
+        blockchain = Blockchain(store=store)
+        transaction = Transaction("Alice", "Bob", 5.0)
+        blockchain.add_transaction(transaction)
+        
+        def failing_append(block):
+            raise OSError("disco cheio")
+        monkeypatch.setattr(store, 'append', failing_append)
+        with pytest.raises(OSError):
+            blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.pending_transactions == [transaction]
+        assert blockchain.mempool_ids == {transaction.txid}
+        
+        monkeypatch.undo()
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.get_transaction(transaction.txid) == (1, 0, transaction)
+        store.close()
+    
+    def test_restore_skips_transactions_mined_elsewhere(self):
+        """
+        Testa se as transações incluídas por outro bloco durante a mineração não voltam ao mempool.
+        """
+        blockchain = Blockchain(difficulty=1, retarget_interval=0)
+        included = Transaction("Alice", "Bob", 1.0)
+        left_out = Transaction("Alice", "Carol", 2.0)
+        blockchain.add_transaction(included)
+        blockchain.add_transaction(left_out)
+        candidate = blockchain.prepare_block("Miner1")
+        
+        peer = Block(1, [included, Transaction(None, "Miner2", 10)], blockchain.get_latest_block().hash,
+                     difficulty=blockchain.get_difficulty_for_height(1))
+        peer.mine_block(peer.difficulty)
+        blockchain.append_block(peer)
+        
+        candidate.mine_block(candidate.difficulty)
+        with pytest.raises(ValueError, match="A chain mudou"):
+            blockchain.add_mined_block(candidate)
+        blockchain.restore_transactions(candidate)
+        assert blockchain.pending_transactions == [left_out]
+    
+    def test_prune_bounds_transaction_index(self):
+        """
+        Testa se a poda remove os ids antigos do índice e rejeita transações anteriores ao horizonte.
+        """
+        start = datetime.now() - timedelta(days=10)
+        blockchain = Blockchain(difficulty=1, retarget_interval=0, create_genesis=False,
+                                prune_depth=2, max_clock_skew=3600)
+        
+        def append(day, transactions):
+            previous_hash = blockchain.get_latest_block().hash if blockchain.chain else "0"
+            block = Block(len(blockchain.chain), transactions, previous_hash,
+                          timestamp=start + timedelta(days=day), difficulty=1)
+            block.mine_block(1)
+            blockchain.append_block(block)
+        
+        sent = [Transaction("Alice", "Bob", 1.0, timestamp=start + timedelta(days=day)) for day in range(5)]
+        future = Transaction("Alice", "Bob", 2.0, timestamp=datetime(2099, 1, 1))
+        for day in range(4):
+            append(day, [sent[day], future] if day == 2 else [sent[day]])
+        # Ficou pendente enquanto o bloco 1, mais novo, era podado: ainda dentro da margem
+        late = Transaction("Carol", "Bob", 1.0, timestamp=start + timedelta(days=1, minutes=-30))
+        append(4, [sent[4], late])
+        
+        # A transação de 2099 não passa do timestamp do próprio bloco
+        assert blockchain.replay_horizon == start + timedelta(days=2)
+        # Os ids podados saem do índice quando ficam mais de max_clock_skew antes do horizonte
+        assert sorted(blockchain.transaction_index.values()) == [(2, 0), (2, 1), (3, 0), (4, 0), (4, 1)]
+        assert blockchain.get_transaction(sent[2].txid) is None
+        
+        for original, message in [(sent[1], "horizonte de replay"), (sent[2], "repetida"), (future, "repetida")]:
+            replay = Transaction.from_dict(original.to_dict())
+            with pytest.raises(ValueError, match=message):
+                append(5, [replay])
+        with pytest.raises(ValueError, match="relógio do nó"):
+            blockchain.add_transaction(Transaction.from_dict(future.to_dict()))
+        
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        assert len(blockchain.pending_transactions) == 1
+    
+    @pytest.mark.parametrize("hours", [3, -3])
+    def test_add_transaction_rejects_timestamp_outside_window(self, hours):
+        """
+        Testa se timestamps a mais de max_clock_skew do relógio do nó são recusados na entrada.
+        """
+        blockchain = Blockchain(prune_depth=1)
+        
+        with pytest.raises(ValueError, match="relógio do nó"):
+            blockchain.add_transaction(Transaction("Alice", "Bob", 1.0,
+                                                   timestamp=datetime.now() + timedelta(hours=hours)))
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0,
+                                               timestamp=datetime.now() + timedelta(hours=hours / 3)))
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.mine_pending_transactions("Miner1")
+        
+        # O bloco podado não impede as transações seguintes
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        with pytest.raises(ValueError):
+            Blockchain(max_clock_skew=0)
+    
+    def test_transaction_ids_with_bloom_filter(self):
+        """
+        Testa os ids da chain guardados em um filtro de Bloom em vez do dicionário.
+        """
+        blockchain = Blockchain(txid_bloom_capacity=1000)
+        transaction = Transaction("Alice", "Bob", 5.0)
+        blockchain.add_transaction(transaction)
+        blockchain.mine_pending_transactions("Miner1")
+        
+        assert blockchain.transaction_index == {}
+        assert transaction.txid in blockchain.txid_bloom
+        assert blockchain.get_transaction(transaction.txid) == (1, 0, transaction)
+        assert blockchain.get_transaction("0" * 64) is None
+        with pytest.raises(ValueError, match="já está na chain"):
+            blockchain.add_transaction(Transaction.from_dict(transaction.to_dict()))
+        
+        blockchain.rebuild_indexes()
+        assert transaction.txid in blockchain.txid_bloom
+        with pytest.raises(ValueError):
+            Blockchain(store=SQLiteBlockStore(":memory:"), txid_bloom_capacity=1000)
+    
+    def test_append_block_rejects_replays(self):
+        """
+        Testa se append_block rejeita transações repetidas e tira do mempool as que recebeu.
+        """
+        source = Blockchain()
+        transaction = Transaction("Alice", "Bob", 2.0)
+        source.add_transaction(transaction)
+        source.mine_pending_transactions("Miner1")
+        
+        copy = Blockchain(create_genesis=False)
+        copy.append_block(source.chain[0])
+        copy.add_transaction(Transaction.from_dict(transaction.to_dict()))
+        copy.add_transaction(Transaction("Carol", "Dave", 1.0))
+        copy.append_block(source.chain[1])
+        assert [tx.recipient for tx in copy.pending_transactions] == ["Dave"]
+        assert copy.mempool_ids == {copy.pending_transactions[0].txid}
+        
+        replay = Block(2, [Transaction.from_dict(transaction.to_dict()), Transaction(None, "Miner1", 10)],
+                       copy.get_latest_block().hash, difficulty=copy.get_difficulty_for_height(2))
+        replay.mine_block(replay.difficulty)
+        with pytest.raises(ValueError, match="Bloco 2, transação 0: transação repetida"):
+            copy.append_block(replay)
+        assert len(copy.chain) == 2
+    
+    def test_incremental_validation_detects_replaced_transactions(self):
+        """
+        Testa se trocar transações ou blocos já verificados não passa pela validação incremental.
+        """
+        blockchain = Blockchain()
+        for i in range(3):
+            blockchain.add_transaction(Transaction("Alice", "Bob", float(i + 1)))
+            blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.is_chain_valid() == True
+        
+        # As transações de um bloco verificado não podem ser trocadas nem adicionadas
+        with pytest.raises(TypeError):
+            blockchain.chain[2].transactions[0] = Transaction("Alice", "Eve", 1000.0)
+        with pytest.raises(AttributeError):
+            blockchain.chain[2].transactions.append(Transaction("Alice", "Eve", 1000.0))
+        
+        # Trocar um bloco verificado na lista força a revalidação
+        forged = Block.from_dict(blockchain.chain[2].to_dict())
+        forged.transactions[0].amount = 1000.0
+        blockchain.chain[2] = forged
+        assert blockchain.is_chain_valid() == False
+        
+        # Uma cópia idêntica é revalidada e aceita
+        forged.transactions[0].amount = 2.0
+        assert blockchain.is_chain_valid() == True
@@ -0,0 +1,44 @@
+"""
+Testes para o filtro de Bloom.
+"""
+import pytest
+from src.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    """
+    Classe de testes para BloomFilter.
+    """
+    
+    def test_no_false_negatives(self):
+        """
+        Testa se todo item adicionado é encontrado.
+        """
+        bloom = BloomFilter(1000)
+        items = [f"tx{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+    
+    def test_false_positive_rate(self):
+        """
+        Testa se a taxa de falsos positivos fica perto da configurada na capacidade.
+        """
+        bloom = BloomFilter(2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"tx{i}")
+        
+        false_positives = sum(f"outra{i}" in bloom for i in range(10000))
+        assert false_positives < 300  # 1% esperado: 100
+        assert bloom.size_bytes < 2000 * 10 // 8 + 8
+    
+    def test_invalid_parameters(self):
+        """
+        Testa se capacidade e taxa inválidas são rejeitadas.
+        """
+        with pytest.raises(ValueError):
+            BloomFilter(0)
+        with pytest.raises(ValueError):
+            BloomFilter(100, error_rate=1.5)
@@ -0,0 +1,92 @@
+"""
+Testes para a importação e exportação da blockchain.
+"""
+import json
+import pytest
+from src.chain_io import export_chain, import_chain, iter_export_lines
+from src.mmap_storage import MappedBlockStore
+from src.transaction import Transaction
+
+
+class TestChainIO:
+    """
+    Classe de testes para chain_io.
+    """
+    
+    def test_export_and_import(self, tmp_path, build_chain):
+        """
+        Testa se uma chain exportada é importada idêntica e validada.
+        """
+        original = build_chain(retarget_interval=2, target_block_time=0.5)
+        path = str(tmp_path / "chain.jsonl")
+        
+        assert export_chain(original, path) == 4
+        
+        imported = import_chain(path)
+        assert imported.to_dict()['chain'] == original.to_dict()['chain']
+        assert imported.retarget_interval == 2
+        assert imported.target_block_time == 0.5
+        assert imported.difficulty == original.difficulty
+        assert imported.get_balance("Miner1") == 30
+        assert imported.is_chain_valid() == True
+        
+        # A chain importada continua minerando normalmente
+        imported.add_transaction(Transaction("Bob", "Alice", 1.0))
+        imported.mine_pending_transactions("Miner2")
+        assert imported.is_chain_valid() == True
+    
+    def test_export_is_streamed(self, build_chain):
+        """
+        Testa se a exportação gera uma linha por bloco, sob demanda.
+        """
+        original = build_chain(blocks=2)
+        lines = iter_export_lines(original)
+        
+        header = json.loads(next(lines))
+        assert header['format'] == 'blockchain-do-zero'
+        assert [json.loads(line)['index'] for line in lines] == [0, 1, 2]
+    
+    def test_import_into_mapped_store(self, tmp_path, build_chain):
+        """
+        Testa a importação direto para um store que serve a chain.
+        """
+        original = build_chain()
+        path = str(tmp_path / "chain.jsonl")
+        export_chain(original, path)
+        
+        store = MappedBlockStore(str(tmp_path / "blocks.dat"), cache_size=2)
+        imported = import_chain(path, store=store)
+        
+        assert imported.chain is store
+        assert [block.hash for block in imported.chain] == [block.hash for block in original.chain]
+        assert len(store._cache) == 2
+        store.close()
+    
+    def test_import_rejects_tampered_block(self, tmp_path, build_chain):
+        """
+        Testa se um bloco adulterado interrompe a importação.
+        """
+        original = build_chain()
+        path = str(tmp_path / "chain.jsonl")
+        export_chain(original, path)
+        
+        with open(path) as handle:
+            lines = handle.readlines()
+        block = json.loads(lines[2])
+        block['transactions'][0]['amount'] = 1000.0
+        lines[2] = json.dumps(block) + '\n'
+        with open(path, 'w') as handle:
+            handle.writelines(lines)
+        
+        with pytest.raises(ValueError, match="Bloco 1"):
+            import_chain(path)
+    
+    def test_import_rejects_other_files(self, tmp_path):
+        """
+        Testa a importação de um arquivo que não é uma exportação.
+        """
+        path = tmp_path / "other.jsonl"
+        path.write_text('{"chain": []}\n')
+        
+        with pytest.raises(ValueError):
+            import_chain(str(path))
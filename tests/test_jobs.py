@@ -0,0 +1,86 @@
+"""
+Testes para os jobs de mineração em segundo plano.
+"""
+import pytest
+from src.blockchain import Blockchain
+from src.jobs import MiningJob, MiningJobManager
+from src.transaction import Transaction
+
+
+def _slow_blockchain():
+    """
+    Cria uma blockchain cujo próximo bloco exige uma dificuldade muito alta.
+    """
+    blockchain = Blockchain(difficulty=4, retarget_interval=0)
+    # Sem reajuste, o próximo bloco herda a dificuldade do anterior
+    blockchain.chain[-1].difficulty = 64
+    return blockchain
+
+
+class TestMiningJobs:
+    """
+    Classe de testes para MiningJob e MiningJobManager.
+    """
+    
+    def test_job_completes(self):
+        """
+        Testa um job que minera o bloco até o fim.
+        """
+        blockchain = Blockchain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 50.0))
+        manager = MiningJobManager(blockchain)
+        
+        job = manager.submit("Miner1")
+        
+        assert job.wait(timeout=10) == True
+        assert job.status == MiningJob.COMPLETED
+        assert job.block is blockchain.get_latest_block()
+        assert job.nonces_tried >= 1
+        assert job.to_dict()['block']['index'] == 1
+        assert manager.get(job.id) is job
+    
+    def test_job_cancel_restores_pending_transactions(self):
+        """
+        Testa o cancelamento de um job e a devolução das transações pendentes.
+        """
+        blockchain = _slow_blockchain()
+        transaction = Transaction("Alice", "Bob", 50.0)
+        blockchain.add_transaction(transaction)
+        manager = MiningJobManager(blockchain)
+        
+        job = manager.submit("Miner1")
+        
+        # Só um job pode minerar por vez
+        with pytest.raises(RuntimeError):
+            manager.submit("Miner2")
+        
+        assert job.cancel() == True
+        assert job.wait(timeout=10) == True
+        assert job.status == MiningJob.CANCELLED
+        assert len(blockchain.chain) == 1
+        assert blockchain.pending_transactions == [transaction]
+        assert job.cancel() == False
+    
+    def test_finished_jobs_are_pruned(self):
+        """
+        Testa se só os últimos jobs terminados continuam guardados no gerenciador.
+        """
+        blockchain = Blockchain(difficulty=1, retarget_interval=0)
+        manager = MiningJobManager(blockchain, max_finished_jobs=2)
+        
+        jobs = []
+        for _ in range(4):
+            job = manager.submit("Miner1")
+            assert job.wait(timeout=10) == True
+            jobs.append(job)
+        
+        # A poda acontece no submit: ficam os 2 terminados mais recentes e o job novo
+        assert manager.get(jobs[0].id) is None
+        assert list(manager.jobs) == [jobs[1].id, jobs[2].id, jobs[3].id]
+        
+        job = manager.submit("Miner1")
+        assert job.wait(timeout=10) == True
+        assert list(manager.jobs) == [jobs[2].id, jobs[3].id, job.id]
+        
+        with pytest.raises(ValueError):
+            MiningJobManager(blockchain, max_finished_jobs=-1)
@@ -0,0 +1,99 @@
+"""
+Testes para o log durável de transações pendentes.
+"""
+import threading
+from src.blockchain import Blockchain
+from src.mempool_log import MempoolLog
+from src.storage import BlockStore
+from src.transaction import Transaction
+
+
+class TestMempoolLog:
+    """
+    Classe de testes para MempoolLog.
+    """
+    
+    def test_pending_transactions_survive_restart(self, tmp_path):
+        """
+        Testa se as transações pendentes são recuperadas após uma queda.
+        """
+        path = str(tmp_path / "mempool.log")
+        blockchain = Blockchain(mempool_log=MempoolLog(path))
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        blockchain.add_transaction(Transaction("Bob", "Charlie", 0.5))
+        
+        # Sem close: simula a queda do processo
+        recovered = Blockchain(mempool_log=MempoolLog(path))
+        assert [tx.to_dict() for tx in recovered.pending_transactions] == \
+            [tx.to_dict() for tx in blockchain.pending_transactions]
+    
+    def test_mined_transactions_leave_the_log(self, tmp_path):
+        """
+        Testa se o log é reescrito com as transações que continuam pendentes após minerar.
+        """
+        path = str(tmp_path / "mempool.log")
+        blockchain = Blockchain(mempool_log=MempoolLog(path))
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.add_transaction(Transaction("Bob", "Charlie", 0.5))
+        
+        height, transactions = MempoolLog(path).replay()
+        assert height == 2
+        assert [tx.recipient for tx in transactions] == ["Charlie"]
+    
+    def test_replay_skips_transactions_already_mined(self, tmp_path):
+        """
+        Testa a queda entre a gravação de um bloco e a reescrita do log.
+        """
+        store_path = str(tmp_path / "blocks.dat")
+        log_path = str(tmp_path / "mempool.log")
+        log = MempoolLog(log_path)
+        blockchain = Blockchain(store=BlockStore(store_path), mempool_log=log)
+        mined = Transaction("Alice", "Bob", 1.0)
+        blockchain.add_transaction(mined)
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.store.close()
+        
+        # O log ainda estaria na altura 1, com a transação que foi minerada no bloco 1
+        waiting = Transaction("Bob", "Charlie", 0.5)
+        log.rewrite(1, [mined, waiting])
+        
+        recovered = Blockchain(store=BlockStore(store_path), mempool_log=MempoolLog(log_path))
+        assert [tx.to_dict() for tx in recovered.pending_transactions] == [waiting.to_dict()]
+    
+    def test_group_commit(self, tmp_path):
+        """
+        Testa se transações concorrentes compartilham fsyncs e todas ficam no log.
+        """
+        path = str(tmp_path / "mempool.log")
+        log = MempoolLog(path)
+        blockchain = Blockchain(mempool_log=log)
+        
+        def submit(thread_id):
+            for i in range(20):
+                blockchain.add_transaction(Transaction(f"Usuario{thread_id}", "Bob", float(i)))
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert log.sync_count <= 160
+        _, transactions = MempoolLog(path).replay()
+        assert len(transactions) == 160
+    
+    def test_torn_tail_is_discarded(self, tmp_path):
+        """
+        Testa se um registro incompleto no final do log é ignorado.
+        """
+        path = str(tmp_path / "mempool.log")
+        log = MempoolLog(path)
+        log.wait_durable(log.append(Transaction("Alice", "Bob", 1.0)))
+        log.close()
+        
+        with open(path, 'ab') as handle:
+            handle.write(b'\x00\x00\x00\x40\x00')
+        
+        _, transactions = MempoolLog(path).replay()
+        assert len(transactions) == 1
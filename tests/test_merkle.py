@@ -0,0 +1,50 @@
+"""
+Testes para as funções da árvore de Merkle.
+"""
+import hashlib
+import pytest
+from src.merkle import EMPTY_ROOT, compute_merkle_root, get_merkle_proof, verify_merkle_proof
+
+
+def _leaf(value):
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+class TestMerkle:
+    """
+    Classe de testes para a árvore de Merkle.
+    """
+    
+    def test_empty_and_single_leaf(self):
+        """
+        Testa a raiz de uma árvore vazia e de uma única folha.
+        """
+        assert compute_merkle_root([]) == EMPTY_ROOT
+        assert compute_merkle_root([_leaf("a")]) == _leaf("a")
+    
+    def test_root_depends_on_order(self):
+        """
+        Testa se a raiz muda quando a ordem das folhas muda.
+        """
+        leaves = [_leaf(c) for c in "abc"]
+        assert compute_merkle_root(leaves) != compute_merkle_root(list(reversed(leaves)))
+    
+    def test_proofs_for_every_leaf(self):
+        """
+        Testa as provas de inclusão para todas as folhas (quantidade ímpar).
+        """
+        leaves = [_leaf(str(i)) for i in range(7)]
+        root = compute_merkle_root(leaves)
+        
+        for i, leaf in enumerate(leaves):
+            proof = get_merkle_proof(leaves, i)
+            assert len(proof) == 3
+            assert verify_merkle_proof(leaf, proof, root) == True
+            assert verify_merkle_proof(_leaf("x"), proof, root) == False
+    
+    def test_proof_invalid_index(self):
+        """
+        Testa a prova com índice fora do intervalo.
+        """
+        with pytest.raises(IndexError):
+            get_merkle_proof([_leaf("a")], 1)
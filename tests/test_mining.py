@@ -0,0 +1,93 @@
+"""
+Testes para as regras de Proof of Work e a mineração paralela.
+"""
+import hashlib
+import os
+import pytest
+from src import mining
+from src.mining import (MAX_DIFFICULTY, MAX_RETARGET_STEP, difficulty_to_target,
+                        hash_meets_difficulty, max_digest_for, parallel_search,
+                        retarget_difficulty)
+
+
+def _crashing_worker(*args):
+    """
+    Worker que morre sem publicar resultado (como um processo morto pelo sistema).
+    """
+    os._exit(3)
+
+
+class TestMining:
+    """
+    Classe de testes para o módulo de mineração.
+    """
+    
+    def test_difficulty_to_target(self):
+        """
+        Testa a conversão de dificuldade em alvo.
+        """
+        assert difficulty_to_target(0) == 2 ** 256
+        assert difficulty_to_target(4) == 2 ** 252
+        assert difficulty_to_target(MAX_DIFFICULTY) == 1
+        
+        with pytest.raises(ValueError):
+            difficulty_to_target(MAX_DIFFICULTY + 1)
+    
+    def test_max_digest(self):
+        """
+        Testa o maior digest aceito para cada dificuldade.
+        """
+        assert max_digest_for(0) == b"\xff" * 32
+        assert max_digest_for(8) == b"\x00" + b"\xff" * 31
+        assert max_digest_for(12) == b"\x00\x0f" + b"\xff" * 30
+    
+    def test_hash_meets_difficulty(self):
+        """
+        Testa a verificação de hashes hexadecimais contra a dificuldade.
+        """
+        assert hash_meets_difficulty("0" * 2 + "f" * 62, 8) == True
+        assert hash_meets_difficulty("0" * 2 + "f" * 62, 9) == False
+        assert hash_meets_difficulty("1" + "0" * 63, 3) == True
+        assert hash_meets_difficulty("invalid_hash", 1) == False
+    
+    def test_parallel_search(self):
+        """
+        Testa se a busca paralela retorna um nonce válido e consistente.
+        """
+        prefix = b"prefixo-do-bloco"
+        nonce, block_hash, attempts = parallel_search(prefix, 10, 0, 2)
+        
+        assert attempts >= 1
+        assert hashlib.sha256(prefix + str(nonce).encode('utf-8')).hexdigest() == block_hash
+        assert hash_meets_difficulty(block_hash, 10) == True
+    
+    def test_parallel_search_invalid_workers(self):
+        """
+        Testa a busca paralela com número de workers inválido.
+        """
+        with pytest.raises(ValueError):
+            parallel_search(b"prefixo", 1, 0, 0)
+    
+    def test_parallel_search_detects_dead_worker(self, monkeypatch):
+        """
+        Testa se a busca falha, em vez de esperar para sempre, quando um worker morre.
+        """
+        monkeypatch.setattr(mining, '_search_nonces', _crashing_worker)
+        with pytest.raises(RuntimeError, match="código 3"):
+            parallel_search(b"prefixo", 30, 0, 2)
+    
+    def test_retarget_difficulty(self):
+        """
+        Testa o reajuste de dificuldade a partir do tempo observado.
+        """
+        # Blocos 4x mais rápidos que o esperado: +2 bits
+        assert retarget_difficulty(10, 25.0, 100.0) == 12
+        # Tempo igual ao esperado: mantém
+        assert retarget_difficulty(10, 100.0, 100.0) == 10
+        # Blocos 2x mais lentos: -1 bit
+        assert retarget_difficulty(10, 200.0, 100.0) == 9
+        # O ajuste é limitado a MAX_RETARGET_STEP bits
+        assert retarget_difficulty(10, 1.0, 100.0) == 10 + MAX_RETARGET_STEP
+        assert retarget_difficulty(10, 0.0, 100.0) == 10 + MAX_RETARGET_STEP
+        # Respeita a dificuldade mínima
+        assert retarget_difficulty(2, 1000.0, 10.0, min_difficulty=1) == 1
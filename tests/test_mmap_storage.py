@@ -0,0 +1,97 @@
+"""
+Testes para o armazenamento de blocos mapeado em memória.
+"""
+import pytest
+from src.blockchain import Blockchain
+from src.mmap_storage import MappedBlockStore
+from src.storage import RECORD_HEADER, BlockStore
+from src.transaction import Transaction
+
+
+class TestMappedBlockStore:
+    """
+    Classe de testes para MappedBlockStore.
+    """
+    
+    def test_store_is_the_chain(self, tmp_path, build_chain):
+        """
+        Testa se o arquivo mapeado é usado diretamente como a chain.
+        """
+        blockchain = build_chain(MappedBlockStore(str(tmp_path / "blocks.dat")), blocks=4)
+        
+        assert blockchain.chain is blockchain.store
+        assert len(blockchain.chain) == 5
+        assert blockchain.get_block_by_index(3).index == 3
+        assert [block.index for block in blockchain.chain[-2:]] == [3, 4]
+        assert blockchain.is_chain_valid() == True
+        assert blockchain.get_balance("Bob") == 10.0
+        
+        with pytest.raises(IndexError):
+            blockchain.chain[5]
+    
+    def test_cache_is_bounded(self, tmp_path, build_chain):
+        """
+        Testa se o cache LRU nunca passa do limite e os blocos são relidos do arquivo.
+        """
+        blockchain = build_chain(MappedBlockStore(str(tmp_path / "blocks.dat"), cache_size=2), blocks=4)
+        store = blockchain.store
+        
+        hashes = [block.hash for block in store]
+        assert len(store._cache) == 2
+        assert list(store._cache) == [3, 4]
+        
+        # Blocos fora do cache são reconstruídos a partir do arquivo
+        assert store[1].hash == hashes[1]
+        assert store[1] is store[1]
+        assert list(store._cache) == [4, 1]
+    
+    def test_restart_reloads_offsets(self, tmp_path, build_chain):
+        """
+        Testa se o índice é reconstruído ao reabrir e a chain continua crescendo.
+        """
+        path = str(tmp_path / "blocks.dat")
+        original = build_chain(MappedBlockStore(path), blocks=4)
+        hashes = [block.hash for block in original.chain]
+        original.store.close()
+        
+        reloaded = Blockchain(store=MappedBlockStore(path, cache_size=2))
+        assert [block.hash for block in reloaded.chain] == hashes
+        assert reloaded.difficulty == original.difficulty
+        
+        reloaded.add_transaction(Transaction("Bob", "Charlie", 1.0))
+        reloaded.mine_pending_transactions("Miner2")
+        assert len(reloaded.chain) == 6
+        assert reloaded.chain[5].transactions[0].recipient == "Charlie"
+        assert reloaded.is_chain_valid() == True
+        reloaded.store.close()
+    
+    def test_append_after_truncated_tail(self, tmp_path, build_chain):
+        """
+        Testa se um bloco gravado depois da recuperação de um registro incompleto é relido do arquivo.
+        """
+        path = str(tmp_path / "blocks.dat")
+        build_chain(MappedBlockStore(path), blocks=2).store.close()
+        with open(path, 'ab') as handle:
+            handle.write(RECORD_HEADER.pack(1000, 0) + b'{"index": 3')
+        
+        blockchain = Blockchain(store=MappedBlockStore(path, cache_size=1))
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        block = blockchain.mine_pending_transactions("Miner1")
+        store = blockchain.store
+        store._cache.clear()
+        
+        assert store[3].hash == block.hash
+        store.close()
+        assert MappedBlockStore(path)[3].hash == block.hash
+    
+    def test_file_is_compatible_with_block_store(self, tmp_path, build_chain):
+        """
+        Testa se o arquivo pode ser lido pelo BlockStore comum.
+        """
+        path = str(tmp_path / "blocks.dat")
+        original = build_chain(MappedBlockStore(path), blocks=2)
+        hashes = [block.hash for block in original.chain]
+        original.store.close()
+        
+        plain = Blockchain(store=BlockStore(path))
+        assert [block.hash for block in plain.chain] == hashes
@@ -0,0 +1,81 @@
+"""
+Testes para as assinaturas Ed25519.
+"""
+import pytest
+from src import signatures
+from src.signatures import KeyPair, public_key_for, sign, verify, verify_batch
+
+# Vetores de teste da RFC 8032 (seção 7.1, testes 1 e 2)
+RFC_VECTORS = [
+    ('9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60',
+     'd75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a',
+     '',
+     'e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b'),
+    ('4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb',
+     '3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c',
+     '72',
+     '92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00'),
+]
+
+
+class TestSignatures:
+    """
+    Classe de testes para o módulo de assinaturas.
+    """
+    
+    @pytest.mark.parametrize("private_key,public_key,message,signature", RFC_VECTORS)
+    def test_rfc8032_vectors(self, private_key, public_key, message, signature):
+        """
+        Testa chaves e assinaturas contra os vetores da RFC 8032.
+        """
+        private_key = bytes.fromhex(private_key)
+        message = bytes.fromhex(message)
+        
+        assert public_key_for(private_key).hex() == public_key
+        assert sign(private_key, message).hex() == signature
+        assert verify(bytes.fromhex(public_key), message, bytes.fromhex(signature)) == True
+    
+    def test_verify_rejects_tampering(self):
+        """
+        Testa se mensagem, assinatura ou chave alteradas são rejeitadas.
+        """
+        key_pair = KeyPair.generate()
+        other = KeyPair.generate()
+        signature = key_pair.sign(b"mensagem")
+        
+        assert verify(key_pair.public_key, b"mensagem", signature) == True
+        assert verify(key_pair.public_key, b"mensagen", signature) == False
+        assert verify(other.public_key, b"mensagem", signature) == False
+        assert verify(key_pair.public_key, b"mensagem", signature[:-1] + bytes([signature[-1] ^ 1])) == False
+        assert verify(key_pair.public_key, b"mensagem", signature[:32]) == False
+    
+    def test_key_pair(self):
+        """
+        Testa a geração de carteiras e a reconstrução pela chave privada.
+        """
+        key_pair = KeyPair.generate()
+        restored = KeyPair.from_hex(key_pair.private_key.hex())
+        
+        assert len(key_pair.address) == 64
+        assert restored.address == key_pair.address
+        assert KeyPair.generate().address != key_pair.address
+        with pytest.raises(ValueError):
+            KeyPair(b"curta")
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_verify_batch(self, monkeypatch, workers):
+        """
+        Testa se o lote informa a primeira assinatura inválida, com e sem workers.
+        """
+        monkeypatch.setattr(signatures, 'PARALLEL_BATCH_THRESHOLD', 2)
+        key_pair = KeyPair.generate()
+        messages = [f"tx {i}".encode() for i in range(6)]
+        items = [(key_pair.public_key, message, key_pair.sign(message)) for message in messages]
+        
+        assert verify_batch(items, workers) is None
+        assert verify_batch([], workers) is None
+        
+        items[4] = (key_pair.public_key, b"outra", items[4][2])
+        assert verify_batch(items, workers) == 4
+        items[1] = (key_pair.public_key, b"outra", items[1][2])
+        assert verify_batch(items, workers) == 1
@@ -0,0 +1,109 @@
+"""
+Testes para o armazenamento da blockchain em SQLite.
+"""
+import pytest
+from src.blockchain import Blockchain
+from src.sqlite_storage import SQLiteBlockStore
+from src.transaction import Transaction
+
+
+class TestSQLiteBlockStore:
+    """
+    Classe de testes para SQLiteBlockStore.
+    """
+    
+    def test_store_is_the_chain(self, tmp_path, build_chain):
+        """
+        Testa se o banco é usado diretamente como a chain, sem lista em memória.
+        """
+        blockchain = build_chain(SQLiteBlockStore(str(tmp_path / "chain.db")), transfers=2)
+        
+        assert blockchain.chain is blockchain.store
+        assert len(blockchain.chain) == 4
+        assert blockchain.chain[-1].index == 3
+        assert [block.index for block in blockchain.chain[1:3]] == [1, 2]
+        assert blockchain.get_block_by_index(2).hash == blockchain.chain[2].hash
+        assert blockchain.get_block_by_index(10) is None
+        assert blockchain.is_chain_valid() == True
+        
+        with pytest.raises(IndexError):
+            blockchain.chain[4]
+    
+    def test_queries_match_in_memory_chain(self, tmp_path, build_chain):
+        """
+        Testa se saldos, históricos e transações coincidem com a chain em memória.
+        """
+        blockchain = build_chain(SQLiteBlockStore(str(tmp_path / "chain.db")), transfers=2)
+        memory = Blockchain()
+        for block in blockchain.chain[1:]:
+            memory.chain.append(block)
+        memory.rebuild_indexes()
+        
+        for address in ("Alice", "Bob", "Charlie", "Miner1", "Desconhecido"):
+            assert blockchain.get_balance(address) == memory.get_balance(address)
+        assert blockchain.get_balance("Miner1") == 30
+        
+        assert blockchain.count_transactions() == 10
+        assert ([tx.to_dict() for tx in blockchain.get_all_transactions()][1:] ==
+                [tx.to_dict() for tx in memory.get_all_transactions()][1:])
+        
+        page, next_cursor = blockchain.get_address_transactions("Bob", limit=4)
+        expected, expected_cursor = memory.get_address_transactions("Bob", limit=4)
+        assert [(b, p, tx.to_dict()) for b, p, tx in page] == [(b, p, tx.to_dict()) for b, p, tx in expected]
+        assert next_cursor == expected_cursor
+        
+        page, last_cursor = blockchain.get_address_transactions("Bob", cursor=next_cursor, limit=4)
+        expected, _ = memory.get_address_transactions("Bob", cursor=expected_cursor, limit=4)
+        assert [(b, p) for b, p, _ in page] == [(b, p) for b, p, _ in expected]
+        assert last_cursor is None
+    
+    def test_restart_reloads_chain(self, tmp_path, build_chain):
+        """
+        Testa se a chain é reaberta do banco e continua crescendo.
+        """
+        path = str(tmp_path / "chain.db")
+        original = build_chain(SQLiteBlockStore(path), transfers=2)
+        hashes = [block.hash for block in original.chain]
+        original.store.close()
+        
+        reloaded = Blockchain(store=SQLiteBlockStore(path))
+        assert [block.hash for block in reloaded.chain] == hashes
+        assert reloaded.is_chain_valid() == True
+        assert reloaded.difficulty == original.difficulty
+        assert reloaded.get_balance("Bob") == 4.5
+        
+        reloaded.add_transaction(Transaction("Bob", "Alice", 1.0))
+        reloaded.mine_pending_transactions("Miner2")
+        assert len(reloaded.chain) == 5
+        assert reloaded.get_balance("Alice") == -5.0
+        assert reloaded.store.get_block_by_hash(reloaded.chain[4].hash).index == 4
+    
+    def test_append_rejects_out_of_order_block(self, tmp_path, build_chain):
+        """
+        Testa se um bloco fora de ordem não é gravado.
+        """
+        blockchain = build_chain(SQLiteBlockStore(str(tmp_path / "chain.db")), blocks=1, transfers=2)
+        
+        with pytest.raises(ValueError):
+            blockchain.store.append(blockchain.chain[1])
+        assert len(blockchain.store) == 2
+    
+    def test_find_transaction(self, tmp_path, build_chain):
+        """
+        Testa a busca indexada por id e o preenchimento da coluna em bancos antigos.
+        """
+        path = str(tmp_path / "chain.db")
+        blockchain = build_chain(SQLiteBlockStore(path), transfers=2)
+        transaction = blockchain.chain[2].transactions[1]
+        
+        assert blockchain.store.find_transaction(transaction.txid) == (2, 1)
+        assert blockchain.get_transaction(transaction.txid)[:2] == (2, 1)
+        assert blockchain.store.find_transaction("0" * 64) is None
+        with pytest.raises(ValueError, match="já está na chain"):
+            blockchain.add_transaction(Transaction.from_dict(transaction.to_dict()))
+        
+        # Banco criado antes dos ids: a coluna é recriada e preenchida ao abrir
+        blockchain.store._connection.executescript(
+            "DROP INDEX idx_transactions_txid; ALTER TABLE transactions DROP COLUMN txid;")
+        blockchain.store.close()
+        assert SQLiteBlockStore(path).find_transaction(transaction.txid) == (2, 1)
@@ -0,0 +1,141 @@
+"""
+Testes para o armazenamento append-only de blocos.
+"""
+import os
+import pytest
+from src.blockchain import Blockchain
+from src.storage import RECORD_HEADER, BlockStore, CorruptStoreError, decode_block, encode_block, strip_txids
+from src.transaction import Transaction
+
+
+class TestBlockStore:
+    """
+    Classe de testes para BlockStore.
+    """
+    
+    def test_restart_reloads_chain(self, tmp_path, build_chain):
+        """
+        Testa se a chain é recarregada do arquivo sem minerar um novo gênesis.
+        """
+        path = str(tmp_path / "blocks.dat")
+        original = build_chain(BlockStore(path))
+        original.store.close()
+        
+        store = BlockStore(path)
+        reloaded = Blockchain(store=store)
+        
+        assert [block.hash for block in reloaded.chain] == [block.hash for block in original.chain]
+        assert reloaded.to_dict()['chain'] == original.to_dict()['chain']
+        assert reloaded.is_chain_valid() == True
+        assert reloaded.get_balance("Bob") == 6.0
+        assert reloaded.get_balance("Miner1") == 30.0
+        assert reloaded.difficulty == original.difficulty
+        
+        # Novos blocos continuam sendo gravados após os existentes
+        reloaded.add_transaction(Transaction("Bob", "Charlie", 1.0))
+        reloaded.mine_pending_transactions("Miner2")
+        store.close()
+        
+        again = Blockchain(store=BlockStore(path))
+        assert len(again.chain) == 5
+        assert again.is_chain_valid() == True
+    
+    def test_truncated_tail_is_discarded(self, tmp_path, build_chain):
+        """
+        Testa a recuperação de uma gravação interrompida no último registro.
+        """
+        path = str(tmp_path / "blocks.dat")
+        build_chain(BlockStore(path, fsync_policy='never'), blocks=2).store.close()
+        
+        with open(path, 'ab') as handle:
+            handle.write(RECORD_HEADER.pack(1000, 0) + b'{"index": 3')
+        
+        store = BlockStore(path)
+        blockchain = Blockchain(store=store)
+        
+        assert len(blockchain.chain) == 3
+        assert blockchain.is_chain_valid() == True
+        
+        blockchain.add_transaction(Transaction("Alice", "Bob", 1.0))
+        blockchain.mine_pending_transactions("Miner1")
+        store.close()
+        
+        assert len(Blockchain(store=BlockStore(path)).chain) == 4
+    
+    def test_corrupted_middle_record(self, tmp_path, build_chain):
+        """
+        Testa se um registro corrompido no meio do arquivo é detectado.
+        """
+        path = str(tmp_path / "blocks.dat")
+        build_chain(BlockStore(path, fsync_policy='interval', fsync_interval=2), blocks=2).store.close()
+        
+        with open(path, 'r+b') as handle:
+            handle.seek(RECORD_HEADER.size + 5)
+            handle.write(b'X')
+        
+        with pytest.raises(CorruptStoreError):
+            Blockchain(store=BlockStore(path))
+    
+    def test_invalid_fsync_policy(self, tmp_path):
+        """
+        Testa a criação do armazenamento com política de fsync inválida.
+        """
+        with pytest.raises(ValueError):
+            BlockStore(str(tmp_path / "blocks.dat"), fsync_policy='sometimes')
+    
+    def test_binary_serialization(self, tmp_path, build_chain):
+        """
+        Testa a gravação em formato binário e a leitura de arquivos com os dois formatos.
+        """
+        path = str(tmp_path / "blocks.dat")
+        original = build_chain(BlockStore(path), blocks=1)
+        original.store.close()
+        
+        store = BlockStore(path, serialization='binary')
+        blockchain = Blockchain(store=store)
+        blockchain.add_transaction(Transaction("Bob", "Charlie", 0.5))
+        blockchain.mine_pending_transactions("Miner1")
+        store.close()
+        
+        reloaded = Blockchain(store=BlockStore(path))
+        assert reloaded.to_dict()['chain'][:2] == original.to_dict()['chain']
+        assert len(reloaded.chain) == 3
+        assert reloaded.is_chain_valid() == True
+        
+        with pytest.raises(ValueError):
+            BlockStore(path, serialization='xml')
+    
+    @pytest.mark.parametrize("serialization", ["json", "binary"])
+    def test_restart_reuses_stored_txids(self, tmp_path, monkeypatch, serialization, build_chain):
+        """
+        Testa se os ids das transações são lidos dos registros, sem recalcular os hashes.
+        """
+        path = str(tmp_path / "blocks.dat")
+        original = build_chain(BlockStore(path, serialization=serialization))
+        original.store.close()
+        
+        calls = []
+        calculate_hash = Transaction.calculate_hash
+        monkeypatch.setattr(Transaction, 'calculate_hash', lambda tx: calls.append(tx) or calculate_hash(tx))
+        reloaded = Blockchain(store=BlockStore(path))
+        assert calls == []
+        assert reloaded.transaction_index == original.transaction_index
+        
+        # Um id gravado que não confere com a transação invalida o bloco
+        assert reloaded.is_chain_valid() == True
+        reloaded.chain[1].transactions[0]._txid = '0' * 64
+        assert reloaded.chain[1].is_valid() == False
+    
+    def test_strip_txids(self, build_chain):
+        """
+        Testa se strip_txids devolve o payload de um registro sem ids, nos dois formatos.
+        """
+        block = build_chain().chain[1]
+        
+        for serialization in ("json", "binary"):
+            payload = strip_txids(encode_block(block, serialization))
+            assert len(payload) < len(encode_block(block, serialization))
+            assert strip_txids(payload) == payload
+            decoded = decode_block(payload)
+            assert decoded.transactions[0]._txid is None
+            assert decoded.to_dict() == block.to_dict()
@@ -3,6 +3,7 @@ Testes para a classe Transaction.
 """
 import pytest
 from datetime import datetime
+from src.signatures import KeyPair
 from src.transaction import Transaction
 
 
@@ -63,3 +64,139 @@ class TestTransaction:
         str_repr = str(transaction)
         
         assert str_repr == "Alice -> Bob: 150.0"
+    
+    def test_transaction_hash(self):
+        """
+        Testa o hash da transação.
+        """
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        transaction = Transaction("Alice", "Bob", 10.0, timestamp)
+        same = Transaction("Alice", "Bob", 10.0, timestamp)
+        other = Transaction("Alice", "Bob", 11.0, timestamp)
+        
+        assert len(transaction.calculate_hash()) == 64
+        assert transaction.calculate_hash() == same.calculate_hash()
+        assert transaction.calculate_hash() != other.calculate_hash()
+    
+    def test_transaction_from_dict(self):
+        """
+        Testa a reconstrução de uma transação a partir do dicionário.
+        """
+        transaction = Transaction("Alice", "Bob", 12.5)
+        restored = Transaction.from_dict(transaction.to_dict())
+        
+        assert restored.to_dict() == transaction.to_dict()
+        assert restored.calculate_hash() == transaction.calculate_hash()
+    
+    def test_transaction_bytes_roundtrip(self):
+        """
+        Testa a serialização binária da transação.
+        """
+        for transaction in (Transaction("Alice", "Bob", 12.5),
+                            Transaction(None, "Miner", 10),
+                            Transaction("José", "", 0.00000001, datetime(1969, 12, 31, 23, 59, 59, 5))):
+            data = transaction.to_bytes()
+            restored = Transaction.from_bytes(data)
+            
+            assert restored.to_dict() == transaction.to_dict()
+            assert type(restored.amount) is type(transaction.amount)
+            assert restored.calculate_hash() == transaction.calculate_hash()
+            assert len(data) < len(transaction.to_json())
+    
+    def test_transaction_bytes_rejects_invalid_data(self):
+        """
+        Testa os erros da serialização binária.
+        """
+        with pytest.raises(ValueError):
+            Transaction("Alice", "Bob", 0.123456789).to_bytes()
+        
+        data = Transaction("Alice", "Bob", 1.0).to_bytes()
+        with pytest.raises(ValueError):
+            Transaction.from_bytes(b'\x02' + data[1:])
+        with pytest.raises(ValueError):
+            Transaction.from_bytes(data + b'\x00')
+    
+    def test_transaction_compact_representation(self):
+        """
+        Testa os slots, o timestamp em microssegundos e os endereços internados.
+        """
+        timestamp = datetime(2024, 1, 1, 12, 0, 0, 250)
+        transaction = Transaction(''.join(["Ali", "ce"]), "Bob", 1.0, timestamp)
+        other = Transaction.from_dict({'sender': 'Alice', 'recipient': 'Bob', 'amount': 2.0,
+                                       'timestamp': timestamp.isoformat()})
+        
+        assert not hasattr(transaction, '__dict__')
+        assert isinstance(transaction._timestamp, int)
+        assert transaction.timestamp == timestamp
+        assert transaction.sender is other.sender
+        
+        with pytest.raises(AttributeError):
+            transaction.fee = 1
+    
+    def test_signed_transaction(self):
+        """
+        Testa a assinatura pela carteira do remetente e a rejeição de alterações.
+        """
+        wallet = KeyPair.generate()
+        transaction = Transaction(wallet.address, "Bob", 5.0)
+        unsigned_hash = transaction.calculate_hash()
+        
+        with pytest.raises(ValueError):
+            transaction.sign(KeyPair.generate())
+        assert transaction.verify_signature() == False
+        
+        transaction.sign(wallet)
+        assert transaction.verify_signature() == True
+        assert transaction.calculate_hash() != unsigned_hash
+        
+        transaction.amount = 50.0
+        assert transaction.verify_signature() == False
+    
+    def test_signed_transaction_roundtrip(self):
+        """
+        Testa se a assinatura sobrevive ao dicionário e ao formato binário.
+        """
+        wallet = KeyPair.generate()
+        transaction = Transaction(wallet.address, "Bob", 5)
+        transaction.sign(wallet)
+        
+        for restored in (Transaction.from_dict(transaction.to_dict()),
+                         Transaction.from_bytes(transaction.to_bytes())):
+            assert restored.signature == transaction.signature
+            assert restored.calculate_hash() == transaction.calculate_hash()
+            assert restored.verify_signature() == True
+        
+        assert 'signature' not in Transaction("Alice", "Bob", 5).to_dict()
+        transaction.signature = "abc"
+        with pytest.raises(ValueError):
+            transaction.to_bytes()
+    
+    def test_txid(self):
+        """
+        Testa se o id é o hash da transação e não muda com a serialização.
+        """
+        transaction = Transaction("Alice", "Bob", 5.0)
+        
+        assert transaction.txid == transaction.calculate_hash()
+        assert Transaction.from_dict(transaction.to_dict()).txid == transaction.txid
+        assert Transaction.from_bytes(transaction.to_bytes()).txid == transaction.txid
+        assert Transaction("Alice", "Bob", 5.0, transaction.timestamp).txid == transaction.txid
+        assert Transaction("Alice", "Bob", 6.0, transaction.timestamp).txid != transaction.txid
+    
+    def test_txid_cache_follows_fields(self):
+        """
+        Testa se o txid fica em cache e é recalculado quando um campo do hash muda.
+        """
+        wallet = KeyPair.generate()
+        transaction = Transaction(wallet.address, "Bob", 5.0)
+        original = transaction.txid
+        assert transaction._txid == original
+        
+        transaction.amount = 6.0
+        assert transaction._txid is None
+        assert transaction.txid == transaction.calculate_hash() != original
+        
+        transaction.timestamp = datetime(2024, 1, 1)
+        assert transaction.txid == transaction.calculate_hash()
+        transaction.sign(wallet)
+        assert transaction.txid == transaction.calculate_hash()
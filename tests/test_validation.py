@@ -0,0 +1,183 @@
+"""
+Testes para a validação semântica da blockchain.
+"""
+import pytest
+from src.block import Block
+from src.blockchain import Blockchain
+from src.signatures import KeyPair
+from src.transaction import Transaction
+from src.validation import RULE_AMOUNT, RULE_BALANCE, RULE_BLOCK, RULE_DUPLICATE, RULE_REWARD, RULE_SIGNATURE
+
+
+def _funded_chain():
+    """
+    Cria uma blockchain em que Miner1 recebe duas recompensas e envia 15 para Alice.
+    """
+    blockchain = Blockchain()
+    blockchain.mine_pending_transactions("Miner1")
+    blockchain.mine_pending_transactions("Miner1")
+    blockchain.add_transaction(Transaction("Miner1", "Alice", 15))
+    blockchain.mine_pending_transactions("Miner2")
+    return blockchain
+
+
+def _append_mined(blockchain, transactions):
+    """
+    Minera um bloco com as transações informadas e o adiciona diretamente à chain.
+    """
+    height = len(blockchain.chain)
+    difficulty = blockchain.get_difficulty_for_height(height)
+    block = Block(height, transactions, blockchain.get_latest_block().hash, difficulty=difficulty)
+    block.mine_block(difficulty)
+    blockchain.chain.append(block)
+    return block
+
+
+class TestValidateSemantics:
+    """
+    Classe de testes para Blockchain.validate_semantics.
+    """
+    
+    def test_valid_chain(self):
+        """
+        Testa uma chain que respeita todas as regras.
+        """
+        report = _funded_chain().validate_semantics()
+        
+        assert report.is_valid == True
+        assert report.rule is None
+        assert report.blocks_checked == 4
+        assert report.transactions_checked == 5
+    
+    def test_negative_balance(self):
+        """
+        Testa se gastar mais do que o saldo é a violação informada.
+        """
+        blockchain = _funded_chain()
+        blockchain.add_transaction(Transaction("Alice", "Bob", 10))
+        blockchain.add_transaction(Transaction("Alice", "Bob", 10))
+        blockchain.mine_pending_transactions("Miner1")
+        
+        report = blockchain.validate_semantics()
+        assert report.is_valid == False
+        assert report.to_dict() == {
+            'is_valid': False,
+            'rule': RULE_BALANCE,
+            'height': 4,
+            'position': 1,
+            'address': 'Alice',
+            'balance': -5,
+            'message': "Bloco 4, transação 1: saldo de Alice ficaria -5",
+            'blocks_checked': 4,
+            'transactions_checked': 5
+        }
+    
+    @pytest.mark.parametrize("amount", [-5, 0])
+    def test_non_positive_amount(self, amount):
+        """
+        Testa se uma transferência sem valor positivo é informada, mesmo sem saldo negativo.
+        """
+        blockchain = _funded_chain()
+        _append_mined(blockchain, [Transaction("Zoe", "Alice", amount), Transaction(None, "Miner1", 10)])
+        
+        report = blockchain.validate_semantics()
+        assert report.rule == RULE_AMOUNT
+        assert report.height == 4
+        assert report.position == 0
+        assert report.address == "Zoe"
+        assert report.message == f"Bloco 4, transação 0: valor {amount} não é positivo"
+    
+    def test_small_float_errors_are_not_negative(self):
+        """
+        Testa se erros de arredondamento de float não contam como saldo negativo.
+        """
+        blockchain = Blockchain()
+        blockchain.mining_reward = 0.3
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.add_transaction(Transaction("Miner1", "Alice", 0.1))
+        blockchain.add_transaction(Transaction("Miner1", "Alice", 0.2))
+        blockchain.mine_pending_transactions("Miner2")
+        
+        assert blockchain.validate_semantics().is_valid == True
+    
+    @pytest.mark.parametrize("rewards, message", [
+        ([10, 10], "Bloco 2 tem mais de uma recompensa"),
+        ([50], "Bloco 2 tem recompensa 50, esperado 10"),
+        ([], "Bloco 2 não tem recompensa"),
+    ])
+    def test_reward_rules(self, rewards, message):
+        """
+        Testa as regras de recompensa: exatamente uma, com o valor de mining_reward.
+        """
+        blockchain = Blockchain()
+        blockchain.mine_pending_transactions("Miner1")
+        _append_mined(blockchain, [Transaction("Miner1", "Alice", 1)] +
+                      [Transaction(None, "Miner1", amount) for amount in rewards])
+        
+        assert blockchain.is_chain_valid() == True
+        report = blockchain.validate_semantics()
+        assert report.rule == RULE_REWARD
+        assert report.height == 2
+        assert report.message == message
+    
+    def test_block_rules(self):
+        """
+        Testa se um bloco adulterado é informado antes das regras de transações.
+        """
+        blockchain = _funded_chain()
+        blockchain.chain[3].transactions[0].amount = 1000
+        
+        report = blockchain.validate_semantics()
+        assert report.rule == RULE_BLOCK
+        assert report.height == 3
+        assert report.message == "Bloco 3 é inválido!"
+        assert report.blocks_checked == 3
+    
+    def test_pruned_chain(self):
+        """
+        Testa se a validação parte do snapshot de saldos em uma chain podada.
+        """
+        blockchain = Blockchain(prune_depth=1)
+        blockchain.mine_pending_transactions("Miner1")
+        blockchain.mine_pending_transactions("Miner2")
+        blockchain.add_transaction(Transaction("Miner1", "Alice", 10))
+        blockchain.mine_pending_transactions("Miner2")
+        
+        report = blockchain.validate_semantics()
+        assert report.is_valid == True
+        assert report.transactions_checked == 2
+    
+    def test_invalid_signature(self):
+        """
+        Testa se, com require_signatures, uma transação sem assinatura válida é a violação informada.
+        """
+        wallet = KeyPair.generate()
+        blockchain = Blockchain(require_signatures=True)
+        blockchain.mine_pending_transactions(wallet.address)
+        transaction = Transaction(wallet.address, "Alice", 3)
+        transaction.sign(wallet)
+        blockchain.add_transaction(transaction)
+        blockchain.mine_pending_transactions("Miner1")
+        assert blockchain.validate_semantics().is_valid == True
+        
+        _append_mined(blockchain, [Transaction(wallet.address, "Bob", 1), Transaction(None, "Miner1", 10)])
+        report = blockchain.validate_semantics()
+        assert report.rule == RULE_SIGNATURE
+        assert report.height == 3
+        assert report.position == 0
+        assert report.address == wallet.address
+        assert report.message == "Bloco 3, transação 0: assinatura ausente ou malformada"
+    
+    def test_duplicate_transaction(self):
+        """
+        Testa se uma transação repetida em outro bloco é a violação informada.
+        """
+        blockchain = _funded_chain()
+        replay = Transaction.from_dict(blockchain.chain[3].transactions[0].to_dict())
+        _append_mined(blockchain, [replay, Transaction(None, "Miner1", 10)])
+        
+        report = blockchain.validate_semantics()
+        assert report.rule == RULE_DUPLICATE
+        assert report.height == 4
+        assert report.position == 0
+        assert report.message == f"Bloco 4, transação 0: transação repetida ({replay.txid})"